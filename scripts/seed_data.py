@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+SynQcore - Dataset Corporativo Sintético
+========================================
+
+Gerador determinístico usado por `synqcore.py seed --scale N`:
+- Departamentos, funcionários (com hierarquia) e lotações
+- Categorias de conhecimento e tags
+- Posts do feed, tags dos posts e threads de discussão (Comments)
+- Endorsements em posts e comentários
+- Metadados de mídia (MediaAssets)
+
+Mesma escala e semente geram sempre as mesmas linhas. Os IDs são derivados
+do índice de cada linha (prefixo 5eed), então relacionamentos são calculados
+sem manter listas de milhões de UUIDs em memória.
+"""
+
+import random
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List
+
+# Volume por unidade de escala (scale=1 -> ~110 mil linhas; scale=100 -> 2M posts)
+EMPLOYEES_PER_SCALE = 1000
+POSTS_PER_EMPLOYEE = 20
+COMMENTS_PER_POST = 3.0
+ENDORSEMENTS_PER_POST = 1.5
+TAGS_PER_POST = 2
+MEDIA_PER_EMPLOYEE = 5
+
+# Datas fixas: o dataset não muda conforme o dia em que é gerado
+DATASET_END = datetime(2025, 10, 1, tzinfo=timezone.utc)
+DATASET_SPAN = timedelta(days=730)
+
+TABLE_CODES = {
+    'Departments': 0x01, 'Employees': 0x02, 'EmployeeDepartments': 0x03, 'KnowledgeCategories': 0x04,
+    'Tags': 0x05, 'Posts': 0x06, 'PostTags': 0x07, 'Comments': 0x08, 'Endorsements': 0x09,
+    'MediaAssets': 0x0a,
+}
+
+FIRST_NAMES = ['Ana', 'Bruno', 'Carla', 'Diego', 'Eduarda', 'Felipe', 'Gabriela', 'Henrique', 'Isabela',
+               'João', 'Karina', 'Lucas', 'Mariana', 'Nicolas', 'Olívia', 'Pedro', 'Rafaela', 'Samuel',
+               'Tatiane', 'Vinícius', 'Yasmin', 'André', 'Beatriz', 'Caio', 'Débora', 'Fernanda']
+LAST_NAMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira', 'Lima',
+              'Gomes', 'Costa', 'Ribeiro', 'Martins', 'Carvalho', 'Almeida', 'Lopes', 'Soares', 'Vieira']
+DEPARTMENTS = ['Engenharia', 'Produto', 'Recursos Humanos', 'Financeiro', 'Jurídico', 'Marketing', 'Vendas',
+               'Atendimento', 'Operações', 'Segurança da Informação', 'Dados e Analytics', 'Infraestrutura',
+               'Compras', 'Comunicação Interna', 'Qualidade', 'Pesquisa', 'Design', 'Compliance',
+               'Relações com Investidores', 'Facilities']
+POSITIONS = ['Analista', 'Analista Sênior', 'Especialista', 'Coordenador', 'Gerente', 'Diretor',
+             'Desenvolvedor', 'Desenvolvedor Sênior', 'Arquiteto', 'Estagiário', 'Consultor']
+CATEGORIES = ['Arquitetura', 'Processos', 'Políticas', 'Onboarding', 'Boas Práticas', 'Ferramentas',
+              'Segurança', 'Dados', 'Carreira', 'Benefícios', 'Projetos', 'Comunicados']
+TAG_WORDS = ['dotnet', 'blazor', 'postgres', 'redis', 'docker', 'kubernetes', 'lgpd', 'okr', 'agile',
+             'scrum', 'devops', 'observabilidade', 'performance', 'seguranca', 'ux', 'dados', 'ml', 'cloud',
+             'api', 'testes', 'carreira', 'lideranca', 'inovacao', 'compliance', 'financas', 'vendas']
+TOPICS = ['a migração do sistema de pagamentos', 'o novo processo de onboarding', 'a política de trabalho híbrido',
+          'os resultados do trimestre', 'a adoção de Blazor no portal interno', 'a revisão dos OKRs',
+          'o incidente de ontem no cache', 'as boas práticas de code review', 'o plano de capacitação',
+          'a atualização da LGPD', 'o roadmap do produto', 'a automação dos relatórios financeiros']
+SENTENCES = ['Compartilho aqui os principais aprendizados sobre {topic}.',
+             'Precisamos alinhar os próximos passos sobre {topic} até sexta-feira.',
+             'Alguém já avaliou o impacto de {topic} nas outras equipes?',
+             'Documentei o passo a passo de {topic} na base de conhecimento.',
+             'Os números mostram uma melhora consistente desde {topic}.',
+             'Fica o agradecimento a todos que contribuíram com {topic}.',
+             'Proponho uma sessão de perguntas e respostas sobre {topic}.',
+             'Os detalhes técnicos de {topic} estão no documento anexo.']
+REPLIES = ['Concordo, faz sentido para o nosso time.', 'Excelente ponto! Podemos detalhar na próxima reunião?',
+           'Tenho uma dúvida sobre o prazo.', 'Já aplicamos isso no meu departamento com bons resultados.',
+           'Sugiro incluir o time de segurança nessa discussão.', 'Obrigado por compartilhar!']
+MEDIA_TYPES = [  # (MediaAssetType, extensão, content type)
+    (1, 'png', 'image/png'), (1, 'jpg', 'image/jpeg'), (2, 'mp4', 'video/mp4'), (3, 'mp3', 'audio/mpeg'),
+    (6, 'png', 'image/png'), (8, 'png', 'image/png'), (9, 'svg', 'image/svg+xml'), (10, 'pdf', 'application/pdf'),
+]
+
+
+@dataclass
+class SeedTable:
+    """Tabela do dataset: destino no banco, volume previsto e gerador de linhas"""
+    schema: str
+    name: str
+    estimated_rows: int
+    rows: Callable[[], Iterator[Dict]]
+
+
+SEED_ID_PREFIX = '5eed'
+
+
+def seed_uuid(table: str, seed: int, index: int) -> str:
+    """UUID determinístico: prefixo 5eed + tabela + semente, índice da linha no final"""
+    return (f"{SEED_ID_PREFIX}{TABLE_CODES[table]:02x}{seed & 0xff:02x}-{(seed >> 8) & 0xffff:04x}-4000-8000-"
+            f"{index:012x}")
+
+
+def ascii_slug(text: str) -> str:
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode().lower()
+
+
+def timestamp(moment: datetime) -> str:
+    return moment.strftime('%Y-%m-%d %H:%M:%S+00')
+
+
+class SyntheticDataset:
+    """Dataset corporativo determinístico para uma escala e semente"""
+
+    def __init__(self, scale: float = 1.0, seed: int = 42):
+        self.scale = scale
+        self.seed = seed
+        self.employees = max(int(EMPLOYEES_PER_SCALE * scale), 10)
+        # Estruturas organizacionais crescem mais devagar que o quadro de funcionários
+        self.departments = max(int(len(DEPARTMENTS) * scale ** 0.5), 5)
+        self.tags = max(int(200 * scale ** 0.5), len(TAG_WORDS))
+        self.categories = len(CATEGORIES)
+        self.posts = self.employees * POSTS_PER_EMPLOYEE
+        self.media = self.employees * MEDIA_PER_EMPLOYEE
+        self.tag_names: List[str] = []
+        self.category_names: List[str] = []
+        self.comments = 0  # Conhecido após gerar Comments; usado pelos Endorsements
+
+    def rng(self, table: str) -> random.Random:
+        """Gerador próprio por tabela: a ordem de carga não altera o conteúdo"""
+        return random.Random(f"{self.seed}:{table}")
+
+    def uuid(self, table: str, index: int) -> str:
+        return seed_uuid(table, self.seed, index)
+
+    # Relacionamentos calculados a partir do índice (sem estado)
+    def author_of(self, post: int) -> int:
+        """Autor do post com distribuição concentrada: poucos funcionários publicam muito"""
+        mixed = (post * 2654435761 + self.seed) & 0xffffffff
+        return int(self.employees * (mixed / 2 ** 32) ** 2)
+
+    def department_of(self, employee: int) -> int:
+        return employee % self.departments
+
+    def post_time(self, post: int) -> datetime:
+        return DATASET_END - DATASET_SPAN + DATASET_SPAN * (post / self.posts)
+
+    def name_of(self, employee: int):
+        return (FIRST_NAMES[employee % len(FIRST_NAMES)],
+                LAST_NAMES[(employee // len(FIRST_NAMES)) % len(LAST_NAMES)])
+
+    def unique_names(self, base: List[str], count: int, taken: set) -> List[str]:
+        """Nomes únicos, evitando os que já existem no banco (índices únicos em Name)"""
+        names, suffix = [], 1
+        while len(names) < count:
+            for word in base:
+                candidate = word if suffix == 1 else f"{word}-{suffix}"
+                if candidate.lower() not in taken:
+                    taken.add(candidate.lower())
+                    names.append(candidate)
+                    if len(names) == count:
+                        break
+            suffix += 1
+        return names
+
+    def prepare(self, existing_tags: set, existing_categories: set):
+        self.tag_names = self.unique_names(TAG_WORDS, self.tags, {n.lower() for n in existing_tags})
+        self.category_names = self.unique_names(CATEGORIES, self.categories,
+                                                {n.lower() for n in existing_categories})
+
+    def tables(self) -> List[SeedTable]:
+        """Tabelas na ordem de carga (respeitando as chaves estrangeiras)"""
+        return [
+            SeedTable('public', 'Departments', self.departments, self.department_rows),
+            SeedTable('public', 'Employees', self.employees, self.employee_rows),
+            SeedTable('public', 'EmployeeDepartments', self.employees, self.employee_department_rows),
+            SeedTable('Communication', 'KnowledgeCategories', self.categories, self.category_rows),
+            SeedTable('Communication', 'Tags', self.tags, self.tag_rows),
+            SeedTable('Communication', 'Posts', self.posts, self.post_rows),
+            SeedTable('Communication', 'PostTags', self.posts * TAGS_PER_POST, self.post_tag_rows),
+            SeedTable('Communication', 'Comments', int(self.posts * COMMENTS_PER_POST), self.comment_rows),
+            SeedTable('Communication', 'Endorsements', int(self.posts * ENDORSEMENTS_PER_POST), self.endorsement_rows),
+            SeedTable('public', 'MediaAssets', self.media, self.media_rows),
+        ]
+
+    def audit(self, created: datetime) -> Dict:
+        return {'CreatedAt': timestamp(created), 'UpdatedAt': timestamp(created), 'IsDeleted': False}
+
+    def department_rows(self) -> Iterator[Dict]:
+        rng = self.rng('Departments')
+        roots = min(5, self.departments)
+        names = self.unique_names(DEPARTMENTS, self.departments, set())
+        for d in range(self.departments):
+            created = DATASET_END - DATASET_SPAN - timedelta(days=rng.randint(30, 3650))
+            yield {
+                'Id': self.uuid('Departments', d), 'Code': f"S{self.seed % 1000:03d}-D{d:04d}", 'Name': names[d],
+                'Description': f"Departamento de {names[d]}", 'EstablishedDate': timestamp(created),
+                'IsActive': True, 'ParentDepartmentId': self.uuid('Departments', d % roots) if d >= roots else None,
+                **self.audit(created),
+            }
+
+    def employee_rows(self) -> Iterator[Dict]:
+        rng = self.rng('Employees')
+        for e in range(self.employees):
+            first, last = self.name_of(e)
+            hired = DATASET_END - timedelta(days=rng.randint(1, 3650))
+            # Quem tem subordinados diretos ocupa cargo de gestão
+            if e == 0:
+                position = 'Diretor'
+            elif e * 8 + 1 < self.employees:
+                position = rng.choice(['Coordenador', 'Gerente'])
+            else:
+                position = rng.choice(POSITIONS[:3] + POSITIONS[6:])
+            yield {
+                'Id': self.uuid('Employees', e), 'EmployeeId': f"S{self.seed % 1000:03d}-{e:07d}",
+                'FirstName': first, 'LastName': last,
+                'Email': ascii_slug(f"{first}.{last}.{e}") + "@seed.synqcore.com",
+                'JobTitle': f"{position} de {DEPARTMENTS[self.department_of(e) % len(DEPARTMENTS)]}",
+                'Position': position, 'HireDate': timestamp(hired), 'IsActive': rng.random() > 0.03,
+                'Phone': f"+55 11 9{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+                'Bio': f"{first} trabalha com {rng.choice(TOPICS)}." if rng.random() < 0.4 else None,
+                # Hierarquia em árvore: cada gestor tem até 8 subordinados diretos
+                'ManagerId': self.uuid('Employees', (e - 1) // 8) if e else None,
+                **self.audit(hired),
+            }
+
+    def employee_department_rows(self) -> Iterator[Dict]:
+        for e in range(self.employees):
+            started = DATASET_END - DATASET_SPAN
+            yield {
+                'Id': self.uuid('EmployeeDepartments', e), 'EmployeeId': self.uuid('Employees', e),
+                'DepartmentId': self.uuid('Departments', self.department_of(e)), 'IsPrimary': True,
+                'IsActive': True, 'StartDate': timestamp(started), 'RoleInDepartment': 'Membro',
+                **self.audit(started),
+            }
+
+    def category_rows(self) -> Iterator[Dict]:
+        for c, name in enumerate(self.category_names):
+            yield {
+                'Id': self.uuid('KnowledgeCategories', c), 'Name': name,
+                'Description': f"Conteúdos sobre {name.lower()}", 'Color': '#007ACC', 'Icon': '📄',
+                'IsActive': True, **self.audit(DATASET_END - DATASET_SPAN),
+            }
+
+    def tag_rows(self) -> Iterator[Dict]:
+        rng = self.rng('Tags')
+        for t, name in enumerate(self.tag_names):
+            yield {
+                'Id': self.uuid('Tags', t), 'Name': name, 'Type': rng.randint(0, 5),
+                'Color': f"#{rng.randint(0, 0xffffff):06X}", 'Description': f"Tag {name}",
+                **self.audit(DATASET_END - DATASET_SPAN),
+            }
+
+    def post_rows(self) -> Iterator[Dict]:
+        rng = self.rng('Posts')
+        for p in range(self.posts):
+            author = self.author_of(p)
+            created = self.post_time(p)
+            topic = rng.choice(TOPICS)
+            paragraphs = [' '.join(rng.choice(SENTENCES).format(topic=rng.choice(TOPICS))
+                                   for _ in range(rng.randint(2, 6))) for _ in range(rng.randint(1, 4))]
+            content = '\n\n'.join([SENTENCES[0].format(topic=topic)] + paragraphs)
+            yield {
+                'Id': self.uuid('Posts', p), 'AuthorId': self.uuid('Employees', author),
+                'Title': f"Sobre {topic}"[:500], 'Content': content, 'Summary': content[:200],
+                'CategoryId': self.uuid('KnowledgeCategories', rng.randrange(self.categories))
+                if rng.random() < 0.7 else None,
+                'DepartmentId': self.uuid('Departments', self.department_of(author)),
+                'Type': rng.choices(range(7), weights=[70, 10, 8, 2, 3, 4, 3])[0],
+                'Status': 2 if rng.random() < 0.95 else rng.choice([0, 1, 3]),
+                'Visibility': rng.choices([0, 1, 2, 3], weights=[60, 15, 5, 20])[0],
+                'IsOfficial': rng.random() < 0.02, 'IsPinned': rng.random() < 0.005, 'RequiresApproval': False,
+                'ViewCount': int(rng.paretovariate(1.2) * 10), 'LikeCount': 0, 'CommentCount': 0,
+                'Version': '1.0', 'LastActivityAt': timestamp(created), **self.audit(created),
+            }
+
+    def post_tag_rows(self) -> Iterator[Dict]:
+        rng = self.rng('PostTags')
+        row = 0
+        for p in range(self.posts):
+            created = self.post_time(p)
+            for tag in rng.sample(range(self.tags), rng.randint(0, TAGS_PER_POST * 2)):
+                yield {
+                    'Id': self.uuid('PostTags', row), 'PostId': self.uuid('Posts', p), 'TagId': self.uuid('Tags', tag),
+                    'AddedById': self.uuid('Employees', self.author_of(p)), 'AddedAt': timestamp(created),
+                    **self.audit(created),
+                }
+                row += 1
+
+    def comment_rows(self) -> Iterator[Dict]:
+        """Threads por post: comentários raiz ("0") e respostas com caminho "pai.n" (DiscussionThreadHelper)"""
+        rng = self.rng('Comments')
+        row = 0
+        for p in range(self.posts):
+            count = min(int(rng.expovariate(1 / COMMENTS_PER_POST)), 50)
+            created = self.post_time(p)
+            thread = []  # (id, nível, caminho, respostas)
+            for _ in range(count):
+                created += timedelta(minutes=rng.randint(1, 600))
+                comment_id = self.uuid('Comments', row)
+                if thread and rng.random() < 0.4:
+                    parent = rng.randrange(len(thread))
+                    parent_id, level, path, replies = thread[parent]
+                    thread[parent] = (parent_id, level, path, replies + 1)
+                    level, path = level + 1, f"{path}.{replies + 1}"
+                else:
+                    parent_id, level, path = None, 0, "0"
+                thread.append((comment_id, level, path, 0))
+                yield {
+                    'Id': comment_id, 'PostId': self.uuid('Posts', p), 'ParentCommentId': parent_id,
+                    'AuthorId': self.uuid('Employees', rng.randrange(self.employees)),
+                    'Content': rng.choice(REPLIES), 'ThreadLevel': level, 'ThreadPath': path,
+                    'Type': rng.choice(['Regular', 'Regular', 'Regular', 'Question', 'Answer', 'Suggestion']),
+                    'Visibility': 'Public', 'Priority': 'Normal', 'ModerationStatus': 'Approved',
+                    'IsConfidential': False, 'IsEdited': False, 'IsFlagged': False, 'IsHighlighted': False,
+                    'IsResolved': False, 'LikeCount': 0, 'ReplyCount': 0, 'EndorsementCount': 0,
+                    'LastActivityAt': timestamp(created), **self.audit(created),
+                }
+                row += 1
+        self.comments = row
+
+    def endorsement_rows(self) -> Iterator[Dict]:
+        """Endorsements em posts e comentários, sem repetir o par (conteúdo, funcionário)"""
+        rng = self.rng('Endorsements')
+        comments = self.comments
+        row = 0
+        for p in range(self.posts):
+            count = min(int(rng.expovariate(1 / ENDORSEMENTS_PER_POST)), self.employees)
+            on_post = self.uuid('Posts', p)
+            endorsed = self.post_time(p)
+            for endorser in rng.sample(range(self.employees), count):
+                # Um em cada cinco vai para um comentário (CK_Endorsement_ContentType); cada comentário
+                # recebe no máximo um, o que respeita o índice único (CommentId, EndorserId)
+                target_comment = row < comments and rng.random() < 0.2
+                endorsed += timedelta(minutes=rng.randint(5, 900))
+                yield {
+                    'Id': self.uuid('Endorsements', row),
+                    'PostId': None if target_comment else on_post,
+                    'CommentId': self.uuid('Comments', row) if target_comment else None,
+                    'EndorserId': self.uuid('Employees', endorser), 'Type': rng.randint(0, 7),
+                    'IsPublic': True, 'EndorsedAt': timestamp(endorsed),
+                    'Note': rng.choice(REPLIES) if rng.random() < 0.3 else None, **self.audit(endorsed),
+                }
+                row += 1
+
+    def media_rows(self) -> Iterator[Dict]:
+        rng = self.rng('MediaAssets')
+        for m in range(self.media):
+            media_type, extension, content_type = rng.choice(MEDIA_TYPES)
+            uploaded = DATASET_END - DATASET_SPAN * rng.random()
+            owner = rng.randrange(self.employees)
+            file_name = f"documento-{m:07d}.{extension}"
+            yield {
+                'Id': self.uuid('MediaAssets', m), 'Name': f"Documento {m}", 'OriginalFileName': file_name,
+                'StorageFileName': f"seed/{self.uuid('MediaAssets', m)}.{extension}",
+                'StorageUrl': f"/media/seed/{self.uuid('MediaAssets', m)}.{extension}",
+                'ContentType': content_type, 'FileSizeBytes': int(rng.lognormvariate(12, 1.5)),
+                'Type': media_type, 'Category': rng.randint(1, 6), 'AccessLevel': 2,
+                'Width': 1920 if media_type in (1, 6, 8) else None, 'Height': 1080 if media_type in (1, 6, 8) else None,
+                'DurationSeconds': rng.randint(30, 3600) if media_type in (2, 3) else None,
+                'UploadedByEmployeeId': self.uuid('Employees', owner), 'IsApproved': rng.random() < 0.8,
+                'DownloadCount': int(rng.paretovariate(1.5)), 'Tags': ','.join(rng.sample(TAG_WORDS, 2)),
+                'Metadata': '{"seed": true}', **self.audit(uploaded),
+            }
+
+
+# Contadores desnormalizados recalculados após a carga (apenas para linhas do dataset)
+COUNTER_UPDATES = [
+    ('Posts.CommentCount',
+     'UPDATE "Communication"."Posts" p SET "CommentCount" = c.n FROM (SELECT "PostId", count(*) n '
+     'FROM "Communication"."Comments" WHERE "Id"::text LIKE \'{prefix}%\' GROUP BY "PostId") c WHERE p."Id" = c."PostId"'),
+    ('Comments.ReplyCount',
+     'UPDATE "Communication"."Comments" p SET "ReplyCount" = c.n FROM (SELECT "ParentCommentId", count(*) n '
+     'FROM "Communication"."Comments" WHERE "ParentCommentId" IS NOT NULL AND "Id"::text LIKE \'{prefix}%\' '
+     'GROUP BY "ParentCommentId") c WHERE p."Id" = c."ParentCommentId"'),
+    ('Comments.EndorsementCount',
+     'UPDATE "Communication"."Comments" p SET "EndorsementCount" = c.n FROM (SELECT "CommentId", count(*) n '
+     'FROM "Communication"."Endorsements" WHERE "CommentId" IS NOT NULL AND "Id"::text LIKE \'{prefix}%\' '
+     'GROUP BY "CommentId") c WHERE p."Id" = c."CommentId"'),
+    ('Tags.UsageCount',
+     'UPDATE "Communication"."Tags" t SET "UsageCount" = c.n FROM (SELECT "TagId", count(*) n '
+     'FROM "Communication"."PostTags" WHERE "Id"::text LIKE \'{prefix}%\' GROUP BY "TagId") c WHERE t."Id" = c."TagId"'),
+    ('Departments.ManagerId',
+     'UPDATE "Departments" d SET "ManagerId" = ed."EmployeeId" FROM (SELECT DISTINCT ON ("DepartmentId") '
+     '"DepartmentId", "EmployeeId" FROM "EmployeeDepartments" WHERE "Id"::text LIKE \'{prefix}%\' '
+     'ORDER BY "DepartmentId", "EmployeeId") ed WHERE d."Id" = ed."DepartmentId"'),
+]
@@ -16,11 +16,22 @@ Data: 13 de outubro de 2025
 """
 
 import os
+import re
 import sys
+import hashlib
+import math
 import subprocess
 import time
 import json
+import csv
+import logging
+import logging.handlers
+import queue
+import threading
 import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 # Verificar e instalar dependências Python se necessário
 def check_and_install_dependencies():
@@ -66,6 +77,8 @@ from enum import Enum
 import argparse
 import signal
 
+import seed_data
+
 # Configuração de cores para terminal
 class Colors:
     HEADER = '\033[95m'
@@ -78,6 +91,98 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Entradas do build incremental: fontes por projeto e arquivos globais do MSBuild
+BUILD_SOURCE_EXTENSIONS = ('.cs', '.razor', '.cshtml')
+BUILD_GLOBAL_FILES = ('Directory.Build.props', 'Directory.Build.targets', 'Directory.Packages.props', 'global.json')
+BUILD_IGNORED_DIRS = {'bin', 'obj', 'node_modules', 'TestResults'}
+
+# Containers da infraestrutura (serviço do compose -> nome do container)
+DOCKER_CONTAINERS = {
+    'PostgreSQL': 'synqcore-postgres',
+    'Redis': 'synqcore-redis',
+    'pgAdmin': 'synqcore-pgadmin',
+    'API': 'synqcore-api',
+}
+
+# Limpeza: diretórios e arquivos removidos e árvores onde a varredura nunca entra
+CLEAN_DIR_NAMES = {'bin', 'obj', 'logs'}
+CLEAN_FILE_SUFFIXES = ('.log', '.tmp')
+CLEAN_PRUNED_DIRS = {'.git', '.synqcore', '.vs', '.idea', 'node_modules', '.venv', 'venv', '__pycache__'}
+
+# Cache dos pré-requisitos (dotnet, docker, compose): só resultados positivos, por poucos segundos
+try:
+    PREREQUISITES_CACHE_TTL = int(os.environ.get("SYNQCORE_PROBE_TTL", "60") or 60)
+except ValueError:
+    print(f"{Colors.WARNING}⚠️  SYNQCORE_PROBE_TTL inválido ({os.environ['SYNQCORE_PROBE_TTL']!r}); "
+          f"usando 60s{Colors.ENDC}")
+    PREREQUISITES_CACHE_TTL = 60
+PREREQUISITE_PROBES = {
+    'dotnet': (["dotnet", "--version"], 10),
+    'docker': (["docker", "version", "--format", "{{.Client.Version}}|{{.Server.Version}}"], 15),
+    'compose_plugin': (["docker", "compose", "version", "--short"], 10),
+    'compose_standalone': (["docker-compose", "--version"], 10),
+}
+
+# Banco local (docker-compose.yml) e migrações do EF Core
+POSTGRES_DATABASE = 'synqcore_db'
+POSTGRES_USER = 'postgres'
+SNAPSHOT_PREFIX = 'synqcore_snap_'
+CLONE_TEMP_DATABASE = 'synqcore_clone_tmp'  # Cópia em andamento: só substitui o destino depois de concluída
+SNAPSHOT_NAME_PATTERN = re.compile(r'^[a-z0-9_]{1,40}$')
+MIGRATION_ID_PATTERN = re.compile(r'\[Migration\("([^"]+)"\)\]')
+
+# Linha do Kestrel que indica que o servidor já aceita conexões
+READY_LOG_MARKER = "Now listening on"
+
+# Captura de logs dos processos: linhas recentes em memória e arquivos rotativos em .synqcore/logs
+LOG_BUFFER_LINES = 2000
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+LOG_FILES_ENABLED = os.environ.get("SYNQCORE_LOG_FILES", "1") != "0"
+
+# Painel ao vivo do monitoramento (SYNQCORE_DASHBOARD=0 volta ao monitoramento silencioso)
+DASHBOARD_ENABLED = os.environ.get("SYNQCORE_DASHBOARD", "1") != "0"
+DASHBOARD_REFRESH = 1.0         # Segundos entre redesenhos
+DASHBOARD_HEALTH_INTERVAL = 1.0  # Sonda de /health
+DASHBOARD_DB_INTERVAL = 5.0      # Conexões do PostgreSQL e ops/s do Redis
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+# Aquecimento da API: GETs representativos repetidos até a latência estabilizar
+# ({department} é resolvido com o primeiro item de /api/Departments)
+WARMUP_ENDPOINTS = [e.strip() for e in os.environ.get(
+    "SYNQCORE_WARMUP_ENDPOINTS",
+    "/api/Feed,/api/CorporateSearch?Query=synqcore,/api/Departments/{department}/hierarchy,"
+    "/api/Tags/popular,/api/Employees,/api/KnowledgePosts"
+).split(",") if e.strip()]
+WARMUP_CONCURRENCY = 4      # Requisições simultâneas por endpoint em cada rodada
+WARMUP_MAX_ROUNDS = 12
+WARMUP_TOLERANCE = 0.15     # Variação máxima da mediana entre rodadas para considerar estável
+WARMUP_JITTER_MS = 5.0      # Abaixo disso a variação é ruído de medição
+
+# Perfis de produção: (CPUs, memória em MB) por serviço, espelhando os pods de cada tamanho
+PRODUCTION_PROFILES = {
+    'small': {'api': (1.0, 512), 'postgres': (1.0, 1024), 'redis': (0.5, 256), 'max_connections': 100},
+    'medium': {'api': (2.0, 1024), 'postgres': (2.0, 4096), 'redis': (1.0, 512), 'max_connections': 200},
+    'large': {'api': (4.0, 2048), 'postgres': (4.0, 8192), 'redis': (1.0, 1024), 'max_connections': 300},
+}
+
+# Latência e falhas de rede: Toxiproxy entre a API e PostgreSQL/Redis (docker-compose.faults.yml)
+FAULTS_COMPOSE_FILE = "docker-compose.faults.yml"
+TOXIPROXY_URL = "http://localhost:8474"
+FAULT_PROXIES = {'postgres': 'synqcore_postgres', 'redis': 'synqcore_redis'}
+FAULT_BENCHMARK_LATENCIES = "0,1,2,5,10"  # Atraso por ida e volta (ms) em cada salto
+FAULT_BENCHMARK_REQUESTS = 15             # Requisições sequenciais por endpoint e atraso
+
+# Modo escalado: réplicas da API atrás do nginx de docker-compose.scale.yml
+SCALE_COMPOSE_FILE = "docker-compose.scale.yml"
+SCALE_LB_CONTAINER = "synqcore-api-lb"
+SCALE_BENCHMARK_DURATION = 20.0   # Segundos medidos por número de réplicas
+SCALE_BENCHMARK_CONCURRENCY = 32  # Clientes simultâneos (laço fechado)
+
+# Build paralelo: histórico de durações e linhas do "Project Performance Summary" do MSBuild
+BUILD_HISTORY_LIMIT = 50
+PROJECT_SUMMARY_LINE = re.compile(r'^\s*(\d+) ms\s+(.+?\.csproj)\s+(\d+) calls?\s*$')
+
 class ServiceType(Enum):
     DOCKER = "docker"
     API = "api"
@@ -90,8 +195,214 @@ class ServiceConfig:
     port: int
     url: str
     health_endpoint: str
+    ready_endpoint: str = "/"
+    container: Optional[str] = None
     process: Optional[subprocess.Popen] = None
 
+class LogMultiplexer:
+    """
+    Drena a saída dos processos filhos em threads, sem nunca bloqueá-los.
+
+    Cada fonte tem um buffer circular com as últimas linhas (diagnóstico) e,
+    opcionalmente, um arquivo rotativo. Fontes com eco aparecem no terminal em
+    um fluxo combinado, com prefixo colorido por fonte.
+    """
+    
+    PALETTE = [Colors.CYAN, Colors.BLUE, Colors.HEADER, Colors.GREEN, Colors.WARNING]
+    
+    def __init__(self, log_dir: Optional[Path] = None, buffer_lines: int = LOG_BUFFER_LINES):
+        self.log_dir = log_dir
+        self.buffer_lines = buffer_lines
+        self.buffers: Dict[str, deque] = {}
+        self.files: Dict[str, logging.Logger] = {}
+        self.colors: Dict[str, str] = {}
+        self.threads: Dict[str, threading.Thread] = {}
+        self.echo_paused = False  # O painel ao vivo ocupa o terminal; as linhas seguem nos buffers
+        self._print_lock = threading.Lock()
+    
+    def _file_logger(self, source: str) -> Optional[logging.Logger]:
+        if self.log_dir is None:
+            return None
+        if source not in self.files:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            logger = logging.getLogger(f"synqcore.process.{source}")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            if not logger.handlers:
+                handler = logging.handlers.RotatingFileHandler(
+                    self.log_dir / f"{source}.log", maxBytes=LOG_FILE_MAX_BYTES,
+                    backupCount=LOG_FILE_BACKUPS, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                logger.addHandler(handler)
+            self.files[source] = logger
+        return self.files[source]
+    
+    def attach(self, source: str, stream, echo: bool = False, on_line=None) -> threading.Thread:
+        """Começa a drenar `stream`; `on_line` é chamado com cada linha (ex.: detectar prontidão)"""
+        buffer = self.buffers.setdefault(source, deque(maxlen=self.buffer_lines))
+        color = self.colors.setdefault(source, self.PALETTE[len(self.colors) % len(self.PALETTE)])
+        file_logger = self._file_logger(source)
+        prefix = f"{color}[{source}]{Colors.ENDC} "
+        
+        def drain():
+            try:
+                for line in stream:
+                    line = line.rstrip("\n")
+                    buffer.append(line)
+                    if file_logger is not None:
+                        file_logger.info(line)
+                    if echo and not self.echo_paused:
+                        with self._print_lock:
+                            print(prefix + line, flush=True)
+                    if on_line is not None:
+                        on_line(line)
+            except (OSError, ValueError):
+                pass  # Stream fechado junto com o processo
+        
+        thread = threading.Thread(target=drain, name=f"logs-{source}", daemon=True)
+        self.threads[source] = thread
+        thread.start()
+        return thread
+    
+    def tail(self, source: str, lines: int = 20) -> List[str]:
+        """Últimas linhas capturadas de uma fonte"""
+        return list(self.buffers.get(source, ()))[-lines:]
+
+
+class LiveDashboard:
+    """
+    Painel do monitor_services, redesenhado no lugar.
+
+    Amostradores em threads alimentam o estado: `docker stats` em streaming (um
+    processo só), latência de /health a cada segundo e, a cada 5s, conexões do
+    PostgreSQL e ops/s do Redis. O redesenho apenas lê esse estado.
+    """
+    
+    def __init__(self, manager: "SynQcoreManager"):
+        self.manager = manager
+        self.stop_event = threading.Event()
+        self.container_stats: Dict[str, Dict[str, str]] = {}
+        self.health_samples: deque = deque(maxlen=60)  # (latência ms ou None, status)
+        self.pg_connections: Optional[Dict[str, int]] = None
+        self.redis_ops: Optional[int] = None
+        self.stats_process: Optional[subprocess.Popen] = None
+        self._rendered_lines = 0
+    
+    def start(self):
+        try:
+            self.stats_process = subprocess.Popen(
+                ["docker", "stats", "--format", "{{json .}}"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+            threading.Thread(target=self.read_stats, daemon=True, name="dashboard-stats").start()
+        except FileNotFoundError:
+            self.stats_process = None
+        threading.Thread(target=self.sample_health, daemon=True, name="dashboard-health").start()
+        threading.Thread(target=self.sample_databases, daemon=True, name="dashboard-db").start()
+    
+    def stop(self):
+        self.stop_event.set()
+        if self.stats_process is not None and self.stats_process.poll() is None:
+            self.stats_process.terminate()
+    
+    def read_stats(self):
+        """Uma linha JSON por container a cada atualização do `docker stats` (entre códigos de limpar tela)"""
+        try:
+            for line in self.stats_process.stdout:
+                line = ANSI_ESCAPE.sub("", line).strip()
+                if not line.startswith("{"):
+                    continue
+                try:
+                    stats = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if stats.get("Name", "").startswith("synqcore-"):
+                    self.container_stats[stats["Name"]] = stats
+        except (OSError, ValueError):
+            pass
+    
+    def sample_health(self):
+        url = f"{self.manager.services['api'].url}{self.manager.services['api'].health_endpoint}"
+        while not self.stop_event.is_set():
+            started = time.perf_counter()
+            try:
+                status = requests.get(url, timeout=2).status_code
+                self.health_samples.append(((time.perf_counter() - started) * 1000, status))
+            except requests.RequestException:
+                self.health_samples.append((None, 0))
+            self.stop_event.wait(DASHBOARD_HEALTH_INTERVAL)
+    
+    def sample_databases(self):
+        while not self.stop_event.is_set():
+            try:
+                result = self.manager.psql("SELECT coalesce(state, 'outro'), count(*) FROM pg_stat_activity "
+                                           "WHERE backend_type = 'client backend' GROUP BY 1", timeout=5)
+                if result.returncode == 0:
+                    self.pg_connections = {state: int(count) for state, count in
+                                           (line.split("|") for line in result.stdout.splitlines() if line)}
+                result = subprocess.run(["docker", "exec", DOCKER_CONTAINERS['Redis'], "redis-cli", "INFO", "stats"],
+                                        capture_output=True, text=True, timeout=5)
+                match = re.search(r"instantaneous_ops_per_sec:(\d+)", result.stdout)
+                self.redis_ops = int(match.group(1)) if match else None
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                self.pg_connections, self.redis_ops = None, None
+            self.stop_event.wait(DASHBOARD_DB_INTERVAL)
+    
+    def lines(self, processes: List[subprocess.Popen]) -> List[str]:
+        width = 78
+        out = [f"{Colors.CYAN}{Colors.BOLD}📈 PAINEL AO VIVO{Colors.ENDC}  {time.strftime('%H:%M:%S')}  "
+               f"{Colors.WARNING}Ctrl+C para parar{Colors.ENDC}", "-" * width]
+        
+        out.append(f"{'Container':<20} {'CPU':>8}  {'Memória':<26} {'Rede (rx / tx)':<20}")
+        for name in DOCKER_CONTAINERS.values():
+            stats = self.container_stats.get(name)
+            if stats:
+                memory = f"{stats.get('MemUsage', '-')} ({stats.get('MemPerc', '-')})"
+                out.append(f"{name:<20} {stats.get('CPUPerc', '-'):>8}  {memory[:26]:<26} {stats.get('NetIO', '-'):<20}")
+            else:
+                out.append(f"{name:<20} {'-':>8}  {'parado ou sem dados':<26}")
+        out.append("-" * width)
+        
+        samples = list(self.health_samples)
+        latencies = sorted(ms for ms, status in samples if ms is not None and status == 200)
+        failures = len(samples) - len(latencies)
+        if latencies:
+            last = samples[-1][0]
+            p50 = latencies[len(latencies) // 2]
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            color = Colors.GREEN if not failures else Colors.WARNING
+            last_text = f"{last:.0f}ms" if last is not None else "falhou"
+            out.append(f"API /health    último {last_text:>7}  p50 {p50:5.0f}ms  p95 {p95:5.0f}ms  "
+                       f"{color}falhas {failures}/{len(samples)}{Colors.ENDC}")
+        else:
+            out.append(f"API /health    {Colors.FAIL}sem resposta ({len(samples)} tentativas){Colors.ENDC}")
+        
+        if self.pg_connections is not None:
+            detail = ", ".join(f"{state} {count}" for state, count in sorted(self.pg_connections.items()))
+            out.append(f"PostgreSQL     {sum(self.pg_connections.values())} conexões ({detail or 'nenhuma'})")
+        else:
+            out.append("PostgreSQL     indisponível")
+        out.append(f"Redis          {self.redis_ops:,} ops/s" if self.redis_ops is not None else "Redis          indisponível")
+        
+        alive = [f"{self.manager.process_sources.get(p.pid, 'processo')} (PID {p.pid})" for p in processes]
+        out.append(f"Processos      {', '.join(alive) or 'nenhum processo local'}")
+        
+        recent = [(source, line) for source in list(self.manager.logs.buffers)
+                  for line in self.manager.logs.tail(source, 2)]
+        if recent:
+            out.append("-" * width)
+            out += [f"[{source}] {line}"[:width] for source, line in recent]
+        return out
+    
+    def render(self, processes: List[subprocess.Popen]):
+        """Redesenha no lugar: volta o cursor até o início do painel anterior e limpa até o fim da tela"""
+        lines = self.lines(processes)
+        prefix = f"\033[{self._rendered_lines}F\033[J" if self._rendered_lines else ""
+        sys.stdout.write(prefix + "\n".join(lines) + "\n")
+        sys.stdout.flush()
+        self._rendered_lines = len(lines)
+
+
 class SynQcoreManager:
     """Gerenciador principal do ambiente SynQcore"""
     
@@ -100,6 +411,30 @@ class SynQcoreManager:
         self.docker_dir = self.root_dir / "docker"
         self.api_dir = self.root_dir / "src" / "SynQcore.Api"
         self.blazor_dir = self.root_dir / "src" / "SynQcore.BlazorApp" / "SynQcore.BlazorApp"
+        self.infrastructure_dir = self.root_dir / "src" / "SynQcore.Infrastructure"
+        self.migrations_dir = self.infrastructure_dir / "Migrations"
+        
+        # Estado local do script (manifestos, caches) - ignorado pelo git
+        self.state_dir = self.root_dir / ".synqcore"
+        self.build_manifest_file = self.state_dir / "build-manifest.json"
+        self.build_history_file = self.state_dir / "build-history.json"
+        self.prerequisites_file = self.state_dir / "prerequisites.json"
+        self.traces_dir = self.state_dir / "traces"
+        self.startup_history_file = self.state_dir / "startup-history.jsonl"
+        self.migrations_state_file = self.state_dir / "migrations.json"
+        self.logs_dir = self.state_dir / "logs"
+        self.profile_compose_file = self.state_dir / "compose-profile.yml"
+        self.faults_state_file = self.state_dir / "faults.json"
+        self.scale_state_file = self.state_dir / "scale.json"
+        self._compose_command: Optional[List[str]] = None
+        
+        # Paralelismo do MSBuild: SYNQCORE_BUILD_JOBS ou --jobs (0 = automático)
+        build_jobs = os.environ.get("SYNQCORE_BUILD_JOBS", "").strip()
+        try:
+            self.build_jobs = max(int(build_jobs or 0), 0)
+        except ValueError:
+            self.print_warning(f"SYNQCORE_BUILD_JOBS inválido ({build_jobs!r}); usando detecção automática")
+            self.build_jobs = 0
         
         # Configuração dos serviços
         self.services = {
@@ -107,7 +442,9 @@ class SynQcoreManager:
                 name="SynQcore API",
                 port=5005,  # API em container usa porta 5005
                 url="http://localhost:5005",
-                health_endpoint="/health"
+                health_endpoint="/health",
+                ready_endpoint="/health/ready",  # Sem checks de dependência: responde assim que o Kestrel sobe
+                container="synqcore-api"
             ),
             "blazor": ServiceConfig(
                 name="SynQcore Blazor",
@@ -117,8 +454,20 @@ class SynQcoreManager:
             )
         }
         
-        # Processos em execução
+        # Processos em execução e captura da saída de cada um (fonte de log por PID)
         self.running_processes: List[subprocess.Popen] = []
+        self.logs = LogMultiplexer(self.logs_dir if LOG_FILES_ENABLED else None)
+        self.process_sources: Dict[int, str] = {}
+        
+        # Prontidão: sinal do log ("Now listening on"), início e tempo até ficar pronto
+        self.ready_signals: Dict[str, threading.Event] = {}
+        self.launch_times: Dict[str, float] = {}
+        self.readiness_times: Dict[str, float] = {}
+        
+        # Linha do tempo das fases (relógio monotônico), exportada como trace do Chrome
+        self.timeline: List[Dict] = []
+        self._phase_stack: List[Dict] = []
+        self._timeline_started = time.monotonic()
         
         # Configurar tratamento de sinais
         signal.signal(signal.SIGINT, self.cleanup_handler)
@@ -152,53 +501,136 @@ class SynQcoreManager:
         """Exibe uma mensagem de sucesso"""
         print(f"{Colors.GREEN}✅ {message}{Colors.ENDC}")
 
+    def run_probe(self, name: str) -> Dict:
+        """Executa uma sonda de pré-requisito e normaliza o resultado"""
+        command, timeout = PREREQUISITE_PROBES[name]
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        except FileNotFoundError:
+            return {'ok': False, 'found': False}
+        except subprocess.TimeoutExpired:
+            return {'ok': False, 'found': True, 'timeout': True}
+        
+        output = result.stdout.strip()
+        if name == 'docker':
+            # Sem daemon, o cliente ainda imprime a própria versão e sai com erro
+            client, _, server = output.partition('|')
+            return {'ok': result.returncode == 0 and bool(server), 'found': bool(client),
+                    'version': server or client}
+        return {'ok': result.returncode == 0, 'found': True, 'version': output}
+
+    def probe_prerequisites(self, refresh: bool = False) -> Dict[str, Dict]:
+        """
+        Sonda dotnet, docker e as duas variantes do compose em paralelo.
+
+        Resultados positivos ficam em .synqcore/prerequisites.json por
+        PREREQUISITES_CACHE_TTL segundos (invalidados se o PATH mudar); falhas
+        são sempre verificadas de novo, para refletir o Docker recém-iniciado.
+        """
+        path_key = hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()[:16]
+        results: Dict[str, Dict] = {}
+        if not refresh:
+            try:
+                cache = json.loads(self.prerequisites_file.read_text(encoding='utf-8'))
+                if cache.get('path') == path_key:
+                    results = {name: probe for name, probe in cache.get('probes', {}).items()
+                               if name in PREREQUISITE_PROBES and
+                               time.time() - probe.get('checked_at', 0) < PREREQUISITES_CACHE_TTL}
+            except (OSError, ValueError):
+                pass
+        
+        pending = [name for name in PREREQUISITE_PROBES if name not in results]
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                for name, probe in zip(pending, executor.map(self.run_probe, pending)):
+                    probe['checked_at'] = time.time()
+                    results[name] = probe
+            
+            try:
+                self.prerequisites_file.parent.mkdir(parents=True, exist_ok=True)
+                cached = {name: probe for name, probe in results.items() if probe['ok']}
+                self.prerequisites_file.write_text(json.dumps({'path': path_key, 'probes': cached}, indent=1),
+                                                   encoding='utf-8')
+            except OSError:
+                pass
+        
+        return results
+
+    def compose_command(self, *args: str, overrides: Tuple[str, ...] = ()) -> List[str]:
+        """
+        Comando do Docker Compose detectado: plugin v2 (`docker compose`) ou `docker-compose`.
+
+        O perfil de produção ativo (`profile --size`), o proxy de falhas (`faults`), o modo escalado (`scale`) e os
+        `overrides` pedidos entram como arquivos -f adicionais sobre o docker-compose.yml. No modo escalado, `up`
+        recebe o número de réplicas salvo para não voltar a um container único.
+        """
+        if self._compose_command is None:
+            probes = self.probe_prerequisites()
+            if probes['compose_plugin']['ok'] or not probes['compose_standalone']['ok']:
+                self._compose_command = ["docker", "compose"]
+            else:
+                self._compose_command = ["docker-compose"]
+        
+        files = list(overrides)
+        replicas = self.api_replicas()
+        if replicas:
+            if SCALE_COMPOSE_FILE not in files:
+                files.insert(0, SCALE_COMPOSE_FILE)
+            if args[:1] == ("up",) and "--scale" not in args:
+                args = ("up", "--scale", f"api={replicas}") + args[1:]
+        if self.faults_state_file.exists():
+            files.insert(0, FAULTS_COMPOSE_FILE)
+        if self.profile_compose_file.exists():
+            files.insert(0, str(self.profile_compose_file))
+        file_args = []
+        if files:
+            for compose_file in ["docker-compose.yml"] + files:
+                file_args += ["-f", compose_file]
+        return self._compose_command + file_args + list(args)
+
+    def api_replicas(self) -> int:
+        """Réplicas da API registradas por `scale --api N` (0 = container único)"""
+        try:
+            return int(json.loads(self.scale_state_file.read_text()).get('replicas', 0))
+        except (OSError, ValueError, AttributeError):
+            return 0
+
     def check_prerequisites(self, require_docker: bool = True) -> bool:
         """Verifica se todas as dependências estão instaladas"""
         self.print_step("VERIFICAÇÃO", "Checando pré-requisitos do sistema")
         
+        probes = self.probe_prerequisites()
+        
         # Verificar .NET (sempre obrigatório)
-        dotnet_available = False
-        try:
-            result = subprocess.run(["dotnet", "--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                print(f"  ✅ dotnet: {version}")
-                dotnet_available = True
-            else:
-                print(f"  ❌ dotnet: erro ao verificar versão")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        dotnet = probes['dotnet']
+        dotnet_available = dotnet['ok']
+        if dotnet['ok']:
+            print(f"  ✅ dotnet: {dotnet['version']}")
+        elif dotnet['found'] and not dotnet.get('timeout'):
+            print(f"  ❌ dotnet: erro ao verificar versão")
+        else:
             print(f"  ❌ dotnet: não encontrado")
         
         # Verificar Docker (condicional)
-        docker_available = False
-        docker_compose_available = False
-        
-        try:
-            # Verificar se Docker Desktop está rodando
-            result = subprocess.run(["docker", "info"], 
-                                  capture_output=True, text=True, timeout=15)
-            if result.returncode == 0:
-                docker_available = True
-                print(f"  ✅ docker: disponível e rodando")
-            else:
-                print(f"  ⚠️  docker: instalado mas não está rodando")
-                print(f"      Inicie o Docker Desktop e tente novamente")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        docker = probes['docker']
+        docker_available = docker['ok']
+        if docker['ok']:
+            print(f"  ✅ docker: disponível e rodando ({docker['version']})")
+        elif docker['found']:
+            print(f"  ⚠️  docker: instalado mas não está rodando")
+            print(f"      Inicie o Docker Desktop e tente novamente")
+        else:
             print(f"  ❌ docker: não encontrado ou não instalado")
         
-        # Verificar docker-compose
-        try:
-            result = subprocess.run(["docker-compose", "--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                print(f"  ✅ docker-compose: {version}")
-                docker_compose_available = True
-            else:
-                print(f"  ❌ docker-compose: erro ao verificar")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print(f"  ❌ docker-compose: não encontrado")
+        # Verificar Docker Compose (plugin v2 preferido, docker-compose standalone como alternativa)
+        plugin, standalone = probes['compose_plugin'], probes['compose_standalone']
+        docker_compose_available = plugin['ok'] or standalone['ok']
+        if plugin['ok']:
+            print(f"  ✅ docker compose: {plugin['version']} (plugin)")
+        elif standalone['ok']:
+            print(f"  ✅ docker-compose: {standalone['version']}")
+        else:
+            print(f"  ❌ docker compose / docker-compose: não encontrado")
         
         # Verificar se requirements mínimos estão atendidos
         if not dotnet_available:
@@ -250,76 +682,98 @@ class SynQcoreManager:
         except Exception:
             return False
 
-    def clean_environment(self):
-        """Limpa o ambiente de desenvolvimento"""
-        self.print_step("LIMPEZA", "Removendo artefatos de build anteriores")
+    @staticmethod
+    def format_bytes(size: float) -> str:
+        """Tamanho legível (B, KB, MB, GB)"""
+        for unit in ("B", "KB", "MB", "GB"):
+            if size < 1024 or unit == "GB":
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+
+    @staticmethod
+    def path_size(path: str) -> int:
+        """Bytes ocupados por um arquivo ou árvore (sem seguir links)"""
+        if not os.path.isdir(path) or os.path.islink(path):
+            return os.lstat(path).st_size
+        total = 0
+        for root, dirs, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    pass
+        return total
+
+    def find_clean_targets(self) -> List[str]:
+        """Varredura única e podada: bin/obj/logs não são percorridos, só marcados para remoção"""
+        targets = []
+        for root, dirs, files in os.walk(self.root_dir):
+            kept = []
+            for name in dirs:
+                if name in CLEAN_DIR_NAMES:
+                    targets.append(os.path.join(root, name))
+                elif name not in CLEAN_PRUNED_DIRS:
+                    kept.append(name)
+            dirs[:] = kept
+            targets.extend(os.path.join(root, name) for name in files if name.endswith(CLEAN_FILE_SUFFIXES))
+        return targets
+
+    def clean_environment(self, dry_run: bool = False) -> bool:
+        """Limpa o ambiente de desenvolvimento (em dry-run apenas relata o que seria removido)"""
+        self.print_step("LIMPEZA", "Calculando artefatos a remover" if dry_run
+                        else "Removendo artefatos de build anteriores")
         
-        # Usar dotnet clean para limpeza padrão
-        try:
-            result = subprocess.run(
-                ["dotnet", "clean", "SynQcore.sln"],
-                cwd=self.root_dir, 
-                capture_output=True, 
-                text=True
-            )
-            if result.returncode == 0:
-                self.print_success("Limpeza dotnet concluída")
-            else:
-                self.print_warning("Aviso na limpeza dotnet - continuando...")
-        except Exception:
-            self.print_warning("dotnet clean falhou - usando limpeza manual")
+        # A remoção de bin/obj cobre o dotnet clean, que só custaria uma inicialização do MSBuild
+        started = time.perf_counter()
+        targets = self.find_clean_targets()
+        if not targets:
+            self.print_success("Nada a limpar")
+            return True
         
-        # Limpeza manual adicional
         import shutil
         
-        clean_dirs = []
-        
-        # Encontrar diretórios bin e obj recursivamente
-        for root, dirs, files in os.walk(self.root_dir):
-            for dir_name in dirs:
-                if dir_name in ["bin", "obj", "logs"]:
-                    full_path = os.path.join(root, dir_name)
-                    clean_dirs.append(full_path)
-        
-        # Remover diretórios encontrados
-        if clean_dirs:
-            print(f"  🧹 Limpando {len(clean_dirs)} diretórios", end="", flush=True)
-            
-        for dir_path in clean_dirs:
+        def remove(path: str) -> Tuple[str, int, Optional[str]]:
             try:
-                if os.path.exists(dir_path):
-                    shutil.rmtree(dir_path)
-                    print(".", end="", flush=True)
-            except Exception as e:
-                self.print_warning(f"Não foi possível remover {dir_path}: {e}")
+                size = self.path_size(path)
+                if not dry_run:
+                    if os.path.isdir(path) and not os.path.islink(path):
+                        shutil.rmtree(path)
+                    else:
+                        os.remove(path)
+                return path, size, None
+            except OSError as e:
+                return path, 0, str(e)
         
-        if clean_dirs:
-            print(" ✅")
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        print(f"  🧹 {len(targets)} itens ({workers} threads)", end="", flush=True)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(remove, targets))
+        print(" ✅")
         
-        # Remover arquivos de log específicos
-        log_patterns = ["*.log", "*.tmp"]
-        for pattern in log_patterns:
-            try:
-                import glob
-                for file_path in glob.glob(os.path.join(self.root_dir, "**", pattern), recursive=True):
-                    try:
-                        os.remove(file_path)
-                        print(f"  🗑️  Removido: {os.path.relpath(file_path, self.root_dir)}")
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        failures = [(path, error) for path, _, error in results if error]
+        for path, error in failures:
+            self.print_warning(f"Não foi possível remover {os.path.relpath(path, self.root_dir)}: {error}")
+        
+        reclaimed = sum(size for _, size, error in results if not error)
+        elapsed = time.perf_counter() - started
+        if dry_run:
+            print("  📋 Maiores itens:")
+            for path, size, _ in sorted(results, key=lambda r: r[1], reverse=True)[:10]:
+                print(f"      {self.format_bytes(size):>10}  {os.path.relpath(path, self.root_dir)}")
+            self.print_success(f"Dry-run: {len(targets)} itens, {self.format_bytes(reclaimed)} seriam liberados "
+                               f"({elapsed:.2f}s)")
+        else:
+            self.print_success(f"Limpeza concluída: {len(targets) - len(failures)} itens, "
+                               f"{self.format_bytes(reclaimed)} liberados ({elapsed:.2f}s)")
+        return not failures
 
     def setup_docker_infrastructure(self) -> bool:
         """Configura e inicia a infraestrutura Docker"""
         self.print_step("DOCKER", "Configurando infraestrutura (PostgreSQL + Redis)")
         
         try:
-            # Verificar se Docker está rodando antes de tentar usar
-            docker_check = subprocess.run(["docker", "info"], 
-                                        capture_output=True, text=True, timeout=10)
-            
-            if docker_check.returncode != 0:
+            # Verificar se Docker está rodando antes de tentar usar (sonda em cache)
+            if not self.probe_prerequisites()['docker']['ok']:
                 self.print_error("Docker não está rodando. Inicie o Docker Desktop primeiro.")
                 print("  🐳 Aguarde o Docker Desktop inicializar completamente")
                 print("  🔄 Após inicializar, execute o comando novamente")
@@ -344,12 +798,14 @@ class SynQcoreManager:
             except Exception:
                 pass
             
-            # Parar apenas o container da API (pode ter sido recompilado)
-            api_running = containers_status.get('synqcore-api', False)
+            # Parar apenas o(s) container(s) da API (pode ter sido recompilado)
+            scaled = self.api_replicas() > 0
+            api_names = self.api_replica_names() if scaled else ['synqcore-api']
+            api_running = [name for name in api_names if containers_status.get(name, False)]
             if api_running:
                 self.print_step("PARANDO", "Container da API (recompilação detectada)")
-                subprocess.run(["docker", "stop", "synqcore-api"], capture_output=True)
-                subprocess.run(["docker", "rm", "synqcore-api"], capture_output=True)
+                subprocess.run(["docker", "stop"] + api_running, capture_output=True)
+                subprocess.run(["docker", "rm"] + api_running, capture_output=True)
             
             # Determinar quais containers precisam ser iniciados
             services_to_start = []
@@ -366,14 +822,19 @@ class SynQcoreManager:
             if not containers_status.get('synqcore-pgadmin', False):
                 services_to_start.append('pgadmin')
                 
-            # Sempre iniciar API (pode ter sido recompilada)
+            # Sempre iniciar API (pode ter sido recompilada); no modo escalado, junto com o balanceador
             services_to_start.append('api')
+            if scaled:
+                services_to_start.append('api-lb')
             
             if services_to_start:
-                services_text = ', '.join(services_to_start).replace('postgres', 'PostgreSQL').replace('redis', 'Redis').replace('pgadmin', 'pgAdmin').replace('api', 'API')
+                services_text = ', '.join(services_to_start).replace('postgres', 'PostgreSQL').replace('redis', 'Redis').replace('pgadmin', 'pgAdmin').replace('api-lb', 'Balanceador').replace('api', 'API')
                 self.print_step("INICIANDO", f"{services_text}")
-                result = subprocess.run(["docker-compose", "up", "-d"] + services_to_start, 
-                                      cwd=self.docker_dir, capture_output=True, text=True)
+                self.launch_times['api'] = time.monotonic()
+                with self.phase("compose up", "docker"):
+                    # --remove-orphans: remove serviços que saíram dos arquivos -f (ex.: proxy de falhas desligado)
+                    result = subprocess.run(self.compose_command("up", "-d", "--remove-orphans", *services_to_start), 
+                                          cwd=self.docker_dir, capture_output=True, text=True)
             else:
                 self.print_step("VERIFICANDO", "Todos os containers já estão rodando")
                 result = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
@@ -390,70 +851,22 @@ class SynQcoreManager:
                 
                 return False
             
-            # Aguardar containers ficarem prontos
+            if scaled:
+                self.reload_api_balancer()
+            
+            # Aguardar containers ficarem prontos (healthchecks do compose, via eventos do Docker)
             self.print_step("AGUARDANDO", "Containers inicializando...")
+            containers = {label: name for label, name in DOCKER_CONTAINERS.items() if label != 'API'}
+            containers.update(self.api_containers())
+            with self.phase("healthchecks", "docker"):
+                ready = self.wait_for_containers(containers, timeout=120)
             
-            max_attempts = 30
-            postgres_ready = False
-            redis_ready = False
-            pgadmin_ready = False
-            api_ready = False
-            
-            for attempt in range(max_attempts):
-                # Verificar PostgreSQL
-                if not postgres_ready:
-                    pg_result = subprocess.run(
-                        ["docker", "exec", "synqcore-postgres", "pg_isready", "-U", "postgres"],
-                        capture_output=True, text=True
-                    )
-                    postgres_ready = pg_result.returncode == 0
-                
-                # Verificar Redis
-                if not redis_ready:
-                    redis_result = subprocess.run(
-                        ["docker", "exec", "synqcore-redis", "redis-cli", "ping"],
-                        capture_output=True, text=True
-                    )
-                    redis_ready = redis_result.returncode == 0 and "PONG" in redis_result.stdout
-                
-                # Verificar pgAdmin (apenas se container está rodando)
-                if not pgadmin_ready:
-                    pgadmin_check = subprocess.run(
-                        ["docker", "ps", "--filter", "name=synqcore-pgadmin", "--format", "{{.Status}}"],
-                        capture_output=True, text=True
-                    )
-                    pgadmin_ready = "Up" in pgadmin_check.stdout
-                
-                # Verificar API (container)
-                if not api_ready:
-                    api_check = subprocess.run(
-                        ["docker", "ps", "--filter", "name=synqcore-api", "--format", "{{.Status}}"],
-                        capture_output=True, text=True
-                    )
-                    api_ready = "Up" in api_check.stdout
-                
-                if postgres_ready and redis_ready and pgadmin_ready and api_ready:
-                    self.print_success("Infraestrutura Docker pronta!")
-                    print("  ✅ PostgreSQL: Pronto")
-                    print("  ✅ Redis: Pronto") 
-                    print("  ✅ pgAdmin: Pronto")
-                    print("  ✅ API: Pronto (container)")
-                    return True
-                
-                status_msg = []
-                if not postgres_ready:
-                    status_msg.append("PostgreSQL")
-                if not redis_ready:
-                    status_msg.append("Redis")
-                if not pgadmin_ready:
-                    status_msg.append("pgAdmin")
-                if not api_ready:
-                    status_msg.append("API")
-                
-                print(f"  ⏳ Aguardando {', '.join(status_msg)}... ({attempt + 1}/{max_attempts})")
-                time.sleep(2)
+            if all(ready.values()):
+                self.print_success("Infraestrutura Docker pronta!")
+                return True
             
-            self.print_warning("Timeout aguardando containers, mas continuando...")
+            pending = [label for label, is_ready in ready.items() if not is_ready]
+            self.print_warning(f"Timeout aguardando {', '.join(pending)}, mas continuando...")
             return True
             
         except subprocess.TimeoutExpired:
@@ -466,36 +879,367 @@ class SynQcoreManager:
             self.print_error(f"Erro inesperado: {e}")
             return False
 
-    def build_solution(self) -> bool:
-        """Compila a solução completa"""
+    def inspect_containers(self, names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Estado e saúde de vários containers com um único docker inspect"""
+        result = subprocess.run(
+            ["docker", "inspect", "--format",
+             "{{.Name}}|{{.State.Status}}|{{if .State.Health}}{{.State.Health.Status}}{{end}}"] + names,
+            capture_output=True, text=True, timeout=10
+        )
+        states = {}
+        # Containers inexistentes geram erro no stderr, mas os demais continuam no stdout
+        for line in result.stdout.splitlines():
+            name, _, rest = line.lstrip('/').partition('|')
+            status, _, health = rest.partition('|')
+            states[name] = {'status': status, 'health': health}
+        return states
+
+    def wait_for_containers(self, containers: Dict[str, str], timeout: int = 120) -> Dict[str, bool]:
+        """
+        Aguarda todos os containers ao mesmo tempo a partir do fluxo de `docker events`.
+
+        Containers com healthcheck ficam prontos no evento "health_status: healthy";
+        os demais, quando estão em execução. O fluxo começa (--since) em um instante
+        anterior ao inspect inicial, então transições ocorridas enquanto o `docker events`
+        ainda se inscreve são reenviadas em vez de perdidas.
+        """
+        names = {name: label for label, name in containers.items()}
+        command = ["docker", "events", "--format", "{{json .}}", "--since", f"{time.time():.3f}",
+                   "--filter", "type=container",
+                   "--filter", "event=start", "--filter", "event=die", "--filter", "event=health_status"]
+        for name in names:
+            command += ["--filter", f"container={name}"]
+        
+        events = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        
+        def pump():
+            for line in events.stdout:
+                lines.put(line)
+            lines.put(None)
+        
+        threading.Thread(target=pump, daemon=True).start()
+        started = time.monotonic()
+        ready = {label: False for label in containers}
+        has_health: Dict[str, bool] = {}
+        
+        def mark(label: str, is_ready: bool):
+            if is_ready and not ready[label]:
+                print(f"  ✅ {label}: Pronto ({time.monotonic() - started:.1f}s)")
+            ready[label] = is_ready
+        
+        try:
+            for name, state in self.inspect_containers(list(names)).items():
+                if name in names:
+                    has_health[name] = bool(state['health'])
+                    mark(names[name], state['health'] == 'healthy' if state['health'] else state['status'] == 'running')
+            
+            while not all(ready.values()):
+                remaining = timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                try:
+                    line = lines.get(timeout=min(remaining, 15))
+                except queue.Empty:
+                    pending = [label for label, is_ready in ready.items() if not is_ready]
+                    print(f"  ⏳ Aguardando {', '.join(pending)}... ({time.monotonic() - started:.0f}s)")
+                    continue
+                if line is None:
+                    self.print_warning("Fluxo de eventos do Docker encerrado inesperadamente")
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                
+                name = event.get('Actor', {}).get('Attributes', {}).get('name')
+                action = event.get('Action') or event.get('status', '')
+                if name not in names:
+                    continue
+                label = names[name]
+                
+                if action.startswith('health_status'):
+                    has_health[name] = True
+                    mark(label, action.endswith('healthy') and not action.endswith('unhealthy'))
+                    if action.endswith('unhealthy'):
+                        self.print_warning(f"{label} reportou estado unhealthy")
+                elif action == 'start' and not has_health.get(name):
+                    # Healthcheck só aparece no inspect; sem ele, "start" já é prontidão
+                    state = self.inspect_containers([name]).get(name, {})
+                    has_health[name] = bool(state.get('health'))
+                    mark(label, state.get('health') == 'healthy' if has_health[name] else True)
+                elif action == 'die':
+                    mark(label, False)
+                    print(f"  ❌ {label}: container parou (aguardando reinício)")
+        finally:
+            events.terminate()
+            try:
+                events.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                events.kill()
+        
+        return ready
+
+    def hash_file(self, path: Path, cached: Optional[list] = None) -> str:
+        """SHA-256 do conteúdo, reaproveitando o hash anterior se mtime e tamanho não mudaram"""
+        stat = path.stat()
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def scan_build_inputs(self, previous: Optional[Dict] = None) -> Dict:
+        """Calcula o manifesto de build: hash de projeto e de fontes por .csproj em src/"""
+        previous_files = (previous or {}).get('files', {})
+        src_dir = self.root_dir / "src"
+        project_files: List[Path] = []
+        source_files: List[Path] = []
+
+        for root, dirs, files in os.walk(src_dir):
+            dirs[:] = [d for d in dirs if d not in BUILD_IGNORED_DIRS and not d.startswith('.')]
+            for file_name in files:
+                if file_name.endswith('.csproj'):
+                    project_files.append(Path(root) / file_name)
+                elif file_name.endswith(BUILD_SOURCE_EXTENSIONS):
+                    source_files.append(Path(root) / file_name)
+
+        files: Dict[str, list] = {}
+
+        def digest_of(path: Path) -> str:
+            rel = path.relative_to(self.root_dir).as_posix()
+            stat = path.stat()
+            digest = self.hash_file(path, previous_files.get(rel))
+            files[rel] = [stat.st_mtime_ns, stat.st_size, digest]
+            return digest
+
+        # Arquivos globais de MSBuild: qualquer mudança afeta todos os projetos
+        global_hash = hashlib.sha256()
+        for name in BUILD_GLOBAL_FILES:
+            path = self.root_dir / name
+            if path.exists():
+                global_hash.update(f"{name}:{digest_of(path)}".encode())
+
+        projects: Dict[str, Dict] = {}
+        project_dirs = {path.parent: path.relative_to(self.root_dir).as_posix() for path in project_files}
+        for path in project_files:
+            rel = project_dirs[path.parent]
+            content = path.read_text(encoding='utf-8', errors='ignore')
+            references = []
+            for include in re.findall(r'<ProjectReference\s+Include="([^"]+)"', content):
+                target = (path.parent / include.replace('\\', '/')).resolve()
+                if target.exists():
+                    references.append(target.relative_to(self.root_dir).as_posix())
+            projects[rel] = {'project_hash': digest_of(path), 'references': sorted(references), 'sources': []}
+
+        # Cada fonte pertence ao .csproj mais próximo acima dela
+        for path in source_files:
+            owner = next((project_dirs[parent] for parent in path.parents if parent in project_dirs), None)
+            if owner:
+                projects[owner]['sources'].append((path.relative_to(self.root_dir).as_posix(), digest_of(path)))
+
+        for info in projects.values():
+            source_hash = hashlib.sha256()
+            for rel, digest in sorted(info.pop('sources')):
+                source_hash.update(f"{rel}:{digest}\n".encode())
+            info['source_hash'] = source_hash.hexdigest()
+
+        return {'global_hash': global_hash.hexdigest(), 'projects': projects, 'files': files}
+
+    def load_build_manifest(self) -> Optional[Dict]:
+        """Lê o manifesto do último build bem-sucedido"""
+        try:
+            return json.loads(self.build_manifest_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def save_build_manifest(self, manifest: Dict):
+        """Grava o manifesto após um build bem-sucedido"""
+        try:
+            self.build_manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            self.build_manifest_file.write_text(json.dumps(manifest, indent=1), encoding='utf-8')
+        except OSError as e:
+            self.print_warning(f"Não foi possível gravar o manifesto de build: {e}")
+
+    def plan_incremental_build(self, current: Dict, previous: Optional[Dict], force: bool = False) -> Tuple[bool, List[str]]:
+        """
+        Decide o que precisa ser feito comparando os manifestos.
+
+        Retorna (restore_necessário, projetos_a_compilar). Projetos cujos fontes mudaram
+        entram junto com todos os que dependem deles; da lista resultante só são
+        compilados os projetos do topo, já que o build de um projeto compila suas referências.
+        """
+        projects = current['projects']
+        previous_projects = (previous or {}).get('projects', {})
+        global_changed = force or not previous or previous.get('global_hash') != current['global_hash']
+
+        restore_needed = global_changed or any(
+            previous_projects.get(rel, {}).get('project_hash') != info['project_hash'] or
+            not (self.root_dir / rel).parent.joinpath('obj', 'project.assets.json').exists()
+            for rel, info in projects.items()
+        )
+
+        changed = set()
+        for rel, info in projects.items():
+            old = previous_projects.get(rel)
+            if (global_changed or not old or old.get('project_hash') != info['project_hash'] or
+                    old.get('source_hash') != info['source_hash'] or
+                    not (self.root_dir / rel).parent.joinpath('bin').exists()):
+                changed.add(rel)
+
+        # Propagar para os dependentes (fecho transitivo das referências)
+        affected = set(changed)
+        grew = True
+        while grew:
+            grew = False
+            for rel, info in projects.items():
+                if rel not in affected and affected.intersection(info['references']):
+                    affected.add(rel)
+                    grew = True
+
+        referenced = {ref for rel in affected for ref in projects[rel]['references']}
+        targets = sorted(rel for rel in affected if rel not in referenced)
+        return restore_needed, targets
+
+    def detect_build_jobs(self) -> int:
+        """Número de nós do MSBuild: configuração explícita ou CPUs disponíveis para o processo"""
+        if self.build_jobs > 0:
+            return self.build_jobs
+        try:
+            return max(len(os.sched_getaffinity(0)), 1)
+        except AttributeError:
+            return max(os.cpu_count() or 1, 1)
+
+    def parse_project_durations(self, output: str) -> Dict[str, int]:
+        """Extrai a duração (ms) por projeto do "Project Performance Summary" do MSBuild"""
+        durations: Dict[str, int] = {}
+        in_summary = False
+        for line in output.splitlines():
+            if line.strip().startswith("Project Performance Summary"):
+                in_summary = True
+                continue
+            if in_summary and line.strip().endswith("Performance Summary:"):
+                break
+            match = PROJECT_SUMMARY_LINE.match(line) if in_summary else None
+            if match:
+                name = Path(match.group(2).replace('\\', '/')).stem
+                durations[name] = durations.get(name, 0) + int(match.group(1))
+        return durations
+
+    def run_dotnet_build(self, target: str, jobs: int) -> Tuple[subprocess.CompletedProcess, float]:
+        """Executa o dotnet build de um alvo mantendo os servidores de build ativos"""
+        env = os.environ.copy()
+        # Servidor do MSBuild (.NET 7+) mantém a avaliação dos projetos entre invocações
+        env.setdefault("DOTNET_CLI_USE_MSBUILD_SERVER", "1")
+        started = time.perf_counter()
+        result = subprocess.run(
+            ["dotnet", "build", target, "--no-restore",
+             f"-maxcpucount:{jobs}", "-nodeReuse:true", "-p:UseSharedCompilation=true",
+             "-clp:PerformanceSummary", "--verbosity", "minimal"],
+            cwd=self.root_dir, capture_output=True, text=True, env=env
+        )
+        return result, time.perf_counter() - started
+
+    def record_build_history(self, entry: Dict) -> List[Dict]:
+        """Acrescenta o build ao histórico local e retorna o histórico anterior"""
+        try:
+            history = json.loads(self.build_history_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            history = []
+        try:
+            self.build_history_file.parent.mkdir(parents=True, exist_ok=True)
+            self.build_history_file.write_text(
+                json.dumps((history + [entry])[-BUILD_HISTORY_LIMIT:], indent=1), encoding='utf-8')
+        except OSError as e:
+            self.print_warning(f"Não foi possível gravar o histórico de build: {e}")
+        return history
+
+    def print_build_report(self, entry: Dict, history: List[Dict]):
+        """Exibe a duração por projeto e o ganho em relação ao último build serial equivalente"""
+        durations = entry['projects']
+        if durations:
+            print("  ⏱️  Duração por projeto:")
+            for name, ms in sorted(durations.items(), key=lambda item: item[1], reverse=True):
+                print(f"      {name:<40} {ms / 1000:>7.2f}s")
+
+        serial = next((h for h in reversed(history)
+                       if h.get('jobs') == 1 and h.get('targets') == entry['targets']), None)
+        if serial and entry['jobs'] > 1 and entry['total_s'] > 0:
+            print(f"  🚀 {entry['jobs']} nós: {entry['total_s']:.1f}s vs {serial['total_s']:.1f}s serial "
+                  f"(speedup {serial['total_s'] / entry['total_s']:.2f}x)")
+        else:
+            print(f"  ⏱️  Total: {entry['total_s']:.1f}s com {entry['jobs']} nó(s)")
+
+    def build_solution(self, force: bool = False) -> bool:
+        """Compila a solução de forma incremental, com base no manifesto de hashes de src/"""
         self.print_step("BUILD", "Compilando solução SynQcore")
         
         try:
-            # Restaurar pacotes
-            print("  🔄 Restaurando pacotes", end="", flush=True)
-            result = subprocess.run(
-                ["dotnet", "restore", "SynQcore.sln"],
-                cwd=self.root_dir, capture_output=True, text=True
-            )
-            print(" ✅")
-            
-            if result.returncode != 0:
-                self.print_error(f"Erro no restore: {result.stderr}")
-                return False
-            
-            # Build com CPU única para evitar problemas de CLR
-            print("  🔨 Compilando projeto", end="", flush=True)
-            result = subprocess.run(
-                ["dotnet", "build", "SynQcore.sln", "--no-restore", 
-                 "--maxcpucount:1", "--verbosity", "minimal"],
-                cwd=self.root_dir, capture_output=True, text=True
-            )
-            print(" ✅")
+            previous = None if force else self.load_build_manifest()
+            current = self.scan_build_inputs(previous)
+            restore_needed, targets = self.plan_incremental_build(current, previous, force)
+
+            if not restore_needed and not targets:
+                self.print_success("Build atualizado - nenhum fonte alterado desde o último build")
+                return True
+
+            # Restaurar pacotes apenas se arquivos de projeto mudaram
+            if restore_needed:
+                print("  🔄 Restaurando pacotes", end="", flush=True)
+                with self.phase("dotnet restore", "build"):
+                    result = subprocess.run(
+                        ["dotnet", "restore", "SynQcore.sln"],
+                        cwd=self.root_dir, capture_output=True, text=True
+                    )
+                print(" ✅")
+                
+                if result.returncode != 0:
+                    self.print_error(f"Erro no restore: {result.stderr}")
+                    return False
+            else:
+                print("  ⏭️  Restore ignorado (projetos inalterados)")
+
+            # Primeiro build ou mudança global: um único build da solução; senão, só os afetados
+            full_build = previous is None or previous.get('global_hash') != current['global_hash']
+            build_targets = ["SynQcore.sln"] if full_build else targets
+
+            jobs = self.detect_build_jobs()
+            entry = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'jobs': jobs,
+                     'targets': build_targets, 'projects': {}, 'total_s': 0.0, 'serial_fallback': False}
+
+            for target in build_targets:
+                print(f"  🔨 Compilando {Path(target).stem} ({jobs} nós)", end="", flush=True)
+                with self.phase(f"dotnet build {Path(target).stem}", "build"):
+                    result, elapsed = self.run_dotnet_build(target, jobs)
+                
+                # Paralelismo só é abandonado quando o build paralelo falha
+                if result.returncode != 0 and jobs > 1:
+                    print(" ⚠️")
+                    self.print_warning("Build paralelo falhou - tentando novamente em modo serial")
+                    print(f"  🔨 Compilando {Path(target).stem} (1 nó)", end="", flush=True)
+                    with self.phase(f"dotnet build {Path(target).stem} (serial)", "build"):
+                        result, retry_elapsed = self.run_dotnet_build(target, 1)
+                    elapsed += retry_elapsed
+                    entry['serial_fallback'] = True
+                
+                if result.returncode != 0:
+                    print(" ❌")
+                    self.print_error(f"Erro no build: {result.stderr or result.stdout}")
+                    return False
+                print(f" ✅ {elapsed:.1f}s")
+                
+                entry['total_s'] = round(entry['total_s'] + elapsed, 2)
+                for name, ms in self.parse_project_durations(result.stdout).items():
+                    entry['projects'][name] = entry['projects'].get(name, 0) + ms
             
-            if result.returncode != 0:
-                self.print_error(f"Erro no build: {result.stderr}")
-                return False
+            if entry['serial_fallback']:
+                self.print_warning("Build paralelo falhou e o serial passou; use --jobs 1 se isso se repetir")
+            history = self.record_build_history(entry)
+            self.print_build_report(entry, history)
             
+            self.save_build_manifest(current)
             self.print_success("Build concluído com sucesso!")
             return True
             
@@ -503,30 +1247,90 @@ class SynQcoreManager:
             self.print_error(f"Erro durante o build: {e}")
             return False
 
+    def psql(self, sql, database: str = POSTGRES_DATABASE, timeout: int = 30) -> subprocess.CompletedProcess:
+        """
+        Executa SQL no PostgreSQL do container (saída sem cabeçalhos, campos separados por |).
+
+        Uma lista de comandos vira vários -c, cada um em sua própria transação
+        (necessário para CREATE/DROP DATABASE).
+        """
+        statements = [sql] if isinstance(sql, str) else list(sql)
+        command = ["docker", "exec", "-i", DOCKER_CONTAINERS['PostgreSQL'], "psql", "-U", POSTGRES_USER,
+                   "-d", database, "-At", "-v", "ON_ERROR_STOP=1"]
+        for statement in statements:
+            command += ["-c", statement]
+        return subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+
+    def local_migrations(self) -> Tuple[List[str], str]:
+        """IDs das migrações em SynQcore.Infrastructure/Migrations e hash de todos os fontes da pasta"""
+        ids = []
+        sources_hash = hashlib.sha256()
+        for path in sorted(self.migrations_dir.glob("*.cs")):
+            sources_hash.update(f"{path.name}:{self.hash_file(path)}\n".encode())
+            if path.name.endswith(".Designer.cs"):
+                match = MIGRATION_ID_PATTERN.search(path.read_text(encoding='utf-8', errors='ignore'))
+                if match:
+                    ids.append(match.group(1))
+        return sorted(ids), sources_hash.hexdigest()
+
+    def applied_migrations(self) -> Optional[List[str]]:
+        """IDs registrados em __EFMigrationsHistory; None se o banco não pôde ser consultado"""
+        try:
+            result = self.psql('SELECT "MigrationId" FROM "__EFMigrationsHistory" ORDER BY 1')
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+        if result.returncode == 0:
+            return [line for line in result.stdout.splitlines() if line]
+        if "does not exist" in result.stderr and "__EFMigrationsHistory" in result.stderr:
+            return []  # Banco existe, mas nenhuma migração foi aplicada
+        return None
+
     def check_migrations_needed(self) -> bool:
-        """Verifica se há migrações pendentes baseado em arquivo marker"""
+        """
+        Compara as migrações do código com as aplicadas no banco.
+
+        A fonte principal é a __EFMigrationsHistory do PostgreSQL local; se o
+        container não responder, vale o hash dos fontes gravado no último update.
+        """
         try:
-            # Arquivo marker que indica quando migrações foram aplicadas pela última vez
-            migrations_marker = self.root_dir / ".migrations_applied"
-            
-            # Se não existe o arquivo marker, assumir que precisa
-            if not migrations_marker.exists():
+            local_ids, sources_hash = self.local_migrations()
+            try:
+                state = json.loads(self.migrations_state_file.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                state = {}
+            
+            applied = self.applied_migrations()
+            if applied is None:
+                self.print_warning("Não foi possível consultar __EFMigrationsHistory - usando hash das migrações")
+                return state.get('sources_hash') != sources_hash
+            
+            pending = [mid for mid in local_ids if mid not in applied]
+            unknown = [mid for mid in applied if mid not in local_ids]
+            if unknown:
+                self.print_warning(f"Banco tem migrações ausentes neste checkout: {', '.join(unknown)}")
+            if pending:
+                print(f"  📦 Migrações pendentes: {', '.join(pending)}")
                 return True
-                
-            # Verificar se há arquivos de migração mais novos que o marker
-            migrations_dir = self.api_dir / "Migrations"
-            if migrations_dir.exists():
-                marker_time = migrations_marker.stat().st_mtime
-                for migration_file in migrations_dir.glob("*.cs"):
-                    if migration_file.stat().st_mtime > marker_time:
-                        return True
-                        
+            
+            # Mesmo conjunto de IDs, mas fontes alterados depois do update: o EF não reaplica
+            if state.get('sources_hash') and state['sources_hash'] != sources_hash:
+                self.print_warning("Migrações já aplicadas foram editadas; recrie o banco se o esquema divergir")
+            self.save_migrations_state(sources_hash, applied)
             return False
             
         except Exception:
             # Em caso de erro, aplicar migrações por segurança
             return True
 
+    def save_migrations_state(self, sources_hash: str, applied: List[str]):
+        """Registra o hash dos fontes e as migrações aplicadas"""
+        try:
+            self.migrations_state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.migrations_state_file.write_text(
+                json.dumps({'sources_hash': sources_hash, 'applied': applied}, indent=1), encoding='utf-8')
+        except OSError:
+            pass  # Não falhar se não conseguir gravar o estado
+
     def apply_database_migrations(self, force: bool = False) -> bool:
         """Aplica migrações do banco de dados apenas quando necessário"""
         
@@ -539,9 +1343,13 @@ class SynQcoreManager:
         print("  💾 Atualizando banco", end="", flush=True)
         
         try:
+            # Development aponta para o synqcore_db do container, o mesmo banco consultado acima
+            env = os.environ.copy()
+            env.setdefault("ASPNETCORE_ENVIRONMENT", "Development")
             result = subprocess.run(
-                ["dotnet", "ef", "database", "update"],
-                cwd=self.api_dir, capture_output=True, text=True
+                ["dotnet", "ef", "database", "update",
+                 "--project", str(self.infrastructure_dir), "--startup-project", str(self.api_dir)],
+                cwd=self.api_dir, capture_output=True, text=True, env=env
             )
             print(" ✅")
             
@@ -552,19 +1360,263 @@ class SynQcoreManager:
             
             self.print_success("Migrações aplicadas!")
             
-            # Criar arquivo marker indicando que migrações foram aplicadas
-            try:
-                migrations_marker = self.root_dir / ".migrations_applied"
-                migrations_marker.touch()
-            except Exception:
-                pass  # Não falhar se não conseguir criar o marker
-                
+            local_ids, sources_hash = self.local_migrations()
+            self.save_migrations_state(sources_hash, self.applied_migrations() or local_ids)
             return True
             
         except Exception as e:
             self.print_warning(f"Aviso nas migrações: {e}")
             return True  # Não falhar por causa das migrações
 
+    def list_db_snapshots(self) -> Dict[str, int]:
+        """Snapshots existentes (nome -> bytes)"""
+        result = self.psql(
+            f"SELECT substr(datname, {len(SNAPSHOT_PREFIX) + 1}), pg_database_size(datname) FROM pg_database "
+            f"WHERE datname LIKE '{SNAPSHOT_PREFIX}%' ORDER BY 1", database="postgres")
+        snapshots = {}
+        for line in result.stdout.splitlines():
+            name, _, size = line.partition('|')
+            if name:
+                snapshots[name] = int(size or 0)
+        return snapshots
+
+    def clone_database(self, source: str, target: str, drop_target: bool) -> subprocess.CompletedProcess:
+        """
+        CREATE DATABASE TEMPLATE source em um banco temporário, renomeado para target ao final.
+
+        O template não pode ter conexões abertas: novas conexões ao banco de origem
+        são bloqueadas e as existentes (pool da API) encerradas durante a cópia.
+        O destino só é removido depois que a cópia termina, então uma falha não o perde.
+        """
+        block = [f'ALTER DATABASE "{source}" WITH ALLOW_CONNECTIONS false',
+                 f"SELECT count(pg_terminate_backend(pid)) FROM pg_stat_activity "
+                 f"WHERE datname IN ('{source}', '{target}') AND pid <> pg_backend_pid()",
+                 f'DROP DATABASE IF EXISTS "{CLONE_TEMP_DATABASE}" WITH (FORCE)']
+        try:
+            result = self.psql(block, database="postgres")
+            if result.returncode != 0:
+                return result
+            result = self.psql(f'CREATE DATABASE "{CLONE_TEMP_DATABASE}" WITH TEMPLATE "{source}"',
+                               database="postgres", timeout=600)
+            if result.returncode != 0:
+                return result
+            
+            swap = []
+            if drop_target:
+                exists = self.psql(f"SELECT 1 FROM pg_database WHERE datname = '{target}'", database="postgres")
+                if exists.stdout.strip():
+                    # Snapshots são marcados como template, e templates não podem ser removidos
+                    swap += [f'ALTER DATABASE "{target}" IS_TEMPLATE false',
+                             f'DROP DATABASE "{target}" WITH (FORCE)']
+            swap.append(f'ALTER DATABASE "{CLONE_TEMP_DATABASE}" RENAME TO "{target}"')
+            # Em caso de falha a cópia fica em synqcore_clone_tmp (removida na próxima clonagem)
+            return self.psql(swap, database="postgres")
+        finally:
+            # Snapshots continuam fechados para conexões; o banco de trabalho volta a aceitá-las
+            if not source.startswith(SNAPSHOT_PREFIX):
+                self.psql(f'ALTER DATABASE "{source}" WITH ALLOW_CONNECTIONS true', database="postgres")
+
+    def db_snapshot(self, name: str = "default") -> bool:
+        """Salva o estado atual do synqcore_db como banco template no container"""
+        self.print_step("DB SNAPSHOT", f"Salvando {POSTGRES_DATABASE} como snapshot '{name}'")
+        if not SNAPSHOT_NAME_PATTERN.match(name):
+            self.print_error("Nome inválido: use letras minúsculas, números e _ (até 40 caracteres)")
+            return False
+        
+        try:
+            started = time.perf_counter()
+            snapshot = f"{SNAPSHOT_PREFIX}{name}"
+            result = self.clone_database(POSTGRES_DATABASE, snapshot, drop_target=True)
+            if result.returncode != 0:
+                self.print_error(f"Erro criando snapshot: {result.stderr.strip()}")
+                return False
+            self.psql(f'ALTER DATABASE "{snapshot}" WITH ALLOW_CONNECTIONS false IS_TEMPLATE true',
+                      database="postgres")
+            
+            size = self.list_db_snapshots().get(name, 0)
+            self.print_success(f"Snapshot '{name}' criado em {time.perf_counter() - started:.1f}s "
+                               f"({self.format_bytes(size)})")
+            print(f"  ♻️  Restaure com: python scripts/synqcore.py db-restore --name {name}")
+            return True
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            self.print_error(f"PostgreSQL do container indisponível: {e}")
+            return False
+
+    def db_restore(self, name: str = "default") -> bool:
+        """Recria o synqcore_db a partir de um snapshot e limpa o cache do Redis"""
+        self.print_step("DB RESTORE", f"Restaurando {POSTGRES_DATABASE} do snapshot '{name}'")
+        
+        try:
+            snapshots = self.list_db_snapshots()
+            if name not in snapshots:
+                self.print_error(f"Snapshot '{name}' não encontrado")
+                if snapshots:
+                    print(f"  📋 Disponíveis: {', '.join(snapshots)}")
+                return False
+            
+            started = time.perf_counter()
+            result = self.clone_database(f"{SNAPSHOT_PREFIX}{name}", POSTGRES_DATABASE, drop_target=True)
+            if result.returncode != 0:
+                self.print_error(f"Erro restaurando snapshot: {result.stderr.strip()}")
+                return False
+            
+            # Cache do feed e demais entradas apontariam para dados que não existem mais
+            subprocess.run(["docker", "exec", DOCKER_CONTAINERS['Redis'], "redis-cli", "FLUSHDB"],
+                           capture_output=True, text=True, timeout=10)
+            
+            self.print_success(f"Banco restaurado em {time.perf_counter() - started:.1f}s "
+                               f"({self.format_bytes(snapshots[name])}), cache do Redis limpo")
+            print("  💡 Conexões antigas do pool da API foram encerradas; o Npgsql reabre na próxima requisição")
+            return True
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            self.print_error(f"PostgreSQL do container indisponível: {e}")
+            return False
+
+    def seed_table_columns(self) -> Optional[Dict[Tuple[str, str], Dict[str, Tuple[str, bool]]]]:
+        """Colunas atuais de cada tabela (tipo e se precisam de valor) segundo o information_schema"""
+        result = self.psql("""SELECT table_schema, table_name, column_name, data_type,
+                                     is_nullable = 'NO' AND column_default IS NULL AND is_identity = 'NO'
+                              FROM information_schema.columns
+                              WHERE table_schema IN ('public', 'Communication')""")
+        if result.returncode != 0:
+            return None
+        columns: Dict[Tuple[str, str], Dict[str, Tuple[str, bool]]] = {}
+        for line in result.stdout.splitlines():
+            schema, table, column, data_type, required = line.split("|")
+            columns.setdefault((schema, table), {})[column] = (data_type, required == "t")
+        return columns
+
+    @staticmethod
+    def seed_fill_value(data_type: str):
+        """Valor neutro para colunas obrigatórias que o gerador não conhece (schema mais novo que o seed)"""
+        if data_type == "boolean":
+            return False
+        if data_type in ("integer", "bigint", "smallint", "numeric", "real", "double precision"):
+            return 0
+        if data_type.startswith("timestamp") or data_type == "date":
+            return seed_data.timestamp(seed_data.DATASET_END)
+        if data_type in ("json", "jsonb"):
+            return "{}"
+        return "n/a"  # Nunca "": no CSV do COPY um campo vazio sem aspas vira NULL
+
+    def copy_rows(self, schema: str, table: str, columns: List[str], rows) -> Tuple[int, Optional[str]]:
+        """Envia as linhas ao COPY ... FROM STDIN do psql no container, sem arquivo intermediário"""
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        command = ["docker", "exec", "-i", DOCKER_CONTAINERS['PostgreSQL'], "psql", "-U", POSTGRES_USER,
+                   "-d", POSTGRES_DATABASE, "-v", "ON_ERROR_STOP=1", "-c",
+                   f'COPY "{schema}"."{table}" ({column_list}) FROM STDIN WITH (FORMAT csv)']
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE, text=True, encoding="utf-8")
+        writer = csv.writer(process.stdin, lineterminator="\n")
+        count = 0
+        try:
+            for row in rows:
+                writer.writerow(["t" if v is True else "f" if v is False else v for v in row])
+                count += 1
+        except BrokenPipeError:
+            pass  # psql abortou o COPY; o motivo está no stderr
+        _, stderr = process.communicate()  # Fecha o stdin (fim do COPY) e aguarda o psql
+        return count, (stderr.strip() or f"psql saiu com código {process.returncode}") if process.returncode else None
+
+    def purge_seed_rows(self, dataset: seed_data.SyntheticDataset, tables: List[seed_data.SeedTable]):
+        """
+        Desfaz um seed interrompido: remove as linhas da semente nas tabelas já carregadas.
+
+        Cada COPY é atômico, mas o conjunto não; sem isso uma nova tentativa com a mesma
+        semente seria recusada como já carregada. As chaves estrangeiras (inclusive a
+        auto-referência RESTRICT de Comments) ficam suspensas só nesta transação.
+        """
+        if not tables:
+            return
+        deletes = [f"""DELETE FROM "{t.schema}"."{t.name}" WHERE "Id"::text LIKE '{dataset.uuid(t.name, 0)[:-12]}%';"""
+                   for t in reversed(tables)]
+        result = self.psql(f"BEGIN; SET LOCAL session_replication_role = replica; {' '.join(deletes)} COMMIT;",
+                           timeout=600)
+        if result.returncode == 0:
+            self.print_warning(f"Seed parcial desfeito em {len(tables)} tabela(s); corrija o erro e repita o seed")
+        else:
+            self.print_warning(f"Falha desfazendo o seed parcial: {result.stderr.strip()}")
+
+    def seed_database(self, scale: float = 1.0, seed: int = 42) -> bool:
+        """Carrega um dataset corporativo sintético e determinístico no synqcore_db via COPY"""
+        self.print_step("SEED", f"Gerando dataset sintético (escala {scale:g}, semente {seed})")
+        if scale <= 0:
+            self.print_error("A escala deve ser maior que zero")
+            return False
+
+        dataset = seed_data.SyntheticDataset(scale, seed)
+        try:
+            columns = self.seed_table_columns()
+            if columns is None:
+                self.print_error("PostgreSQL do container indisponível; execute docker-up e migrate antes do seed")
+                return False
+
+            missing = [t.name for t in dataset.tables() if (t.schema, t.name) not in columns]
+            if missing:
+                self.print_error(f"Tabelas ausentes ({', '.join(missing)}); aplique as migrações antes do seed")
+                return False
+
+            first_employee = dataset.uuid('Employees', 0)
+            if self.psql(f"""SELECT 1 FROM "Employees" WHERE "Id" = '{first_employee}'""").stdout.strip():
+                self.print_error(f"Dataset da semente {seed} já carregado; use db-restore ou outra --seed")
+                return False
+
+            # Name é único em Tags e KnowledgeCategories: evitar os nomes já cadastrados
+            tags = self.psql('SELECT "Name" FROM "Communication"."Tags"').stdout.splitlines()
+            categories = self.psql('SELECT "Name" FROM "Communication"."KnowledgeCategories"').stdout.splitlines()
+            dataset.prepare(set(tags), set(categories))
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            self.print_error(f"PostgreSQL do container indisponível: {e}")
+            return False
+
+        report = []
+        loaded: List[seed_data.SeedTable] = []
+        started = time.perf_counter()
+        for table in dataset.tables():
+            known = columns[(table.schema, table.name)]
+            rows = table.rows()
+            first = next(rows, None)
+            if first is None:
+                continue
+
+            # O schema das migrações manda: colunas removidas são ignoradas, novas obrigatórias são preenchidas
+            dropped = [c for c in first if c not in known]
+            if dropped:
+                self.print_warning(f"{table.name}: colunas inexistentes no banco ignoradas ({', '.join(dropped)})")
+            generated = [c for c in first if c in known]
+            filled = {c: self.seed_fill_value(data_type) for c, (data_type, required) in known.items()
+                      if required and c not in first}
+
+            def values(rows=rows, first=first, generated=generated, extra=list(filled.values())):
+                yield [first[c] for c in generated] + extra
+                for row in rows:
+                    yield [row[c] for c in generated] + extra
+
+            table_started = time.perf_counter()
+            count, error = self.copy_rows(table.schema, table.name, generated + list(filled), values())
+            elapsed = time.perf_counter() - table_started
+            if error:
+                self.print_error(f"COPY em {table.name} falhou: {error}")
+                self.purge_seed_rows(dataset, loaded)
+                return False
+            loaded.append(table)
+            report.append((table.name, count, elapsed))
+            print(f"  📥 {table.name:<22} {count:>10,} linhas  {elapsed:7.2f}s  {count / elapsed:>10,.0f} linhas/s")
+
+        # Contadores desnormalizados e estatísticas do planner refletindo o novo volume
+        for label, sql in seed_data.COUNTER_UPDATES:
+            result = self.psql(sql.format(prefix=seed_data.SEED_ID_PREFIX), timeout=600)
+            if result.returncode != 0:
+                self.print_warning(f"Falha atualizando {label}: {result.stderr.strip()}")
+        self.psql("ANALYZE", timeout=600)
+
+        total_rows = sum(count for _, count, _ in report)
+        copy_seconds = sum(elapsed for _, _, elapsed in report)
+        self.print_success(f"{total_rows:,} linhas em {time.perf_counter() - started:.1f}s "
+                           f"({total_rows / copy_seconds:,.0f} linhas/s no COPY)")
+        print(f"  ♻️  Salve o estado com: python scripts/synqcore.py db-snapshot --name seed_{seed}")
+        return True
+
     def start_api_service(self) -> subprocess.Popen:
         """Inicia o serviço da API"""
         self.print_step("API", "Iniciando SynQcore API na porta 5000")
@@ -580,11 +1632,13 @@ class SynQcoreManager:
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            bufsize=1,
-            universal_newlines=True
+            bufsize=1
         )
         print(" ✅")
         
+        # Sem leitor, um pipe cheio travaria a API; a saída fica no buffer e em .synqcore/logs/api.log
+        self.watch_ready_output("api", process.stdout)
+        self.process_sources[process.pid] = "api"
         self.running_processes.append(process)
         return process
 
@@ -607,23 +1661,22 @@ class SynQcoreManager:
         print(f"    🌐 URL: {env['ASPNETCORE_URLS']}")
         
         try:
-            # Usar o mesmo método que funciona manualmente
+            # Saída lida por uma thread: ecoada no terminal e observada para a prontidão
+            self.launch_times['blazor'] = time.monotonic()
             process = subprocess.Popen(
                 ["dotnet", "run", "--urls", "http://localhost:5226"],
                 cwd=str(self.blazor_dir),  # Definir working directory
                 env=env,
-                # Não capturar output para evitar deadlock
-                stdout=None,
-                stderr=None
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
             )
             print(" ✅")
             
-            # Aguardar um pouco e verificar se o processo está vivo
-            time.sleep(3)  # Dar mais tempo para inicialização
-            if process.poll() is not None:
-                self.print_error("Processo Blazor falhou ao iniciar")
-                return None
-            
+            self.watch_ready_output("blazor", process.stdout, echo=True)
+            self.process_sources[process.pid] = "blazor"
+            self.services["blazor"].process = process
             self.running_processes.append(process)
             print(f"    ✅ Processo iniciado (PID: {process.pid})")
             return process
@@ -631,63 +1684,203 @@ class SynQcoreManager:
         except Exception as e:
             self.print_error(f"Erro ao iniciar Blazor: {e}")
             return None
-        return process
+
+    def watch_ready_output(self, service_name: str, stream, echo: bool = False) -> threading.Event:
+        """Drena a saída de um serviço pelo multiplexador e sinaliza quando o Kestrel começa a escutar"""
+        signal_event = threading.Event()
+        self.ready_signals[service_name] = signal_event
+        
+        def on_line(line: str):
+            if not signal_event.is_set() and READY_LOG_MARKER in line:
+                signal_event.set()
+        
+        self.logs.attach(service_name, stream, echo=echo, on_line=on_line)
+        return signal_event
+
+    def print_recent_logs(self, source: str, lines: int = 20):
+        """Mostra as últimas linhas capturadas de um serviço (diagnóstico de falhas)"""
+        recent = self.logs.tail(source, lines)
+        if not recent:
+            return
+        print(f"  📜 Últimas {len(recent)} linhas de [{source}]:")
+        for line in recent:
+            print(f"     {line}")
+        if self.logs.log_dir is not None:
+            print(f"  📁 Log completo: {self.logs.log_dir / f'{source}.log'}")
+
+    def probe_service_ready(self, service_name: str, service: ServiceConfig) -> bool:
+        """Uma sonda HTTP de prontidão"""
+        try:
+            response = requests.get(f"{service.url}{service.ready_endpoint}", timeout=2)
+        except requests.RequestException:
+            return False
+        
+        # API: /health/ready precisa responder 200; Blazor: qualquer resposta HTTP que não seja erro do servidor
+        if service_name == "api":
+            return response.status_code == 200
+        return response.status_code < 500
 
     def wait_for_service_health(self, service_name: str, timeout: int = 60) -> bool:
-        """Aguarda um serviço ficar saudável"""
+        """
+        Aguarda um serviço ficar pronto.
+
+        A saída do serviço (processo local ou `docker logs -f` do container) é
+        acompanhada em busca do "Now listening on" do Kestrel; em paralelo, o
+        endpoint de prontidão é sondado com backoff exponencial. A linha de log
+        acorda a espera na hora, e a primeira sonda bem-sucedida define o tempo até ficar pronto.
+        """
         service = self.services.get(service_name)
         if not service:
             return False
         
         self.print_step("AGUARDANDO", f"{service.name} inicializar...")
+        started = time.monotonic()
+        launched = self.launch_times.get(service_name, started)
         
-        for attempt in range(timeout):
+        # Container: seguir os logs apenas durante a espera
+        log_follower = None
+        signal_event = self.ready_signals.get(service_name)
+        if signal_event is None and service.container:
+            # --since: só a saída desta execução (um "Now listening on" da anterior seria falso positivo)
+            since = time.time() - (started - launched)
             try:
-                response = requests.get(f"{service.url}{service.health_endpoint}", timeout=5)
-                
-                # Para API, aceitar apenas status 200
-                if service_name == "api" and response.status_code == 200:
-                    self.print_success(f"{service.name} pronto em {service.url}")
+                log_follower = subprocess.Popen(
+                    ["docker", "logs", "-f", "--since", f"{since:.3f}", service.container],
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+                )
+                signal_event = self.watch_ready_output(service_name, log_follower.stdout)
+            except FileNotFoundError:
+                signal_event = None
+        signal_event = signal_event or threading.Event()
+        
+        delay = 0.1
+        log_seen_at = None
+        last_progress = started
+        try:
+            while time.monotonic() - started < timeout:
+                if self.probe_service_ready(service_name, service):
+                    ready_at = time.monotonic()
+                    self.readiness_times[service_name] = ready_at - launched
+                    detail = f" (Kestrel escutando em {log_seen_at - launched:.1f}s)" if log_seen_at else ""
+                    self.print_success(f"{service.name} pronto em {service.url} "
+                                       f"após {ready_at - launched:.1f}s{detail}")
                     return True
                 
-                # Para Blazor, aceitar qualquer resposta HTTP válida ou conteúdo HTML
-                elif service_name == "blazor" and (
-                    response.status_code in [200, 302, 404] or 
-                    'html' in response.headers.get('content-type', '').lower() or
-                    'text/html' in response.headers.get('content-type', '') or
-                    b'<!DOCTYPE html>' in response.content[:100].lower()
-                ):
-                    self.print_success(f"{service.name} pronto em {service.url}")
-                    return True
-                    
-            except requests.RequestException as e:
-                # Para Blazor, tentar verificação de porta como fallback
-                if service_name == "blazor":
-                    if self.check_port_responding(service.port):
-                        self.print_success(f"{service.name} pronto em {service.url} (verificação de porta)")
-                        return True
+                if service.process is not None and service.process.poll() is not None:
+                    self.print_error(f"{service.name} finalizou durante a inicialização "
+                                     f"(código {service.process.returncode})")
+                    self.print_recent_logs(service_name)
+                    return False
                 
-                # Para debug, mostrar erro a cada 10 tentativas
-                if attempt % 10 == 0 and attempt > 0:
-                    print(f"    💭 Aguardando [{service_name}]: {service.url}{service.health_endpoint}")
-            
-            if attempt < timeout - 1:
-                # Indicador de progresso simples com pontinhos
-                dots = "." * (attempt % 4)
-                if attempt == 0:
-                    print(f"  ⏳ Conectando{dots}", end="", flush=True)
-                else:
-                    print(".", end="", flush=True)
+                if time.monotonic() - last_progress >= 15:
+                    last_progress = time.monotonic()
+                    print(f"    💭 Aguardando [{service_name}]: {service.url}{service.ready_endpoint} "
+                          f"({last_progress - started:.0f}s)")
                 
-                # A cada 15 segundos, mostrar progresso
-                if attempt > 0 and attempt % 15 == 0:
-                    print(f" ({attempt}s)", end="", flush=True)
+                # Espera interrompida pela linha de log; depois dela, sondar em ritmo curto
+                if log_seen_at is None and signal_event.wait(timeout=delay):
+                    log_seen_at = time.monotonic()
+                    delay = 0.05
+                    continue
+                if log_seen_at is not None:
+                    time.sleep(delay)
+                else:
+                    delay = min(delay * 2, 2.0)
+        finally:
+            if log_follower is not None:
+                log_follower.terminate()
+                self.ready_signals.pop(service_name, None)
+        
+        self.print_recent_logs(service_name)
+        return False
+
+    def resolve_api_workload(self, base_url: str) -> Tuple[Optional[Dict[str, str]], List[str]]:
+        """Autentica com o admin padrão e resolve os endpoints de WARMUP_ENDPOINTS (headers None se o login falhar)"""
+        try:
+            response = requests.post(f"{base_url}/api/auth/login", timeout=15, json={
+                "email": os.environ.get("TEST_EMAIL", "admin@synqcore.com"),
+                "password": os.environ.get("TEST_PASSWORD", "SynQcore@Admin123!"),
+            })
+            token = response.json().get("token") if response.status_code == 200 else None
+        except (requests.RequestException, ValueError):
+            token = None
+        if not token:
+            return None, []
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        endpoints = []
+        for endpoint in WARMUP_ENDPOINTS:
+            if "{department}" in endpoint:
+                try:
+                    items = requests.get(f"{base_url}/api/Departments?PageSize=1", headers=headers,
+                                         timeout=15).json().get("items") or []
+                except (requests.RequestException, ValueError, AttributeError):
+                    items = []
+                if not items:
+                    continue  # Sem departamentos não há hierarquia para exercitar
+                endpoint = endpoint.replace("{department}", str(items[0]["id"]))
+            endpoints.append(endpoint)
+        return headers, endpoints
+
+    def warm_up_api(self, base_url: str = "http://localhost:5005") -> bool:
+        """
+        Aquece a API recém-iniciada (JIT, modelo do EF Core, caches do Redis).
+
+        Cada rodada dispara os endpoints de WARMUP_ENDPOINTS em paralelo; o aquecimento
+        termina quando a mediana de todos varia menos que WARMUP_TOLERANCE entre rodadas.
+        """
+        if os.environ.get("SYNQCORE_WARMUP", "1") == "0":
+            return True
+        self.print_step("AQUECIMENTO", f"{len(WARMUP_ENDPOINTS)} endpoints até a latência estabilizar")
+        
+        headers, endpoints = self.resolve_api_workload(base_url)
+        if headers is None:
+            self.print_warning("Login do aquecimento falhou; endpoints autenticados continuarão frios")
+            return False
+        if not endpoints:
+            self.print_warning("Nenhum endpoint de aquecimento disponível")
+            return False
+        
+        def timed_get(endpoint: str) -> Tuple[str, float, int]:
+            started = time.perf_counter()
+            try:
+                status = requests.get(f"{base_url}{endpoint}", headers=headers, timeout=30).status_code
+            except requests.RequestException:
+                status = 0
+            return endpoint, (time.perf_counter() - started) * 1000, status
+        
+        rounds: Dict[str, List[float]] = {e: [] for e in endpoints}
+        statuses: Dict[str, int] = {}
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(endpoints) * WARMUP_CONCURRENCY or 1) as pool:
+            for round_number in range(1, WARMUP_MAX_ROUNDS + 1):
+                samples: Dict[str, List[float]] = {e: [] for e in endpoints}
+                for endpoint, elapsed, status in pool.map(timed_get, endpoints * WARMUP_CONCURRENCY):
+                    samples[endpoint].append(elapsed)
+                    statuses[endpoint] = status
+                for endpoint, values in samples.items():
+                    rounds[endpoint].append(sorted(values)[len(values) // 2])
                 
-                time.sleep(1)
+                stable = round_number >= 3 and all(
+                    abs(medians[-1] - medians[-2]) <= max(WARMUP_TOLERANCE * medians[-2], WARMUP_JITTER_MS)
+                    for medians in rounds.values())
+                if stable:
+                    break
         
-        print()  # Nova linha após tentativas
+        print(f"  {'Endpoint':<48} {'Frio':>9} {'Quente':>9} {'Ganho':>7}  Status")
+        for endpoint, medians in rounds.items():
+            cold, warm = medians[0], medians[-1]
+            status = statuses.get(endpoint, 0)
+            color = Colors.GREEN if 200 <= status < 300 else Colors.WARNING
+            print(f"  {endpoint[:48]:<48} {cold:7.0f}ms {warm:7.0f}ms {cold / max(warm, 0.1):6.1f}x  "
+                  f"{color}{status or 'erro'}{Colors.ENDC}")
         
-        return False
+        elapsed = time.perf_counter() - started
+        if stable:
+            self.print_success(f"Latência estável após {round_number} rodadas ({elapsed:.1f}s)")
+        else:
+            self.print_warning(f"Latência ainda variando após {WARMUP_MAX_ROUNDS} rodadas ({elapsed:.1f}s)")
+        return True
 
     def open_browser_urls(self, urls: List[str]):
         """Abre URLs no navegador padrão"""
@@ -704,7 +1897,7 @@ class SynQcoreManager:
                 self.print_warning(f"Não foi possível abrir {url}: {e}")
 
     def monitor_services(self):
-        """Monitora os serviços em execução"""
+        """Monitora os serviços em execução (com painel ao vivo quando a saída é um terminal)"""
         print(f"\n{Colors.CYAN}{Colors.BOLD}🎯 MONITORAMENTO DE SERVIÇOS{Colors.ENDC}")
         print("=" * 60)
         print("📊 URLs disponíveis:")
@@ -717,6 +1910,12 @@ class SynQcoreManager:
         print(f"\n{Colors.WARNING}Pressione Ctrl+C para parar todos os serviços{Colors.ENDC}")
         print("=" * 60)
         
+        dashboard = None
+        if DASHBOARD_ENABLED and sys.stdout.isatty():
+            dashboard = LiveDashboard(self)
+            dashboard.start()
+            self.logs.echo_paused = True
+        
         try:
             while True:
                 # Verificar se processos ainda estão rodando
@@ -725,16 +1924,30 @@ class SynQcoreManager:
                     if process.poll() is None:
                         active_processes.append(process)
                     else:
+                        if dashboard is not None:
+                            dashboard.stop()
+                            dashboard = None
+                            self.logs.echo_paused = False
                         self.print_warning(f"Processo finalizou com código: {process.returncode}")
+                        self.print_recent_logs(self.process_sources.get(process.pid, ""))
                 
                 if not active_processes:
                     self.print_error("Todos os processos finalizaram!")
                     break
+                self.running_processes = active_processes  # Processos finalizados são reportados uma vez
                 
-                time.sleep(5)
+                if dashboard is not None:
+                    dashboard.render(active_processes)
+                    time.sleep(DASHBOARD_REFRESH)
+                else:
+                    time.sleep(5)
                 
         except KeyboardInterrupt:
             print(f"\n{Colors.CYAN}Recebido sinal de interrupção. Finalizando serviços...{Colors.ENDC}")
+        finally:
+            if dashboard is not None:
+                dashboard.stop()
+            self.logs.echo_paused = False
 
     def cleanup_handler(self, signum, frame):
         """Handler para limpeza quando recebe sinal de interrupção"""
@@ -815,47 +2028,15 @@ class SynQcoreManager:
         except Exception:
             pass  # Falha silenciosa se não conseguir verificar
 
-    def check_system_integrity(self):
-        """Verifica a integridade completa do sistema SynQcore"""
-        print(f"\n{Colors.CYAN}🔍 VERIFICANDO INTEGRIDADE DO SISTEMA SYNQCORE{Colors.ENDC}")
-        print("=" * 60)
-        
-        all_checks_passed = True
-        
-        # 1. Verificar pré-requisitos do sistema
-        print(f"\n{Colors.WARNING}📋 Verificando pré-requisitos:{Colors.ENDC}")
-        
-        # .NET SDK
-        try:
-            result = subprocess.run(["dotnet", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                print(f"  ✅ .NET SDK: {version}")
-            else:
-                print(f"  ❌ .NET SDK: Não encontrado")
-                all_checks_passed = False
-        except Exception:
-            print(f"  ❌ .NET SDK: Erro na verificação")
-            all_checks_passed = False
-            
-        # Docker
-        try:
-            result = subprocess.run(["docker", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                print(f"  ✅ Docker: {version}")
-            else:
-                print(f"  ❌ Docker: Não encontrado")
-                all_checks_passed = False
-        except Exception:
-            print(f"  ❌ Docker: Erro na verificação")
-            all_checks_passed = False
-            
-        # Python
-        print(f"  ✅ Python: {sys.version.split()[0]}")
-        
-        # 2. Verificar estrutura de arquivos
-        print(f"\n{Colors.WARNING}📁 Verificando estrutura de arquivos:{Colors.ENDC}")
+    def check_system_integrity(self, as_json: bool = False) -> bool:
+        """
+        Verifica a integridade completa do sistema SynQcore.
+
+        Pré-requisitos, arquivos críticos, containers e endpoints são sondados em
+        paralelo, uma única vez cada, com a latência de cada sonda. Com `as_json`,
+        imprime apenas o resultado em JSON (para scripts e CI).
+        """
+        started = time.perf_counter()
         
         critical_files = [
             ("SynQcore.sln", "Solução principal"),
@@ -864,82 +2045,108 @@ class SynQcoreManager:
             ("docker/docker-compose.yml", "Configuração Docker"),
             ("src/SynQcore.Infrastructure/Data/SynQcoreDbContext.cs", "Context do banco"),
         ]
-        
-        for file_path, description in critical_files:
-            full_path = self.root_dir / file_path
-            if full_path.exists():
-                print(f"  ✅ {description}: {file_path}")
-            else:
-                print(f"  ❌ {description}: {file_path} (não encontrado)")
-                all_checks_passed = False
-        
-        # 3. Verificar containers Docker
-        print(f"\n{Colors.WARNING}🐳 Verificando containers Docker:{Colors.ENDC}")
-        try:
-            result = subprocess.run(
-                ["docker", "ps", "-a", "--format", "{{.Names}}\t{{.Status}}"],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            if result.returncode == 0:
-                containers = result.stdout.strip().split('\n')
-                required_containers = ['synqcore-postgres', 'synqcore-redis', 'synqcore-pgadmin']
-                
-                for container_name in required_containers:
-                    found = any(container_name in line for line in containers if line.strip())
-                    if found:
-                        status_line = next((line for line in containers if container_name in line), "")
-                        if "Up" in status_line:
-                            print(f"  🟢 {container_name}: Rodando")
-                        else:
-                            print(f"  🟡 {container_name}: Parado")
-                    else:
-                        print(f"  ❌ {container_name}: Não encontrado")
-                        
-            else:
-                print(f"  ⚠️  Não foi possível verificar containers")
-                
-        except Exception as e:
-            print(f"  ❌ Erro ao verificar Docker: {e}")
-            
-        # 4. Verificar conectividade de rede
-        print(f"\n{Colors.WARNING}🌐 Verificando conectividade:{Colors.ENDC}")
-        
         endpoints = [
             ("http://localhost:5005/health", "API Health"),
             ("http://localhost:5226", "Blazor App"),
             ("http://localhost:8080", "pgAdmin"),
         ]
         
-        print("  🌐 Testando conexões", end="", flush=True)
-        for url, name in endpoints:
+        def timed(category: str, name: str, probe) -> List[Dict]:
+            """Executa uma sonda e anota a latência; sondas podem devolver vários resultados"""
+            probe_started = time.perf_counter()
             try:
-                response = requests.get(url, timeout=5)
-                if response.status_code < 400:
-                    print(".", end="", flush=True)
-                else:
-                    print("!", end="", flush=True)
-            except requests.exceptions.ConnectionError:
-                print("x", end="", flush=True)
+                results = probe()
             except Exception as e:
-                print("?", end="", flush=True)
-        print("")
+                results = [{'name': name, 'status': 'fail', 'detail': f"erro na verificação: {e}"}]
+            latency = round((time.perf_counter() - probe_started) * 1000, 1)
+            return [{'category': category, 'latency_ms': latency, **result} for result in results]
+        
+        def prerequisites() -> List[Dict]:
+            # .NET SDK, Docker e Compose (mesmas sondas do check_prerequisites)
+            probes = self.probe_prerequisites()
+            docker = probes['docker']
+            if probes['compose_plugin']['ok']:
+                compose = {'status': 'ok', 'detail': f"{probes['compose_plugin']['version']} (plugin)"}
+            elif probes['compose_standalone']['ok']:
+                compose = {'status': 'ok', 'detail': probes['compose_standalone']['version']}
+            else:
+                compose = {'status': 'fail', 'detail': "não encontrado"}
+            return [
+                {'name': ".NET SDK", 'status': 'ok' if probes['dotnet']['ok'] else 'fail',
+                 'detail': probes['dotnet']['version'] if probes['dotnet']['ok'] else "não encontrado"},
+                {'name': "Docker", 'status': 'ok' if docker['ok'] else 'fail',
+                 'detail': docker['version'] if docker['ok'] else
+                 f"{docker.get('version') or 'instalado'} (daemon não está rodando)" if docker['found'] else "não encontrado"},
+                {'name': "Docker Compose", **compose},
+                {'name': "Python", 'status': 'ok', 'detail': sys.version.split()[0]},
+            ]
+        
+        def critical_file(file_path: str, description: str) -> List[Dict]:
+            exists = (self.root_dir / file_path).exists()
+            return [{'name': description, 'status': 'ok' if exists else 'fail',
+                     'detail': file_path if exists else f"{file_path} (não encontrado)"}]
         
-        # Mostrar resultados detalhados
-        for url, name in endpoints:
+        def containers() -> List[Dict]:
+            # Um único docker inspect para todos os containers do ambiente
+            states = self.inspect_containers(list(DOCKER_CONTAINERS.values()))
+            results = []
+            for name in DOCKER_CONTAINERS.values():
+                state = states.get(name)
+                if state is None:
+                    results.append({'name': name, 'status': 'fail', 'detail': "não encontrado"})
+                elif state['status'] != 'running':
+                    results.append({'name': name, 'status': 'warn', 'detail': f"parado ({state['status']})"})
+                elif state['health'] and state['health'] != 'healthy':
+                    results.append({'name': name, 'status': 'warn', 'detail': f"rodando ({state['health']})"})
+                else:
+                    results.append({'name': name, 'status': 'ok', 'detail': "rodando"})
+            return results
+        
+        def endpoint(url: str, name: str) -> List[Dict]:
             try:
                 response = requests.get(url, timeout=5)
-                if response.status_code < 400:
-                    print(f"  🟢 {name}: Acessível ({response.status_code})")
-                else:
-                    print(f"  🟡 {name}: Resposta {response.status_code}")
             except requests.exceptions.ConnectionError:
-                print(f"  🔴 {name}: Não acessível")
-            except Exception as e:
-                print(f"  ⚠️  {name}: Erro na verificação")
+                return [{'name': name, 'url': url, 'status': 'fail', 'detail': "não acessível"}]
+            status = 'ok' if response.status_code < 400 else 'warn'
+            return [{'name': name, 'url': url, 'status': status, 'detail': f"resposta {response.status_code}"}]
+        
+        with ThreadPoolExecutor(max_workers=len(critical_files) + len(endpoints) + 2) as pool:
+            futures = [pool.submit(timed, "prerequisites", "Pré-requisitos", prerequisites)]
+            futures += [pool.submit(timed, "files", description, lambda f=f, d=description: critical_file(f, d))
+                        for f, description in critical_files]
+            futures.append(pool.submit(timed, "containers", "Containers", containers))
+            futures += [pool.submit(timed, "connectivity", name, lambda u=url, n=name: endpoint(u, n))
+                        for url, name in endpoints]
+            checks = [check for future in futures for check in future.result()]
+        
+        # Containers e endpoints são informativos (o ambiente pode estar parado); pré-requisitos e arquivos não
+        all_checks_passed = all(check['status'] == 'ok' for check in checks
+                                if check['category'] in ("prerequisites", "files"))
+        elapsed = round((time.perf_counter() - started) * 1000, 1)
+        
+        if as_json:
+            print(json.dumps({'ok': all_checks_passed, 'elapsed_ms': elapsed, 'checks': checks},
+                             indent=2, ensure_ascii=False))
+            return all_checks_passed
+        
+        print(f"\n{Colors.CYAN}🔍 VERIFICANDO INTEGRIDADE DO SISTEMA SYNQCORE{Colors.ENDC}")
+        print("=" * 60)
+        
+        sections = [
+            ("prerequisites", "📋 Verificando pré-requisitos:", {'ok': "✅", 'warn': "⚠️ ", 'fail': "❌"}),
+            ("files", "📁 Verificando estrutura de arquivos:", {'ok': "✅", 'warn': "⚠️ ", 'fail': "❌"}),
+            ("containers", "🐳 Verificando containers Docker:", {'ok': "🟢", 'warn': "🟡", 'fail': "❌"}),
+            ("connectivity", "🌐 Verificando conectividade:", {'ok': "🟢", 'warn': "🟡", 'fail': "🔴"}),
+        ]
+        for category, title, icons in sections:
+            print(f"\n{Colors.WARNING}{title}{Colors.ENDC}")
+            for check in checks:
+                if check['category'] == category:
+                    print(f"  {icons[check['status']]} {check['name']}: {check['detail']} "
+                          f"{Colors.BLUE}({check['latency_ms']:.0f}ms){Colors.ENDC}")
         
-        # 5. Resumo final
-        print(f"\n{Colors.WARNING}📊 RESUMO DA VERIFICAÇÃO:{Colors.ENDC}")
+        # Resumo final
+        print(f"\n{Colors.WARNING}📊 RESUMO DA VERIFICAÇÃO:{Colors.ENDC} {len(checks)} verificações em {elapsed / 1000:.1f}s")
         if all_checks_passed:
             print(f"  🎉 {Colors.GREEN}Sistema íntegro - Todos os componentes OK{Colors.ENDC}")
             print(f"  💡 Execute: {Colors.CYAN}./synqcore start{Colors.ENDC} para iniciar")
@@ -948,26 +2155,37 @@ class SynQcoreManager:
             print(f"  💡 Execute: {Colors.CYAN}./synqcore docker-up{Colors.ENDC} para configurar infraestrutura")
             
         print("=" * 60)
+        return all_checks_passed
 
     def restart_api_container(self) -> bool:
         """Reinicia apenas o container da API (para recompilações)"""
         try:
             self.print_step("REINICIANDO", "Container da API")
             
-            # Parar e remover container da API
-            subprocess.run(["docker", "stop", "synqcore-api"], capture_output=True)
-            subprocess.run(["docker", "rm", "synqcore-api"], capture_output=True)
+            replicas = self.api_replicas()
+            if replicas:
+                # Modo escalado: recria as réplicas pelo compose (mantém o override e o número de réplicas)
+                command = self.compose_command("up", "-d", "--force-recreate", "api")
+            else:
+                # Parar e remover container da API
+                subprocess.run(["docker", "stop", "synqcore-api"], capture_output=True)
+                subprocess.run(["docker", "rm", "synqcore-api"], capture_output=True)
+                command = self.compose_command("up", "-d", "api")
             
             # Reiniciar apenas a API
-            result = subprocess.run(["docker-compose", "up", "-d", "api"], 
-                                  cwd=self.docker_dir, capture_output=True, text=True)
+            self.launch_times['api'] = time.monotonic()
+            result = subprocess.run(command, cwd=self.docker_dir, capture_output=True, text=True)
             
             if result.returncode != 0:
                 self.print_error(f"Erro reiniciando API: {result.stderr}")
                 return False
+            
+            if replicas:
+                self.reload_api_balancer()
                 
             # Aguardar API ficar pronta
             if self.wait_for_service_health("api", timeout=30):
+                self.warm_up_api()
                 return True
                 
             self.print_warning("API reiniciada mas health check falhou")
@@ -977,20 +2195,523 @@ class SynQcoreManager:
             self.print_error(f"Erro reiniciando API: {e}")
             return False
 
+    @staticmethod
+    def postgres_tuning(cpus: float, memory_mb: int, max_connections: int) -> Dict[str, str]:
+        """Parâmetros do PostgreSQL para o tamanho do container (fórmulas do pgtune, perfil web)"""
+        workers = max(1, math.ceil(cpus))
+        per_gather = min(4, math.ceil(workers / 2)) if workers >= 2 else 0
+        shared_buffers = memory_mb // 4
+        work_mem_kb = (memory_mb - shared_buffers) * 1024 // (max_connections * 3) // max(per_gather, 1)
+        return {
+            'max_connections': str(max_connections),
+            'shared_buffers': f"{shared_buffers}MB",
+            'effective_cache_size': f"{memory_mb * 3 // 4}MB",
+            'maintenance_work_mem': f"{min(memory_mb // 16, 2048)}MB",
+            'work_mem': f"{max(work_mem_kb, 64)}kB",
+            'wal_buffers': f"{max(32, min(shared_buffers * 1024 * 3 // 100, 16384))}kB",
+            'checkpoint_completion_target': '0.9',
+            'default_statistics_target': '100',
+            'random_page_cost': '1.1',
+            'effective_io_concurrency': '200',
+            'max_worker_processes': str(max(workers, 2)),
+            'max_parallel_workers': str(workers),
+            'max_parallel_workers_per_gather': str(per_gather),
+            'max_parallel_maintenance_workers': str(per_gather),
+        }
+
+    def write_profile_override(self, size: str) -> Dict[str, str]:
+        """Gera .synqcore/compose-profile.yml com limites de CPU/memória e o command recalculado do PostgreSQL"""
+        profile = PRODUCTION_PROFILES[size]
+        pg_cpus, pg_memory = profile['postgres']
+        tuning = self.postgres_tuning(pg_cpus, pg_memory, profile['max_connections'])
+        redis_cpus, redis_memory = profile['redis']
+        api_cpus, api_memory = profile['api']
+        
+        lines = [
+            f"# Gerado por synqcore.py profile --size {size} (não editar; `profile --size off` remove)",
+            "services:",
+        ]
+        for service, (cpus, memory) in (("api", profile['api']), ("postgres", profile['postgres']),
+                                        ("redis", profile['redis'])):
+            lines += [f"  {service}:", f"    cpus: {cpus}", f"    mem_limit: {memory}m", f"    memswap_limit: {memory}m"]
+            if service == "api":
+                lines += ["    environment:", f"      SYNQCORE_PROFILE: {size}"]
+            elif service == "postgres":
+                # /dev/shm padrão (64MB) é pequeno para hash joins paralelos com o work_mem recalculado
+                lines += [f"    shm_size: {max(64, pg_memory // 8)}m", "    command: >", "      postgres"]
+                lines += [f"      -c {name}={value}" for name, value in tuning.items()]
+            else:
+                # maxmemory do redis.conf (512mb) excederia o limite do container nos perfis menores
+                lines.append(f'    command: ["redis-server", "/usr/local/etc/redis/redis.conf", '
+                             f'"--maxmemory", "{redis_memory * 3 // 4}mb"]')
+        
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.profile_compose_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return tuning
+
+    def apply_production_profile(self, size: str) -> bool:
+        """Recria API, PostgreSQL e Redis com os limites do perfil de produção (ou sem limites com 'off')"""
+        if size == "off":
+            self.print_step("PROFILE", "Removendo limites de produção")
+            self.profile_compose_file.unlink(missing_ok=True)
+            tuning = None
+        else:
+            cpus = sum(PRODUCTION_PROFILES[size][service][0] for service in ("api", "postgres", "redis"))
+            memory = sum(PRODUCTION_PROFILES[size][service][1] for service in ("api", "postgres", "redis"))
+            self.print_step("PROFILE", f"Perfil de produção '{size}': {cpus:g} CPUs e {memory} MB no total")
+            tuning = self.write_profile_override(size)
+        
+        try:
+            # No modo escalado (scale) os limites valem para cada réplica; o balanceador sobe junto
+            scaled = self.api_replicas() > 0
+            services = ["postgres", "redis", "api"] + (["api-lb"] if scaled else [])
+            self.launch_times['api'] = time.monotonic()
+            result = subprocess.run(self.compose_command("up", "-d", "--remove-orphans", *services),
+                                    cwd=self.docker_dir, capture_output=True, text=True, timeout=600)
+            if result.returncode != 0:
+                self.print_error(f"Erro aplicando o perfil: {result.stderr.strip()}")
+                return False
+            if scaled:
+                self.reload_api_balancer()
+            
+            containers = {label: DOCKER_CONTAINERS[label] for label in ("PostgreSQL", "Redis")}
+            containers.update(self.api_containers())
+            if not all(self.wait_for_containers(containers, timeout=180).values()):
+                self.print_warning("Nem todos os containers ficaram prontos com o perfil")
+            
+            # Conferir o que o Docker e o PostgreSQL realmente aplicaram
+            inspect = subprocess.run(
+                ["docker", "inspect", "--format", "{{.Name}}|{{.HostConfig.NanoCpus}}|{{.HostConfig.Memory}}"]
+                + list(containers.values()), capture_output=True, text=True, timeout=10)
+            print(f"  {'Container':<20} {'CPUs':>6} {'Memória':>10}")
+            for line in inspect.stdout.splitlines():
+                name, nano_cpus, memory = line.lstrip("/").split("|")
+                cpus_text = f"{int(nano_cpus) / 1e9:g}" if int(nano_cpus) else "host"
+                memory_text = self.format_bytes(int(memory)) if int(memory) else "host"
+                print(f"  {name:<20} {cpus_text:>6} {memory_text:>10}")
+            
+            if tuning:
+                names = ", ".join(f"'{name}'" for name in tuning)
+                settings = self.psql(f"SELECT name, setting, coalesce(unit, '') FROM pg_settings WHERE name IN ({names})")
+                if settings.returncode == 0:
+                    print("  🐘 PostgreSQL:")
+                    for line in settings.stdout.splitlines():
+                        name, value, unit = line.split("|")
+                        print(f"     {name:<34} {value} {unit}".rstrip())
+                self.print_success(f"Perfil '{size}' ativo; start, docker-up e scale mantêm os limites "
+                                   f"até `profile --size off`")
+            else:
+                self.print_success("Containers recriados sem limites de recursos")
+            return True
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            self.print_error(f"Erro aplicando o perfil: {e}")
+            return False
+
+    def set_fault_toxics(self, latency: float = 0, jitter: float = 0, bandwidth: int = 0,
+                         reset_rate: float = 0, target: str = "all") -> bool:
+        """
+        Substitui os toxics dos proxies do PostgreSQL e do Redis.
+
+        `latency` é somado a cada ida e volta (aplicado nas respostas), `bandwidth`
+        limita KB/s nos dois sentidos e `reset_rate` é a fração de conexões
+        encerradas com RST.
+        """
+        proxies = list(FAULT_PROXIES.values()) if target == "all" else [FAULT_PROXIES[target]]
+        toxics = []
+        if latency or jitter:
+            toxics.append({"name": "latency", "type": "latency", "stream": "downstream",
+                           "attributes": {"latency": int(latency), "jitter": int(jitter)}})
+        if bandwidth:
+            for stream in ("upstream", "downstream"):
+                toxics.append({"name": f"bandwidth_{stream}", "type": "bandwidth", "stream": stream,
+                               "attributes": {"rate": int(bandwidth)}})
+        if reset_rate:
+            toxics.append({"name": "reset", "type": "reset_peer", "stream": "downstream",
+                           "toxicity": reset_rate, "attributes": {"timeout": 0}})
+        
+        try:
+            # /reset remove os toxics e reabilita todos os proxies
+            requests.post(f"{TOXIPROXY_URL}/reset", timeout=5).raise_for_status()
+            for proxy in proxies:
+                for toxic in toxics:
+                    requests.post(f"{TOXIPROXY_URL}/proxies/{proxy}/toxics", json=toxic, timeout=5).raise_for_status()
+            return True
+        except requests.RequestException as e:
+            self.print_error(f"Toxiproxy indisponível em {TOXIPROXY_URL}: {e}")
+            return False
+
+    def configure_faults(self, latency: float = 0, jitter: float = 0, bandwidth: int = 0,
+                         reset_rate: float = 0, target: str = "all", off: bool = False) -> bool:
+        """Liga o proxy de falhas entre a API e PostgreSQL/Redis (ou remove com `off`) e aplica os toxics"""
+        try:
+            if off:
+                self.print_step("FAULTS", "Removendo o proxy: API volta a acessar PostgreSQL e Redis diretamente")
+                self.faults_state_file.unlink(missing_ok=True)
+                self.launch_times['api'] = time.monotonic()
+                result = subprocess.run(self.compose_command("up", "-d", "--remove-orphans", "api"),
+                                        cwd=self.docker_dir, capture_output=True, text=True, timeout=600)
+                if result.returncode != 0:
+                    self.print_error(f"Erro removendo o proxy: {result.stderr.strip()}")
+                    return False
+                return self.wait_for_service_health("api", timeout=90)
+            
+            self.print_step("FAULTS", f"Proxy para {target}: latência {latency:g}ms ± {jitter:g}ms, "
+                                      f"banda {bandwidth or 'ilimitada'} KB/s, resets {reset_rate:.0%}")
+            if not self.faults_state_file.exists():
+                self.state_dir.mkdir(parents=True, exist_ok=True)
+                self.faults_state_file.write_text(json.dumps({'enabled_at': time.time()}))
+                self.launch_times['api'] = time.monotonic()
+                result = subprocess.run(self.compose_command("up", "-d", "toxiproxy", "api"),
+                                        cwd=self.docker_dir, capture_output=True, text=True, timeout=600)
+                if result.returncode != 0:
+                    self.faults_state_file.unlink(missing_ok=True)
+                    self.print_error(f"Erro iniciando o proxy: {result.stderr.strip()}")
+                    return False
+                self.wait_for_containers({'Toxiproxy': 'synqcore-toxiproxy'}, timeout=60)
+                if not self.wait_for_service_health("api", timeout=90):
+                    return False
+            
+            if not self.set_fault_toxics(latency, jitter, bandwidth, reset_rate, target):
+                return False
+            self.print_success("Toxics aplicados; `faults --off` remove o proxy")
+            return True
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            self.print_error(f"Erro configurando o proxy: {e}")
+            return False
+
+    def fault_benchmark(self, latencies: str = FAULT_BENCHMARK_LATENCIES, requests_per_step: int = FAULT_BENCHMARK_REQUESTS,
+                        target: str = "all") -> bool:
+        """
+        Mede a latência de cada endpoint para atrasos crescentes por salto.
+
+        A inclinação da reta (ms da API por ms de atraso) estima as idas e voltas
+        sequenciais ao banco/cache por requisição: valores altos revelam consultas tagarelas.
+        """
+        steps = sorted({float(value) for value in latencies.split(",") if value.strip()})
+        self.print_step("FAULT BENCHMARK", f"Atrasos de {', '.join(f'{v:g}' for v in steps)}ms em {target}")
+        if not self.configure_faults(target=target):
+            return False
+        
+        base_url = self.services['api'].url
+        self.warm_up_api(base_url)
+        headers, endpoints = self.resolve_api_workload(base_url)
+        if headers is None or not endpoints:
+            self.print_error("Login ou endpoints indisponíveis para o benchmark")
+            return False
+        
+        session = requests.Session()
+        session.headers.update(headers)
+        medians: Dict[str, List[Optional[float]]] = {endpoint: [] for endpoint in endpoints}
+        errors: Dict[str, int] = {endpoint: 0 for endpoint in endpoints}
+        try:
+            for delay in steps:
+                if not self.set_fault_toxics(latency=delay, target=target):
+                    return False
+                print(f"  ⏱️  Atraso {delay:g}ms por ida e volta")
+                for endpoint in endpoints:
+                    samples = []
+                    for _ in range(requests_per_step):
+                        started = time.perf_counter()
+                        try:
+                            response = session.get(f"{base_url}{endpoint}", timeout=60)
+                        except requests.RequestException:
+                            errors[endpoint] += 1
+                            continue
+                        # Respostas de erro (401/404/500) costumam voltar sem tocar o banco e distorceriam a reta
+                        if response.status_code >= 400:
+                            errors[endpoint] += 1
+                            continue
+                        samples.append((time.perf_counter() - started) * 1000)
+                    medians[endpoint].append(sorted(samples)[len(samples) // 2] if samples else None)
+        finally:
+            session.close()
+            self.set_fault_toxics(target=target)  # Deixar o proxy sem atraso ao final
+        
+        # Mínimos quadrados: latência da API = base + idas_e_voltas x atraso
+        rows = []
+        for endpoint, values in medians.items():
+            points = [(d, v) for d, v in zip(steps, values) if v is not None]
+            mean_delay = sum(d for d, _ in points) / len(points) if points else 0
+            mean_latency = sum(v for _, v in points) / len(points) if points else 0
+            spread = sum((d - mean_delay) ** 2 for d, _ in points)
+            slope = (sum((d - mean_delay) * (v - mean_latency) for d, v in points) / spread) if spread else None
+            rows.append({'endpoint': endpoint, 'median_ms': [round(v, 1) if v is not None else None for v in values],
+                         'round_trips': round(slope, 1) if slope is not None else None,
+                         'errors': errors[endpoint]})
+        rows.sort(key=lambda row: -(row['round_trips'] or 0))
+        
+        header = "".join(f"{f'{d:g}ms':>9}" for d in steps)
+        print(f"\n  {'Endpoint':<44}{header} {'Idas/voltas':>12} {'Erros':>7}")
+        for row in rows:
+            cells = "".join(f"{v:>9.1f}" if v is not None else f"{'-':>9}" for v in row['median_ms'])
+            color = Colors.WARNING if (row['round_trips'] or 0) >= 5 else Colors.GREEN
+            round_trips = row['round_trips'] if row['round_trips'] is not None else "-"
+            print(f"  {row['endpoint'][:44]:<44}{cells} {color}{round_trips:>12}{Colors.ENDC} {row['errors']:>7}")
+        print("  💡 Idas/voltas ≈ ms adicionados por ms de atraso: consultas sequenciais por requisição")
+        
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        report_file = self.state_dir / f"fault-benchmark-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        report_file.write_text(json.dumps({'target': target, 'delays_ms': steps,
+                                           'requests_per_step': requests_per_step, 'endpoints': rows}, indent=2))
+        self.print_success(f"Relatório salvo em {report_file.relative_to(self.root_dir)}")
+        return True
+
+    def api_containers(self) -> Dict[str, str]:
+        """Containers da API a aguardar/inspecionar: réplicas e balanceador no modo escalado"""
+        if not self.api_replicas():
+            return {'API': DOCKER_CONTAINERS['API']}
+        containers = {f"API #{i}": name for i, name in enumerate(self.api_replica_names(), 1)}
+        containers['Balanceador'] = SCALE_LB_CONTAINER
+        return containers
+
+    def reload_api_balancer(self):
+        """O nginx resolve "api" ao iniciar; reiniciar faz ele enxergar as réplicas (re)criadas"""
+        subprocess.run(self.compose_command("restart", "api-lb"),
+                       cwd=self.docker_dir, capture_output=True, text=True, timeout=60)
+
+    def api_replica_names(self) -> List[str]:
+        """Containers da API criados pelo compose (réplicas do modo escalado ou o synqcore-api padrão)"""
+        result = subprocess.run(
+            ["docker", "ps", "--filter", "label=com.docker.compose.service=api",
+             "--filter", "network=synqcore-network", "--format", "{{.Names}}"],
+            capture_output=True, text=True, timeout=10
+        )
+        return sorted(result.stdout.split())
+
+    def scale_api(self, replicas: int) -> bool:
+        """
+        Executa N réplicas da API atrás do balanceador synqcore-api-lb (porta 5005).
+
+        As réplicas compartilham PostgreSQL e Redis; `--api 0` volta ao container único.
+        """
+        if replicas < 0:
+            self.print_error("Número de réplicas inválido")
+            return False
+        
+        try:
+            previous = self.scale_state_file.read_text() if self.scale_state_file.exists() else None
+            if replicas == 0:
+                self.print_step("SCALE", "Voltando à API em container único")
+                subprocess.run(self.compose_command("rm", "-sf", "api-lb", overrides=(SCALE_COMPOSE_FILE,)),
+                               cwd=self.docker_dir, capture_output=True, text=True, timeout=60)
+                self.scale_state_file.unlink(missing_ok=True)
+                command = self.compose_command("up", "-d", "--scale", "api=1", "api")
+            else:
+                self.print_step("SCALE", f"{replicas} réplica(s) da API atrás do balanceador local")
+                # Registrado para que down/start/restart mantenham o override e o número de réplicas
+                self.state_dir.mkdir(parents=True, exist_ok=True)
+                self.scale_state_file.write_text(json.dumps({'replicas': replicas, 'scaled_at': time.time()}))
+                command = self.compose_command("up", "-d", "--scale", f"api={replicas}", "api", "api-lb")
+            
+            self.launch_times['api'] = time.monotonic()
+            result = subprocess.run(command, cwd=self.docker_dir, capture_output=True, text=True, timeout=600)
+            if result.returncode != 0:
+                if previous is None:
+                    self.scale_state_file.unlink(missing_ok=True)
+                else:
+                    self.scale_state_file.write_text(previous)
+                self.print_error(f"Erro escalando a API: {result.stderr.strip()}")
+                return False
+            
+            names = self.api_replica_names()
+            ready = self.wait_for_containers({f"API #{i}": name for i, name in enumerate(names, 1)}, timeout=180)
+            if not all(ready.values()):
+                self.print_warning("Nem todas as réplicas ficaram saudáveis")
+            
+            if replicas > 0:
+                self.reload_api_balancer()
+            if not self.wait_for_service_health("api", timeout=60):
+                return False
+            
+            print(f"  🧩 Réplicas: {', '.join(names)}")
+            if replicas > 0:
+                print("  🔀 Cabeçalho X-SynQcore-Upstream indica a réplica que atendeu cada requisição")
+            return True
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            self.print_error(f"Erro escalando a API: {e}")
+            return False
+
+    def measure_api_throughput(self, base_url: str, headers: Dict[str, str], endpoints: List[str],
+                               duration: float, concurrency: int) -> Dict:
+        """Carga em laço fechado: cada cliente repete os endpoints sem pausa até o fim da janela"""
+        deadline = time.monotonic() + duration
+        
+        def client(offset: int) -> Tuple[List[float], int]:
+            session = requests.Session()
+            session.headers.update(headers)
+            latencies, errors = [], 0
+            i = offset
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    ok = session.get(f"{base_url}{endpoints[i % len(endpoints)]}", timeout=30).status_code < 400
+                except requests.RequestException:
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors += 1
+                i += 1
+            session.close()
+            return latencies, errors
+        
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(client, range(concurrency)))
+        elapsed = time.monotonic() - started
+        
+        latencies = sorted(ms for values, _ in results for ms in values)
+        errors = sum(e for _, e in results)
+        
+        def percentile(q: float) -> Optional[float]:
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * q))], 1) if latencies else None
+        
+        return {
+            'requests': len(latencies) + errors,
+            'throughput_rps': round(len(latencies) / elapsed, 1),
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'errors': errors,
+        }
+
+    def scale_benchmark(self, max_replicas: int, duration: float = SCALE_BENCHMARK_DURATION,
+                        concurrency: int = SCALE_BENCHMARK_CONCURRENCY) -> bool:
+        """Vazão de 1 a N réplicas e eficiência de escala (vazão N / (N x vazão com 1))"""
+        self.print_step("SCALE BENCHMARK", f"1 a {max_replicas} réplicas, {concurrency} clientes, {duration:.0f}s cada")
+        base_url = self.services['api'].url
+        runs = []
+        
+        for replicas in range(1, max_replicas + 1):
+            if not self.scale_api(replicas):
+                return False
+            self.warm_up_api(base_url)
+            headers, endpoints = self.resolve_api_workload(base_url)
+            if headers is None or not endpoints:
+                self.print_error("Login ou endpoints indisponíveis para o benchmark")
+                return False
+            
+            print(f"  ⏱️  Medindo {replicas} réplica(s)...")
+            run = {'replicas': replicas, **self.measure_api_throughput(base_url, headers, endpoints,
+                                                                      duration, concurrency)}
+            baseline = runs[0]['throughput_rps'] if runs else run['throughput_rps']
+            run['speedup'] = round(run['throughput_rps'] / baseline, 2) if baseline else None
+            run['efficiency'] = round(run['speedup'] / replicas, 2) if run['speedup'] is not None else None
+            runs.append(run)
+        
+        print(f"\n  {'Réplicas':>8} {'req/s':>10} {'p50':>9} {'p95':>9} {'Erros':>7} {'Speedup':>8} {'Eficiência':>11}")
+        for run in runs:
+            efficiency = f"{run['efficiency'] * 100:.0f}%" if run['efficiency'] is not None else "-"
+            print(f"  {run['replicas']:>8} {run['throughput_rps']:>10,.1f} {run['p50_ms'] or 0:>7.1f}ms "
+                  f"{run['p95_ms'] or 0:>7.1f}ms {run['errors']:>7} {run['speedup'] or 0:>7.2f}x {efficiency:>11}")
+        print(f"  💻 Réplicas, banco e gerador de carga dividem {os.cpu_count()} CPUs desta máquina")
+        
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        report_file = self.state_dir / f"scale-benchmark-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        report_file.write_text(json.dumps({
+            'duration': duration, 'concurrency': concurrency, 'endpoints': WARMUP_ENDPOINTS, 'runs': runs,
+        }, indent=2))
+        self.print_success(f"Relatório salvo em {report_file.relative_to(self.root_dir)}")
+        return True
+
+    @contextmanager
+    def phase(self, name: str, category: str = "startup"):
+        """Mede uma fase da inicialização; fases aninhadas formam o gráfico de chamas do trace"""
+        entry = {'name': name, 'cat': category, 'start': time.monotonic(),
+                 'depth': len(self._phase_stack), 'status': 'ok'}
+        self._phase_stack.append(entry)
+        try:
+            yield entry
+        except BaseException:
+            entry['status'] = 'erro'
+            raise
+        finally:
+            entry['duration'] = time.monotonic() - entry['start']
+            self._phase_stack.pop()
+            self.timeline.append(entry)
+
+    def run_phase(self, name: str, func, *args, **kwargs):
+        """Executa uma função como fase; retorno False marca a fase como falha"""
+        with self.phase(name) as entry:
+            result = func(*args, **kwargs)
+            if result is False:
+                entry['status'] = 'falhou'
+            return result
+
+    def report_startup_timeline(self, outcome: str):
+        """Grava o trace do Chrome, acrescenta ao histórico por commit e exibe o resumo das fases"""
+        if not self.timeline:
+            return
+        
+        events = sorted(self.timeline, key=lambda e: (e['start'], -e['duration']))
+        origin = self._timeline_started
+        total = time.monotonic() - origin
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=self.root_dir,
+                                capture_output=True, text=True).stdout.strip() or None
+        
+        trace = {
+            'traceEvents': [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'tid': 1,
+                             'args': {'name': 'synqcore.py start'}}] + [
+                {'name': e['name'], 'cat': e['cat'], 'ph': 'X', 'pid': 1, 'tid': 1,
+                 'ts': round((e['start'] - origin) * 1e6), 'dur': round(e['duration'] * 1e6),
+                 'args': {'status': e['status']}}
+                for e in events
+            ],
+            'displayTimeUnit': 'ms',
+            'otherData': {'commit': commit, 'outcome': outcome, 'total_s': round(total, 3)},
+        }
+        
+        phases = {e['name']: round(e['duration'], 3) for e in events if e['depth'] == 0}
+        record = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': commit,
+                  'outcome': outcome, 'total_s': round(total, 3), 'phases': phases}
+        previous = None
+        trace_file = self.traces_dir / f"startup-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        try:
+            self.traces_dir.mkdir(parents=True, exist_ok=True)
+            trace_file.write_text(json.dumps(trace), encoding='utf-8')
+            if self.startup_history_file.exists():
+                lines = self.startup_history_file.read_text(encoding='utf-8').splitlines()
+                previous = json.loads(lines[-1]) if lines else None
+            with open(self.startup_history_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + "\n")
+        except (OSError, ValueError) as e:
+            self.print_warning(f"Não foi possível gravar a linha do tempo: {e}")
+        
+        print(f"\n{Colors.CYAN}{Colors.BOLD}⏱️  LINHA DO TEMPO DA INICIALIZAÇÃO{Colors.ENDC}")
+        print("=" * 80)
+        width = 30
+        for e in events:
+            offset = int((e['start'] - origin) / total * width) if total else 0
+            length = max(int(e['duration'] / total * width), 1) if total else 1
+            bar = " " * offset + "█" * min(length, width - offset)
+            name = ("  " * e['depth'] + e['name'])[:32]
+            status = "" if e['status'] == 'ok' else f" ({e['status']})"
+            print(f"  {name:<32} {e['duration']:>7.2f}s {e['duration'] / total * 100 if total else 0:>5.1f}%  "
+                  f"|{bar:<{width}}|{status}")
+        print("-" * 80)
+        print(f"  {'Total':<32} {total:>7.2f}s")
+        if previous and previous.get('total_s'):
+            delta = total - previous['total_s']
+            print(f"  Execução anterior ({previous.get('commit') or '?'}): {previous['total_s']:.2f}s "
+                  f"({'+' if delta >= 0 else ''}{delta:.2f}s)")
+        print(f"  📄 Trace: {trace_file.relative_to(self.root_dir)} (chrome://tracing ou https://ui.perfetto.dev)")
+        self.timeline.clear()
+
     def start_full_application(self):
         """Inicia a aplicação completa"""
         try:
+            self._timeline_started = time.monotonic()
+            
             # 1. Verificar pré-requisitos (Docker obrigatório para aplicação completa)
-            if not self.check_prerequisites(require_docker=True):
+            if not self.run_phase("Pré-requisitos", self.check_prerequisites, require_docker=True):
                 return False
             
             # 2. Verificar se é primeira execução
-            first_run = self.is_first_run()
+            first_run = self.run_phase("Primeira execução", self.is_first_run)
             if first_run:
                 self.print_step("PRIMEIRA EXECUÇÃO", "Detectada primeira execução - preparando ambiente")
             
             # 3. Verificar portas disponíveis
-            ports_status = self.check_ports_available([5000, 5226, 5432, 6379])
+            ports_status = self.run_phase("Portas", self.check_ports_available, [5000, 5226, 5432, 6379])
             occupied_ports = [port for port, available in ports_status.items() if not available]
             
             if occupied_ports:
@@ -999,33 +2720,31 @@ class SynQcoreManager:
             
             # 4. Limpeza se necessário
             if first_run:
-                self.clean_environment()
+                self.run_phase("Limpeza", self.clean_environment)
             
-            # 5. Build apenas na primeira execução
-            if first_run:
-                if not self.build_solution():
-                    return False
+            # 5. Build incremental (só compila o que mudou desde o último build)
+            if not self.run_phase("Build", self.build_solution):
+                return False
             
             # 6. Configurar Docker
-            if not self.setup_docker_infrastructure():
+            if not self.run_phase("Docker", self.setup_docker_infrastructure):
                 return False
             
-            # 7. Aplicar migrações apenas na primeira execução ou quando necessário
-            if first_run:
-                self.apply_database_migrations(force=True)  # Forçar na primeira execução
-            else:
-                self.apply_database_migrations(force=False)  # Verificar se necessário
+            # 7. Aplicar migrações apenas quando o banco não tem todas as do código
+            self.run_phase("Migrações", self.apply_database_migrations)
             
             # 8. Aguardar API container ficar pronto
-            if not self.wait_for_service_health("api", 90):
+            if not self.run_phase("Aguardar API", self.wait_for_service_health, "api", 90):
                 self.print_warning("API container demorou mais que esperado")
                 # Continuar mesmo assim pois API pode estar inicializando
+            else:
+                self.run_phase("Aquecer API", self.warm_up_api)
             
             # 9. Iniciar Blazor
-            blazor_process = self.start_blazor_service()
+            blazor_process = self.run_phase("Iniciar Blazor", self.start_blazor_service)
             
             # 10. Aguardar Blazor ficar pronto
-            if not self.wait_for_service_health("blazor", 60):
+            if not self.run_phase("Aguardar Blazor", self.wait_for_service_health, "blazor", 60):
                 # Verificar se o processo ainda está rodando
                 if blazor_process is not None:
                     blazor_running = blazor_process.poll() is None
@@ -1040,10 +2759,13 @@ class SynQcoreManager:
                     return False
             
             # 11. Abrir navegador - APENAS Blazor para start completo
-            self.open_browser_urls([
+            self.run_phase("Navegador", self.open_browser_urls, [
                 "http://localhost:5226"  # Blazor como página principal
             ])
             
+            # 12. Linha do tempo das fases
+            self.report_startup_timeline("pronto")
+            
             # 13. Monitorar serviços
             self.monitor_services()
             
@@ -1056,6 +2778,8 @@ class SynQcoreManager:
             self.print_error(f"Erro inesperado: {e}")
             return False
         finally:
+            # Falhas e interrupções antes do fim também geram a linha do tempo
+            self.report_startup_timeline("incompleto")
             self.cleanup_processes(keep_docker=True)
 
     def start_api_only(self):
@@ -1074,6 +2798,8 @@ class SynQcoreManager:
             
             if not self.wait_for_service_health("api", 90):
                 self.print_warning("API container demorou mais que esperado, mas pode estar funcionando")
+            else:
+                self.warm_up_api()
             
             self.open_browser_urls(["http://localhost:5005/swagger"])
             
@@ -1107,11 +2833,9 @@ class SynQcoreManager:
             if not self.check_prerequisites(require_docker=False):
                 return False
             
-            # Build apenas na primeira execução
-            first_run = self.is_first_run()
-            if first_run:
-                if not self.build_solution():
-                    return False
+            # Build incremental (só compila o que mudou desde o último build)
+            if not self.build_solution():
+                return False
             
             blazor_process = self.start_blazor_service()
             
@@ -1145,7 +2869,7 @@ class SynQcoreManager:
             print("  🐳 Subindo containers", end="", flush=True)
             
             result = subprocess.run(
-                ["docker-compose", "up", "-d"],
+                self.compose_command("up", "-d", "--remove-orphans"),
                 cwd=self.docker_dir,
                 capture_output=True,
                 text=True
@@ -1174,7 +2898,8 @@ class SynQcoreManager:
             self.print_step("DOCKER DOWN", "Parando infraestrutura Docker")
             
             result = subprocess.run(
-                ["docker-compose", "down"],
+                # --remove-orphans: inclui o balanceador do modo escalado mesmo que o override não esteja ativo
+                self.compose_command("down", "--remove-orphans"),
                 cwd=self.docker_dir,
                 capture_output=True,
                 text=True
@@ -1228,15 +2953,15 @@ class SynQcoreManager:
             print(f"  ⚠️  Docker Desktop pode estar inicializando...")
             print(f"  ⏳ Aguarde alguns minutos e tente novamente")
         
-        # Verificar docker-compose
-        try:
-            result = subprocess.run(["docker-compose", "--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print(f"  ✅ Docker Compose: {result.stdout.strip()}")
-            else:
-                print(f"  ❌ Docker Compose com problemas")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Verificar Docker Compose (plugin v2 ou standalone)
+        probes = self.probe_prerequisites(refresh=True)
+        if probes['compose_plugin']['ok']:
+            print(f"  ✅ Docker Compose: {probes['compose_plugin']['version']} (plugin docker compose)")
+        elif probes['compose_standalone']['ok']:
+            print(f"  ✅ Docker Compose: {probes['compose_standalone']['version']}")
+        elif probes['compose_plugin']['found'] or probes['compose_standalone']['found']:
+            print(f"  ❌ Docker Compose com problemas")
+        else:
             print(f"  ❌ Docker Compose não encontrado")
     
     def show_help(self):
@@ -1247,9 +2972,16 @@ class SynQcoreManager:
         print(f"  {Colors.GREEN}start{Colors.ENDC}       - Aplicação completa (API + Blazor + Docker)")
         print(f"  {Colors.GREEN}api{Colors.ENDC}         - Apenas API na porta 5000")
         print(f"  {Colors.GREEN}blazor{Colors.ENDC}      - Apenas Blazor na porta 5226")
-        print(f"  {Colors.GREEN}build{Colors.ENDC}       - Compilar solução completa")
+        print(f"  {Colors.GREEN}build{Colors.ENDC}       - Compilar solução (incremental, --force recompila tudo)")
         print(f"  {Colors.GREEN}migrate{Colors.ENDC}     - Aplicar migrações do banco")
-        print(f"  {Colors.GREEN}clean{Colors.ENDC}       - Limpeza completa do projeto")
+        print(f"  {Colors.GREEN}profile{Colors.ENDC}     - Limites de CPU/memória de produção (--size small|medium|large|off)")
+        print(f"  {Colors.GREEN}faults{Colors.ENDC}      - Latência/falhas entre API e PostgreSQL/Redis (--latency, --benchmark, --off)")
+        print(f"  {Colors.GREEN}scale{Colors.ENDC}       - Réplicas da API com balanceador (--api N, --benchmark)")
+        print(f"  {Colors.GREEN}warmup{Colors.ENDC}      - Aquecer a API até a latência estabilizar")
+        print(f"  {Colors.GREEN}seed{Colors.ENDC}        - Carregar dataset sintético via COPY (--scale, --seed)")
+        print(f"  {Colors.GREEN}db-snapshot{Colors.ENDC} - Salvar o banco como snapshot (--name)")
+        print(f"  {Colors.GREEN}db-restore{Colors.ENDC}  - Restaurar o banco de um snapshot (--name)")
+        print(f"  {Colors.GREEN}clean{Colors.ENDC}       - Limpeza completa do projeto (--dry-run só relata)")
         print(f"  {Colors.GREEN}docker-up{Colors.ENDC}   - Infraestrutura Docker")
         print(f"  {Colors.GREEN}docker-down{Colors.ENDC} - Parar Docker")
         print(f"  {Colors.GREEN}docker-status{Colors.ENDC} - Verificar status do Docker")
@@ -1273,6 +3005,7 @@ class SynQcoreManager:
         print("  • Use 'blazor' se não tiver Docker instalado") 
         print("  • Use 'docker-status' para diagnosticar problemas")
         print("  • Use 'clean' se houver problemas de compilação")
+        print("  • Use 'build --jobs 1' para compilar em modo serial")
         print("  • Containers Docker são mantidos entre execuções")
         print("  • Use 'docker-down' apenas quando necessário")
 
@@ -1286,9 +3019,22 @@ Exemplos:
   python synqcore.py start         # Aplicação completa
   python synqcore.py api           # Apenas API
   python synqcore.py blazor        # Apenas Blazor
-  python synqcore.py build         # Compilar solução  
+  python synqcore.py build         # Compilar solução (incremental)
+  python synqcore.py build --force # Recompilar tudo
+  python synqcore.py build --jobs 1 # Build serial (padrão: todas as CPUs)
   python synqcore.py migrate       # Aplicar migrações
+  python synqcore.py warmup        # Aquecer a API antes de medir
+  python synqcore.py profile --size small # Limites de CPU/memória de produção
+  python synqcore.py faults --latency 5 --jitter 2 # Rede lenta entre API e banco/cache
+  python synqcore.py faults --benchmark # Idas e voltas ao banco por endpoint
+  python synqcore.py scale --api 3 # 3 réplicas da API atrás de um balanceador
+  python synqcore.py scale --api 4 --benchmark # Eficiência de escala de 1 a 4 réplicas
+  python synqcore.py seed --scale 10 # Dataset sintético (~10 mil funcionários)
+  python synqcore.py db-snapshot --name seed  # Salvar estado do banco
+  python synqcore.py db-restore --name seed   # Voltar ao estado salvo
+  python synqcore.py check --json  # Snapshot de saúde para scripts
   python synqcore.py clean         # Limpeza completa
+  python synqcore.py clean --dry-run # Mostrar o que seria removido
         """
     )
     
@@ -1296,14 +3042,150 @@ Exemplos:
         'command',
         nargs='?',
         default='start',
-        choices=['start', 'api', 'blazor', 'build', 'migrate', 'clean', 'docker-up', 'docker-down', 'docker-status', 'check', 'help'],
+        choices=['start', 'api', 'blazor', 'build', 'migrate', 'seed', 'warmup', 'scale', 'profile', 'faults', 'db-snapshot', 'db-restore', 'clean', 'docker-up', 'docker-down', 'docker-status', 'check', 'help'],
         help='Comando a executar'
     )
     
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='build: ignora o manifesto incremental e recompila tudo'
+    )
+    
+    parser.add_argument(
+        '--name',
+        default='default',
+        help='db-snapshot/db-restore: nome do snapshot (padrão: default)'
+    )
+    
+    parser.add_argument(
+        '--size',
+        choices=list(PRODUCTION_PROFILES) + ['off'],
+        default='small',
+        help='profile: tamanho de produção a reproduzir (off remove os limites)'
+    )
+    
+    parser.add_argument(
+        '--api',
+        type=int,
+        default=2,
+        help='scale: número de réplicas da API (0 = container único)'
+    )
+    
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='scale: vazão de 1 até --api réplicas; faults: latência por endpoint para cada atraso de --latencies'
+    )
+    
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0,
+        help='faults: atraso (ms) somado a cada ida e volta ao PostgreSQL/Redis'
+    )
+    
+    parser.add_argument(
+        '--jitter',
+        type=float,
+        default=0,
+        help='faults: variação (ms) do atraso'
+    )
+    
+    parser.add_argument(
+        '--bandwidth',
+        type=int,
+        default=0,
+        help='faults: limite de banda em KB/s (0 = ilimitada)'
+    )
+    
+    parser.add_argument(
+        '--reset-rate',
+        type=float,
+        default=0,
+        help='faults: fração de conexões encerradas com RST (0 a 1)'
+    )
+    
+    parser.add_argument(
+        '--target',
+        choices=['all'] + list(FAULT_PROXIES),
+        default='all',
+        help='faults: salto afetado (padrão: PostgreSQL e Redis)'
+    )
+    
+    parser.add_argument(
+        '--off',
+        action='store_true',
+        help='faults: remove o proxy e reconecta a API diretamente'
+    )
+    
+    parser.add_argument(
+        '--latencies',
+        default=FAULT_BENCHMARK_LATENCIES,
+        help='faults --benchmark: atrasos por salto a medir, em ms'
+    )
+    
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=FAULT_BENCHMARK_REQUESTS,
+        help='faults --benchmark: requisições sequenciais por endpoint e atraso'
+    )
+    
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=SCALE_BENCHMARK_DURATION,
+        help='scale --benchmark: segundos medidos por número de réplicas'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=SCALE_BENCHMARK_CONCURRENCY,
+        help='scale --benchmark: clientes simultâneos'
+    )
+    
+    parser.add_argument(
+        '--scale',
+        type=float,
+        default=1.0,
+        help='seed: multiplicador do volume (1 = 1.000 funcionários e 20.000 posts)'
+    )
+    
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='seed: semente do gerador (mesma semente e escala geram os mesmos dados)'
+    )
+    
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='check: imprime apenas o resultado em JSON (código de saída 1 se houver problemas)'
+    )
+    
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='clean: apenas lista o que seria removido e o espaço liberado'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Nós paralelos do MSBuild (0 = automático; padrão: SYNQCORE_BUILD_JOBS ou automático)'
+    )
+    
     args = parser.parse_args()
     
     manager = SynQcoreManager()
-    manager.print_header()
+    if args.jobs is not None:
+        manager.build_jobs = args.jobs
+    if not args.json:
+        manager.print_header()
     
     success = False
     
@@ -1317,11 +3199,32 @@ Exemplos:
     elif args.command == 'blazor':
         success = manager.start_blazor_only()
     elif args.command == 'build':
-        success = manager.build_solution()
+        success = manager.build_solution(force=args.force)
     elif args.command == 'migrate':
         success = manager.apply_database_migrations(force=True)
+    elif args.command == 'faults':
+        if args.benchmark:
+            success = manager.fault_benchmark(args.latencies, args.requests, args.target)
+        else:
+            success = manager.configure_faults(args.latency, args.jitter, args.bandwidth, args.reset_rate,
+                                               args.target, off=args.off)
+    elif args.command == 'profile':
+        success = manager.apply_production_profile(args.size)
+    elif args.command == 'scale':
+        if args.benchmark:
+            success = manager.scale_benchmark(args.api, args.duration, args.concurrency)
+        else:
+            success = manager.scale_api(args.api)
+    elif args.command == 'warmup':
+        success = manager.warm_up_api()
+    elif args.command == 'seed':
+        success = manager.seed_database(args.scale, args.seed)
+    elif args.command == 'db-snapshot':
+        success = manager.db_snapshot(args.name)
+    elif args.command == 'db-restore':
+        success = manager.db_restore(args.name)
     elif args.command == 'clean':
-        manager.clean_environment()
+        manager.clean_environment(dry_run=args.dry_run)
         success = True
     elif args.command == 'docker-up':
         success = manager.docker_up()
@@ -1331,8 +3234,9 @@ Exemplos:
         manager.check_docker_status()
         success = True
     elif args.command == 'check':
-        manager.check_system_integrity()
-        success = True
+        success = manager.check_system_integrity(as_json=args.json)
+        if args.json:
+            sys.exit(0 if success else 1)  # Saída só com o JSON
     
     if success:
         print(f"\n{Colors.GREEN}🎉 Operação concluída com sucesso!{Colors.ENDC}")
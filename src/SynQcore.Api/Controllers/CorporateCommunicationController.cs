@@ -17,6 +17,7 @@ public partial class CorporateCommunicationController : ControllerBase
 {
     private readonly IHubContext<CorporateCollaborationHub> _collaborationHub;
     private readonly IHubContext<ExecutiveCommunicationHub> _executiveHub;
+    private readonly IHubContext<CorporateNotificationHub> _notificationHub;
     private readonly ICurrentUserService _currentUserService;
     private readonly ILogger<CorporateCommunicationController> _logger;
 
@@ -26,11 +27,13 @@ public partial class CorporateCommunicationController : ControllerBase
     public CorporateCommunicationController(
         IHubContext<CorporateCollaborationHub> collaborationHub,
         IHubContext<ExecutiveCommunicationHub> executiveHub,
+        IHubContext<CorporateNotificationHub> notificationHub,
         ICurrentUserService currentUserService,
         ILogger<CorporateCommunicationController> logger)
     {
         _collaborationHub = collaborationHub;
         _executiveHub = executiveHub;
+        _notificationHub = notificationHub;
         _currentUserService = currentUserService;
         _logger = logger;
     }
@@ -107,6 +110,46 @@ public partial class CorporateCommunicationController : ControllerBase
         });
     }
 
+    /// <summary>
+    /// Enviar notificação para assinantes de um tópico
+    /// </summary>
+    /// <param name="topic">Tópico da notificação (ex: "project_123", "announcement_hr")</param>
+    /// <param name="request">Dados da notificação</param>
+    /// <returns>Status do envio</returns>
+    [HttpPost("notifications/topics/{topic}")]
+    [Authorize(Roles = "Manager,HR,Admin")]
+    public async Task<IActionResult> SendTopicNotification(string topic, [FromBody] TopicNotificationRequest request)
+    {
+        var currentUserId = _currentUserService.UserId;
+        var notificationId = Guid.NewGuid();
+
+        LogSendingTopicNotification(_logger, currentUserId.ToString(), topic, request.Title);
+
+        // Enviar via SignalR Hub de Notificações (grupo Topic_{topic})
+        await CorporateNotificationHub.SendTopicNotification(_notificationHub, topic, new
+        {
+            NotificationId = notificationId,
+            Topic = topic,
+            Title = request.Title,
+            Message = request.Message,
+            Priority = request.Priority,
+            SentBy = new
+            {
+                UserId = currentUserId
+            },
+            Timestamp = DateTimeOffset.UtcNow
+        });
+
+        return Ok(new
+        {
+            Success = true,
+            Message = "Notificação enviada para os assinantes do tópico",
+            NotificationId = notificationId,
+            Topic = topic,
+            Timestamp = DateTimeOffset.UtcNow
+        });
+    }
+
     /// <summary>
     /// Enviar mensagem para canal de equipe específica
     /// </summary>
@@ -308,6 +351,27 @@ public partial class CorporateCommunicationController : ControllerBase
         public string Type { get; set; } = "Announcement";
     }
 
+    /// <summary>
+    /// Dados para notificação de tópico
+    /// </summary>
+    public class TopicNotificationRequest
+    {
+        /// <summary>
+        /// Título da notificação
+        /// </summary>
+        public string Title { get; set; } = string.Empty;
+
+        /// <summary>
+        /// Conteúdo da mensagem
+        /// </summary>
+        public string Message { get; set; } = string.Empty;
+
+        /// <summary>
+        /// Prioridade da notificação (Low, Normal, High, Critical)
+        /// </summary>
+        public string Priority { get; set; } = "Normal";
+    }
+
     /// <summary>
     /// Dados para mensagem de equipe
     /// </summary>
@@ -378,5 +442,9 @@ public partial class CorporateCommunicationController : ControllerBase
         Message = "Obtendo estatísticas de comunicação - UserId: {UserId} ({Role})")]
     private static partial void LogGettingCommunicationStats(ILogger logger, string userId, string role);
 
+    [LoggerMessage(EventId = 4207, Level = LogLevel.Information,
+        Message = "Enviando notificação de tópico - UserId: {UserId} -> Tópico: {Topic} - Título: {Title}")]
+    private static partial void LogSendingTopicNotification(ILogger logger, string userId, string topic, string title);
+
     #endregion
 }
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Carga - CorporateCollaborationHub
+
+Este script abre milhares de conexões SignalR em /hubs/corporate-collaboration e mede:
+- Taxa de estabelecimento de conexões (negotiate + WebSocket + handshake)
+- JoinTeamChannel / JoinProjectChannel (latência de entrada nos grupos)
+- SendTeamMessage -> ReceiveTeamMessage (latência de fan-out por tamanho de canal)
+- Entregas perdidas ou duplicadas por tamanho de canal
+
+Execução: python bench_collaboration_hub.py --connections 2000 --channel-sizes 5,25,100,500
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import asyncio
+import argparse
+from typing import Dict, List, Tuple
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.signalr_client import (HubConnection, build_hub_url, create_load_session,
+                                  open_hub_connections, close_hub_connections)
+from utils.load_metrics import summarize_latencies, print_latency_table, print_section, save_benchmark_report
+
+HUB_PATH = '/hubs/corporate-collaboration'
+
+
+def plan_channels(connections: int, channel_sizes: List[int], projects: int, run_id: str) -> List[Tuple[str, int, str]]:
+    """
+    Distribui as conexões em canais de equipe com os tamanhos pedidos (em rodízio).
+
+    Retorna, para cada índice de conexão, (team_id, tamanho_do_canal, project_id).
+    """
+    assignments: List[Tuple[str, int, str]] = []
+    team_index = 0
+
+    while len(assignments) < connections:
+        size = channel_sizes[team_index % len(channel_sizes)]
+        members = min(size, connections - len(assignments))
+        team_id = f"bench-{run_id}-s{size}-{team_index}"
+        for _ in range(members):
+            project_id = f"bench-{run_id}-p{len(assignments) % projects}"
+            assignments.append((team_id, members, project_id))
+        team_index += 1
+
+    return assignments
+
+
+async def run_benchmark(args) -> Dict:
+    """Executa o benchmark completo e retorna os resultados agregados"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Benchmark abortado.")
+        return {}
+
+    run_id = str(int(time.time()))
+    hub_url = build_hub_url(client.base_url, args.hub_path)
+    channel_sizes = [int(s) for s in args.channel_sizes.split(',') if s.strip()]
+    assignments = plan_channels(args.connections, channel_sizes, args.projects, run_id)
+
+    # deliveries[(team_id, seq)][id(conexão)] = quantidade de vezes que a mensagem chegou
+    deliveries: Dict[Tuple[str, int], Dict[int, int]] = {}
+    fanout_latencies: Dict[int, List[float]] = {}
+
+    def configure(index: int, connection: HubConnection):
+        team_id, size, project_id = assignments[index]
+        connection.tag = (team_id, size, project_id)
+
+        def on_team_message(arguments, received_at):
+            payload = arguments[0] if arguments else {}
+            try:
+                body = json.loads(payload.get('message') or payload.get('Message') or '{}')
+            except (TypeError, ValueError):
+                return
+            if body.get('run') != run_id:
+                return
+
+            key = (payload.get('teamId') or payload.get('TeamId'), body['seq'])
+            receivers = deliveries.setdefault(key, {})
+            receivers[id(connection)] = receivers.get(id(connection), 0) + 1
+            if receivers[id(connection)] == 1:
+                fanout_latencies.setdefault(size, []).append(received_at - body['sentAt'])
+
+        connection.on('ReceiveTeamMessage', on_team_message)
+
+    client.log_info(f"🔌 Abrindo {args.connections} conexões em {hub_url}")
+    session = create_load_session()
+    connections: List[HubConnection] = []
+
+    try:
+        connections, setup_times, errors, setup_duration = await open_hub_connections(
+            session, hub_url, client.token, args.connections,
+            concurrency=args.concurrency, skip_negotiation=args.skip_negotiation, configure=configure
+        )
+        setup_rate = len(connections) / setup_duration if setup_duration > 0 else 0
+        client.log_success(f"{len(connections)} conexões abertas em {setup_duration:.1f}s ({setup_rate:.0f} conexões/s)")
+        if errors:
+            client.log_warning(f"{len(errors)} conexões falharam (ex: {errors[0]})")
+
+        # Entrada nos canais de equipe e projeto (aguardando a conclusão de cada invocação)
+        client.log_info("👥 Entrando nos canais de equipe e projeto")
+        join_latencies: Dict[str, List[float]] = {'JoinTeamChannel': [], 'JoinProjectChannel': []}
+        join_errors: List[str] = []
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def join(connection: HubConnection):
+            team_id, _, project_id = connection.tag
+            async with semaphore:
+                for method, channel in (('JoinTeamChannel', team_id), ('JoinProjectChannel', project_id)):
+                    started = time.perf_counter()
+                    try:
+                        await connection.invoke(method, channel)
+                        join_latencies[method].append((time.perf_counter() - started) * 1000)
+                    except Exception as e:
+                        join_errors.append(f"{method}: {e}")
+
+        await asyncio.gather(*(join(c) for c in connections))
+
+        # Membros efetivos de cada canal (apenas conexões abertas)
+        members: Dict[str, List[HubConnection]] = {}
+        for connection in connections:
+            members.setdefault(connection.tag[0], []).append(connection)
+
+        # Agenda de envio intercalando canais, em ritmo constante (open-loop)
+        schedule = [(team_id, seq) for seq in range(args.messages_per_channel) for team_id in members]
+        random.Random(args.seed).shuffle(schedule)
+        sent: Dict[Tuple[str, int], int] = {}
+
+        client.log_info(f"💬 Enviando {len(schedule)} mensagens a {args.rate} msg/s")
+        send_started = time.perf_counter()
+        for index, (team_id, seq) in enumerate(schedule):
+            delay = send_started + index / args.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            sender = random.choice(members[team_id])
+            body = json.dumps({'run': run_id, 'seq': seq, 'sentAt': time.time() * 1000})
+            try:
+                await sender.send('SendTeamMessage', team_id, body)
+                sent[(team_id, seq)] = len(members[team_id])
+            except Exception as e:
+                join_errors.append(f"SendTeamMessage: {e}")
+
+        client.log_info(f"⏳ Aguardando {args.drain}s para drenar entregas pendentes")
+        await asyncio.sleep(args.drain)
+
+        # Consolidação por tamanho de canal
+        by_size: Dict[int, Dict[str, int]] = {}
+        for (team_id, seq), expected in sent.items():
+            size = members[team_id][0].tag[1]
+            stats = by_size.setdefault(size, {'channels': 0, 'messages': 0, 'expected': 0,
+                                              'delivered': 0, 'dropped': 0, 'duplicated': 0})
+            receivers = deliveries.get((team_id, seq), {})
+            stats['messages'] += 1
+            stats['expected'] += expected
+            stats['delivered'] += len(receivers)
+            stats['dropped'] += max(expected - len(receivers), 0)
+            stats['duplicated'] += sum(count - 1 for count in receivers.values())
+        for team_members in members.values():
+            if team_members[0].tag[1] in by_size:
+                by_size[team_members[0].tag[1]]['channels'] += 1
+
+        background: Dict[str, int] = {}
+        for connection in connections:
+            for target, count in connection.received_counts.items():
+                if target != 'ReceiveTeamMessage':
+                    background[target] = background.get(target, 0) + count
+        dropped_connections = sum(1 for c in connections if not c.is_open)
+
+        results = {
+            'parameters': vars(args),
+            'connections': {
+                'requested': args.connections,
+                'opened': len(connections),
+                'failed': len(errors),
+                'closed_during_run': dropped_connections,
+                'setup_duration_s': round(setup_duration, 2),
+                'setup_rate_per_s': round(setup_rate, 1),
+                'setup_latency_ms': summarize_latencies(setup_times),
+                'errors_sample': errors[:10],
+            },
+            'joins': {method: summarize_latencies(values) for method, values in join_latencies.items()},
+            'fanout_latency_ms': {str(size): summarize_latencies(values)
+                                  for size, values in sorted(fanout_latencies.items())},
+            'deliveries_by_channel_size': {str(size): stats for size, stats in sorted(by_size.items())},
+            'background_messages': background,
+            'errors_sample': join_errors[:10],
+        }
+
+        print_latency_table("🔌 SETUP DE CONEXÕES E CANAIS (ms)", {
+            'Conexão (negotiate+ws)': results['connections']['setup_latency_ms'],
+            **results['joins']
+        })
+        print(f"Taxa de setup: {setup_rate:.1f} conexões/s | Falhas: {len(errors)} | "
+              f"Quedas durante o teste: {dropped_connections}")
+
+        print_latency_table("💬 LATÊNCIA DE FAN-OUT POR TAMANHO DE CANAL (ms)",
+                            {f"{size} membros": summary for size, summary in results['fanout_latency_ms'].items()},
+                            key_header="Canal")
+        print_latency_table("📦 ENTREGAS POR TAMANHO DE CANAL",
+                            {f"{size} membros": stats for size, stats in results['deliveries_by_channel_size'].items()},
+                            key_header="Canal")
+
+        if background:
+            print_section("📡 MENSAGENS DE FUNDO (presença/entrada em canais)")
+            for target, count in sorted(background.items()):
+                print(f"   {target}: {count}")
+
+        return results
+
+    finally:
+        await close_hub_connections(connections)
+        await session.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de carga do CorporateCollaborationHub")
+    parser.add_argument('--connections', type=int, default=1000, help='Total de conexões SignalR')
+    parser.add_argument('--channel-sizes', default='5,25,100', help='Tamanhos de canal de equipe (rodízio)')
+    parser.add_argument('--projects', type=int, default=10, help='Quantidade de canais de projeto')
+    parser.add_argument('--messages-per-channel', type=int, default=20, help='Mensagens enviadas por canal')
+    parser.add_argument('--rate', type=float, default=50, help='Mensagens enviadas por segundo (total)')
+    parser.add_argument('--concurrency', type=int, default=200, help='Handshakes/joins simultâneos')
+    parser.add_argument('--drain', type=float, default=10, help='Segundos aguardando entregas após o envio')
+    parser.add_argument('--seed', type=int, default=42, help='Semente da agenda de envio')
+    parser.add_argument('--hub-path', default=HUB_PATH, help='Caminho do hub')
+    parser.add_argument('--skip-negotiation', action='store_true', help='Conectar direto via WebSocket')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal de execução do benchmark"""
+    print("🚀 SynQcore API - Benchmark do CorporateCollaborationHub")
+    print("=" * 50)
+
+    try:
+        results = asyncio.run(run_benchmark(parse_args(argv)))
+        if results:
+            save_benchmark_report("collaboration_hub", results)
+        return results
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark interrompido pelo usuário")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Broadcast - ExecutiveCommunicationHub
+
+Este script mede quanto tempo o último funcionário espera por um comunicado
+da empresa com 5k, 10k e 20k conexões em /hubs/executive-communication:
+- SendCompanyAnnouncement -> ReceiveCompanyAnnouncement
+- SendPolicyUpdate -> ReceivePolicyUpdate
+
+As conexões são abertas por um pool de processos (cada processo com seu próprio
+loop asyncio), para que o cliente não seja o gargalo. Cada recebimento é marcado
+com o relógio do sistema e o relatório traz tempo até a primeira e até a última
+entrega, além do custo de CPU do container da API durante o broadcast.
+
+Execução: python bench_executive_broadcast.py --levels 5000,10000,20000 --processes 8
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import multiprocessing
+from typing import Dict, List
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.signalr_client import (HubConnection, build_hub_url, create_load_session,
+                                  open_hub_connections, close_hub_connections)
+from utils.load_metrics import summarize_latencies, print_latency_table, print_section, save_benchmark_report
+from utils.docker_metrics import get_container_cpu_usage_ns
+
+HUB_PATH = '/hubs/executive-communication'
+BROADCAST_TARGETS = ('ReceiveCompanyAnnouncement', 'ReceivePolicyUpdate')
+
+
+async def _worker_main(pipe, hub_url: str, token: str, count: int, concurrency: int,
+                       title_prefix: str, skip_negotiation: bool):
+    """Loop de um processo do pool: abre conexões, registra recebimentos e responde ao coordenador"""
+    receipts: Dict[str, List[float]] = {}
+
+    def on_broadcast(arguments, received_at):
+        payload = arguments[0] if arguments else {}
+        title = (payload.get('title') or payload.get('Title') or
+                 payload.get('policyTitle') or payload.get('PolicyTitle') or '')
+        if title.startswith(title_prefix):
+            receipts.setdefault(title, []).append(received_at)
+
+    def configure(index: int, connection: HubConnection):
+        for target in BROADCAST_TARGETS:
+            connection.on(target, on_broadcast)
+
+    session = create_load_session()
+    connections: List[HubConnection] = []
+    loop = asyncio.get_running_loop()
+
+    try:
+        connections, setup_times, errors, duration = await open_hub_connections(
+            session, hub_url, token, count, concurrency=concurrency,
+            skip_negotiation=skip_negotiation, configure=configure
+        )
+        pipe.send(('ready', len(connections), len(errors), errors[:5], setup_times, duration))
+
+        while True:
+            command = await loop.run_in_executor(None, pipe.recv)
+            if command == 'collect':
+                pipe.send(('results', receipts, sum(1 for c in connections if not c.is_open)))
+            elif command == 'stop':
+                break
+
+    finally:
+        await close_hub_connections(connections)
+        await session.close()
+
+
+def broadcast_worker(pipe, hub_url: str, token: str, count: int, concurrency: int,
+                     title_prefix: str, skip_negotiation: bool):
+    """Ponto de entrada de cada processo do pool"""
+    try:
+        asyncio.run(_worker_main(pipe, hub_url, token, count, concurrency, title_prefix, skip_negotiation))
+    except KeyboardInterrupt:
+        pass
+
+
+async def measure_cpu_window(container: str, seconds: float) -> Dict:
+    """CPU consumida pelo container durante uma janela (ms de CPU e % médio de um núcleo)"""
+    before = await asyncio.to_thread(get_container_cpu_usage_ns, container)
+    started = time.perf_counter()
+    await asyncio.sleep(seconds)
+    after = await asyncio.to_thread(get_container_cpu_usage_ns, container)
+    elapsed = time.perf_counter() - started
+
+    if before is None or after is None:
+        return {}
+    cpu_ms = (after - before) / 1e6
+    return {'cpu_ms': round(cpu_ms, 1), 'window_s': round(elapsed, 2),
+            'avg_core_percent': round(cpu_ms / (elapsed * 1000) * 100, 1)}
+
+
+async def run_level(client: APITestClient, args, level: int, run_id: str) -> Dict:
+    """Executa os broadcasts para um nível de conexões"""
+    hub_url = build_hub_url(client.base_url, args.hub_path)
+    title_prefix = f"bench-{run_id}-{level}-"
+    processes = max(1, min(args.processes, level))
+    shares = [level // processes + (1 if i < level % processes else 0) for i in range(processes)]
+    context = multiprocessing.get_context('spawn')
+    loop = asyncio.get_running_loop()
+
+    client.log_info(f"🔌 Nível {level}: abrindo conexões em {processes} processos")
+    workers = []
+    for share in shares:
+        parent_pipe, child_pipe = context.Pipe()
+        process = context.Process(
+            target=broadcast_worker,
+            args=(child_pipe, hub_url, client.token, share, args.concurrency, title_prefix, args.skip_negotiation),
+            daemon=True
+        )
+        process.start()
+        child_pipe.close()  # Garante EOFError no coordenador se o processo morrer
+        workers.append((process, parent_pipe))
+
+    session = create_load_session()
+    sender = HubConnection(session, hub_url, client.token)
+
+    try:
+        started = time.perf_counter()
+        ready = []
+        for (_, pipe), share in zip(workers, shares):
+            try:
+                ready.append(await loop.run_in_executor(None, pipe.recv))
+            except EOFError:
+                ready.append(('failed', 0, share, ['processo finalizou antes de ficar pronto'], [], 0))
+        setup_duration = time.perf_counter() - started
+        opened = sum(r[1] for r in ready)
+        failed = sum(r[2] for r in ready)
+        setup_times = [t for r in ready for t in r[4]]
+        client.log_success(f"{opened} conexões abertas em {setup_duration:.1f}s ({failed} falhas)")
+
+        await sender.start()
+
+        # Custo de CPU com as conexões ociosas (keep-alive), para descontar do broadcast
+        idle_cpu = await measure_cpu_window(args.container, args.drain)
+
+        sent: Dict[str, Dict] = {}
+        for seq in range(args.broadcasts):
+            title = f"{title_prefix}{seq}"
+            kind = 'SendCompanyAnnouncement' if seq % 2 == 0 else 'SendPolicyUpdate'
+            client.log_info(f"📢 {kind} #{seq + 1} para {opened} conexões")
+
+            cpu_before = await asyncio.to_thread(get_container_cpu_usage_ns, args.container)
+            sent_at = time.time() * 1000
+            cpu_started = time.perf_counter()
+            if kind == 'SendCompanyAnnouncement':
+                await sender.invoke(kind, title, 'Comunicado de benchmark ' + 'x' * args.payload_size, 'High')
+            else:
+                await sender.invoke(kind, title, 'Atualização de política de benchmark ' + 'x' * args.payload_size,
+                                    time.strftime('%Y-%m-%d'), True)
+            await asyncio.sleep(args.drain)
+            cpu_after = await asyncio.to_thread(get_container_cpu_usage_ns, args.container)
+
+            cpu = {}
+            if cpu_before is not None and cpu_after is not None:
+                window = time.perf_counter() - cpu_started
+                cpu_ms = (cpu_after - cpu_before) / 1e6
+                idle_ms = idle_cpu.get('cpu_ms', 0) / idle_cpu['window_s'] * window if idle_cpu else 0
+                cpu = {'cpu_ms': round(cpu_ms, 1), 'cpu_ms_above_idle': round(cpu_ms - idle_ms, 1),
+                       'window_s': round(window, 2)}
+            sent[title] = {'kind': kind, 'sent_at': sent_at, 'cpu': cpu}
+
+        # Coleta dos recebimentos de todos os processos
+        receipts: Dict[str, List[float]] = {}
+        closed = 0
+        for _, pipe in workers:
+            try:
+                pipe.send('collect')
+                _, worker_receipts, worker_closed = await loop.run_in_executor(None, pipe.recv)
+            except (EOFError, BrokenPipeError, OSError):
+                continue
+            closed += worker_closed
+            for title, times in worker_receipts.items():
+                receipts.setdefault(title, []).extend(times)
+
+        broadcasts = {}
+        for title, info in sent.items():
+            delays = [t - info['sent_at'] for t in receipts.get(title, [])]
+            broadcasts[title] = {
+                'kind': info['kind'],
+                'delivered': len(delays),
+                'missing': max(opened - len(delays), 0),
+                'time_to_first_ms': round(min(delays), 2) if delays else None,
+                'time_to_last_ms': round(max(delays), 2) if delays else None,
+                'delivery_ms': summarize_latencies(delays),
+                'api_cpu': info['cpu'],
+            }
+
+        return {
+            'connections': level,
+            'processes': processes,
+            'opened': opened,
+            'failed': failed,
+            'closed_during_run': closed,
+            'setup_duration_s': round(setup_duration, 2),
+            'setup_latency_ms': summarize_latencies(setup_times),
+            'idle_cpu': idle_cpu,
+            'broadcasts': broadcasts,
+        }
+
+    finally:
+        for _, pipe in workers:
+            try:
+                pipe.send('stop')
+            except (BrokenPipeError, OSError):
+                pass
+        for process, _ in workers:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        await sender.stop()
+        await session.close()
+
+
+async def run_benchmark(args) -> Dict:
+    """Executa todos os níveis de conexões e retorna os resultados agregados"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Benchmark abortado.")
+        return {}
+
+    run_id = str(int(time.time()))
+    levels = [int(level) for level in args.levels.split(',') if level.strip()]
+    results = {'parameters': vars(args), 'levels': {}}
+
+    for level in levels:
+        level_results = await run_level(client, args, level, run_id)
+        results['levels'][str(level)] = level_results
+
+        rows = {}
+        for title, broadcast in level_results['broadcasts'].items():
+            rows[f"{broadcast['kind']} ({title.rsplit('-', 1)[-1]})"] = {
+                'entregues': broadcast['delivered'],
+                'faltando': broadcast['missing'],
+                'primeiro_ms': broadcast['time_to_first_ms'],
+                'p50_ms': broadcast['delivery_ms'].get('p50'),
+                'p99_ms': broadcast['delivery_ms'].get('p99'),
+                'ultimo_ms': broadcast['time_to_last_ms'],
+                'cpu_api_ms': broadcast['api_cpu'].get('cpu_ms_above_idle', '-'),
+            }
+        print_latency_table(f"📢 BROADCAST COM {level} CONEXÕES", rows, key_header="Broadcast")
+        print(f"Conexões: {level_results['opened']}/{level} em {level_results['setup_duration_s']}s | "
+              f"Quedas: {level_results['closed_during_run']}")
+
+    print_section("📈 TEMPO ATÉ O ÚLTIMO FUNCIONÁRIO (pior broadcast por nível)")
+    for level, level_results in results['levels'].items():
+        worst = max((b['time_to_last_ms'] or 0 for b in level_results['broadcasts'].values()), default=0)
+        print(f"   {level} conexões: {worst:.0f}ms")
+
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de broadcast do ExecutiveCommunicationHub")
+    parser.add_argument('--levels', default='5000,10000,20000', help='Níveis de conexões (separados por vírgula)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 4, help='Processos do pool de clientes')
+    parser.add_argument('--broadcasts', type=int, default=4, help='Broadcasts por nível (alterna anúncio/política)')
+    parser.add_argument('--payload-size', type=int, default=200, help='Bytes extras na mensagem do broadcast')
+    parser.add_argument('--concurrency', type=int, default=100, help='Handshakes simultâneos por processo')
+    parser.add_argument('--drain', type=float, default=10, help='Segundos aguardando entregas por broadcast')
+    parser.add_argument('--container', default='synqcore-api', help='Container da API para medir CPU')
+    parser.add_argument('--hub-path', default=HUB_PATH, help='Caminho do hub')
+    parser.add_argument('--skip-negotiation', action='store_true', help='Conectar direto via WebSocket')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal de execução do benchmark"""
+    print("🚀 SynQcore API - Benchmark de Broadcast do ExecutiveCommunicationHub")
+    print("=" * 50)
+
+    try:
+        results = asyncio.run(run_benchmark(parse_args(argv)))
+        if results:
+            save_benchmark_report("executive_broadcast", results)
+        return results
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark interrompido pelo usuário")
+
+
+if __name__ == "__main__":
+    main()
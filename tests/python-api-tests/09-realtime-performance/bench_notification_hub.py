@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Notificações - CorporateNotificationHub
+
+Este script conecta N clientes em /hubs/corporate-notifications, distribuídos
+em M tópicos, e mede:
+- SubscribeToTopic (latência de subscrição)
+- Fan-out de notificações de tópico (POST /api/CorporateCommunication/notifications/topics/{topic}
+  -> TopicNotification), com entregas perdidas/duplicadas
+- Memória do container da API por conexão (Docker Engine API)
+- RequestUnreadCount com backlog grande para todos os usuários (tempestade de "abrir o app")
+- MarkNotificationAsRead (latência de ida e volta)
+
+Observação: RequestUnreadCount ainda retorna um valor fixo no servidor; a medição
+reflete o custo do hub e deve ser repetida quando a contagem vier do banco.
+
+Execução: python bench_notification_hub.py --clients 2000 --topics 50
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import asyncio
+import argparse
+from typing import Dict, List, Tuple
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.signalr_client import (HubConnection, build_hub_url, create_load_session,
+                                  open_hub_connections, close_hub_connections)
+from utils.load_metrics import summarize_latencies, print_latency_table, print_section, save_benchmark_report
+from utils.docker_metrics import get_container_stats
+
+HUB_PATH = '/hubs/corporate-notifications'
+PUBLISH_ENDPOINT = '/api/CorporateCommunication/notifications/topics/{topic}'
+
+
+def plan_subscriptions(clients: int, topics: int, topics_per_client: int, seed: int) -> List[List[int]]:
+    """Sorteia (de forma determinística) os tópicos de cada cliente"""
+    rng = random.Random(seed)
+    per_client = min(topics_per_client, topics)
+    return [rng.sample(range(topics), per_client) for _ in range(clients)]
+
+
+async def publish_notifications(session, base_url: str, token: str, schedule: List[Tuple[str, Dict]],
+                                rate: float, concurrency: int) -> Tuple[List[float], List[str]]:
+    """Publica notificações via REST em ritmo constante; retorna latências HTTP e erros"""
+    headers = {'Authorization': f'Bearer {token}'}
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    async def publish(topic: str, body: Dict):
+        async with semaphore:
+            body['sentAt'] = time.time() * 1000
+            request = {'title': f"Benchmark {body['seq']}", 'message': json.dumps(body), 'priority': 'Normal'}
+            started = time.perf_counter()
+            try:
+                async with session.post(f"{base_url}{PUBLISH_ENDPOINT.format(topic=topic)}",
+                                        json=request, headers=headers) as response:
+                    await response.read()
+                    if response.status >= 300:
+                        errors.append(f"HTTP {response.status}")
+                        return
+                latencies.append((time.perf_counter() - started) * 1000)
+            except Exception as e:
+                errors.append(str(e) or type(e).__name__)
+
+    tasks = []
+    started = time.perf_counter()
+    for index, (topic, body) in enumerate(schedule):
+        if rate > 0:
+            delay = started + index / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(publish(topic, body)))
+
+    await asyncio.gather(*tasks)
+    return latencies, errors
+
+
+async def timed_invocations(connections: List[HubConnection], method: str, args_for, concurrency: int
+                            ) -> Tuple[List[float], List[str]]:
+    """Invoca `method` em todas as conexões (concorrência limitada) medindo a ida e volta"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    async def call(connection: HubConnection):
+        for args in args_for(connection):
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await connection.invoke(method, *args)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                except Exception as e:
+                    errors.append(f"{method}: {e}")
+
+    await asyncio.gather(*(call(c) for c in connections))
+    return latencies, errors
+
+
+async def run_benchmark(args) -> Dict:
+    """Executa o benchmark completo e retorna os resultados agregados"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Benchmark abortado.")
+        return {}
+
+    run_id = str(int(time.time()))
+    hub_url = build_hub_url(client.base_url, args.hub_path)
+    topic_names = [f"bench_{run_id}_{i}" for i in range(args.topics)]
+    subscriptions = plan_subscriptions(args.clients, args.topics, args.topics_per_client, args.seed)
+
+    # Estado de recebimento: notificações medidas e IDs por conexão (para MarkNotificationAsRead)
+    deliveries: Dict[Tuple[str, int], Dict[int, int]] = {}
+    latencies: List[float] = []
+    received_ids: Dict[int, List[str]] = {}
+    measuring = {'enabled': True}
+
+    def configure(index: int, connection: HubConnection):
+        connection.tag = [topic_names[t] for t in subscriptions[index]]
+
+        def on_topic_notification(arguments, received_at):
+            payload = arguments[0] if arguments else {}
+            try:
+                body = json.loads(payload.get('message') or payload.get('Message') or '{}')
+            except (TypeError, ValueError):
+                return
+            if body.get('run') != run_id:
+                return
+
+            notification_id = payload.get('notificationId') or payload.get('NotificationId')
+            if notification_id:
+                received_ids.setdefault(id(connection), []).append(notification_id)
+            if not measuring['enabled']:
+                return
+
+            key = (body['topic'], body['seq'])
+            receivers = deliveries.setdefault(key, {})
+            receivers[id(connection)] = receivers.get(id(connection), 0) + 1
+            if receivers[id(connection)] == 1:
+                latencies.append(received_at - body['sentAt'])
+
+        connection.on('TopicNotification', on_topic_notification)
+
+    session = create_load_session()
+    connections: List[HubConnection] = []
+
+    try:
+        # 1. Memória de referência antes das conexões
+        baseline = await asyncio.to_thread(get_container_stats, args.container)
+        if not baseline:
+            client.log_warning(f"Não foi possível ler métricas do container {args.container}")
+
+        # 2. Conexões
+        client.log_info(f"🔌 Abrindo {args.clients} conexões em {hub_url}")
+        connections, setup_times, errors, setup_duration = await open_hub_connections(
+            session, hub_url, client.token, args.clients,
+            concurrency=args.concurrency, skip_negotiation=args.skip_negotiation, configure=configure
+        )
+        client.log_success(f"{len(connections)} conexões abertas em {setup_duration:.1f}s")
+        if errors:
+            client.log_warning(f"{len(errors)} conexões falharam (ex: {errors[0]})")
+
+        # 3. Subscrições
+        client.log_info(f"🏷️  Subscrevendo {args.topics_per_client} tópicos por cliente ({args.topics} tópicos)")
+        subscribe_latencies, invoke_errors = await timed_invocations(
+            connections, 'SubscribeToTopic', lambda c: [(topic,) for topic in c.tag], args.concurrency
+        )
+
+        # Memória após conexões e subscrições estabilizarem
+        await asyncio.sleep(args.settle)
+        loaded = await asyncio.to_thread(get_container_stats, args.container)
+        memory = {}
+        if baseline and loaded and connections:
+            delta = loaded.memory_bytes - baseline.memory_bytes
+            memory = {
+                'baseline_bytes': baseline.memory_bytes,
+                'loaded_bytes': loaded.memory_bytes,
+                'delta_bytes': delta,
+                'bytes_per_connection': round(delta / len(connections), 1),
+            }
+
+        subscribers: Dict[str, int] = {}
+        for connection in connections:
+            for topic in connection.tag:
+                subscribers[topic] = subscribers.get(topic, 0) + 1
+
+        # 4. Fan-out medido
+        schedule = [(topic, {'run': run_id, 'topic': topic, 'seq': seq})
+                    for seq in range(args.notifications_per_topic) for topic in topic_names]
+        random.Random(args.seed).shuffle(schedule)
+
+        client.log_info(f"📣 Publicando {len(schedule)} notificações a {args.publish_rate} notif/s")
+        publish_latencies, publish_errors = await publish_notifications(
+            session, client.base_url, client.token, schedule, args.publish_rate, args.concurrency
+        )
+        await asyncio.sleep(args.drain)
+
+        expected = sum(subscribers.get(topic, 0) for topic, _ in schedule)
+        delivered = sum(len(r) for r in deliveries.values())
+        duplicated = sum(count - 1 for r in deliveries.values() for count in r.values())
+
+        # 5. Backlog grande para todos os usuários (não medido)
+        measuring['enabled'] = False
+        if args.backlog > 0:
+            backlog = [(topic, {'run': run_id, 'topic': topic, 'seq': args.notifications_per_topic + seq})
+                       for seq in range(args.backlog) for topic in topic_names]
+            client.log_info(f"📚 Gerando backlog de {len(backlog)} notificações")
+            _, backlog_errors = await publish_notifications(
+                session, client.base_url, client.token, backlog, 0, args.concurrency
+            )
+            publish_errors.extend(backlog_errors)
+            await asyncio.sleep(args.drain)
+
+        # 6. Tempestade de RequestUnreadCount (todos os clientes "abrem o app" ao mesmo tempo)
+        client.log_info("🔔 Medindo RequestUnreadCount em todos os clientes")
+        unread_latencies, unread_errors = await timed_invocations(
+            connections, 'RequestUnreadCount', lambda c: [()], args.concurrency
+        )
+
+        # 7. MarkNotificationAsRead para as primeiras notificações recebidas
+        client.log_info("✔️  Medindo MarkNotificationAsRead")
+        mark_latencies, mark_errors = await timed_invocations(
+            connections, 'MarkNotificationAsRead',
+            lambda c: [(notification_id,) for notification_id in received_ids.get(id(c), [])[:args.mark_read]],
+            args.concurrency
+        )
+
+        invoke_errors += unread_errors + mark_errors
+        results = {
+            'parameters': vars(args),
+            'connections': {
+                'requested': args.clients,
+                'opened': len(connections),
+                'failed': len(errors),
+                'setup_duration_s': round(setup_duration, 2),
+                'setup_latency_ms': summarize_latencies(setup_times),
+            },
+            'memory': memory,
+            'latency_ms': {
+                'SubscribeToTopic': summarize_latencies(subscribe_latencies),
+                'Publicação HTTP': summarize_latencies(publish_latencies),
+                'Entrega TopicNotification': summarize_latencies(latencies),
+                'RequestUnreadCount': summarize_latencies(unread_latencies),
+                'MarkNotificationAsRead': summarize_latencies(mark_latencies),
+            },
+            'deliveries': {
+                'notifications': len(schedule),
+                'expected': expected,
+                'delivered': delivered,
+                'dropped': max(expected - delivered, 0),
+                'duplicated': duplicated,
+            },
+            'errors_sample': (publish_errors + invoke_errors)[:10],
+        }
+
+        print_latency_table("🔔 LATÊNCIAS DO HUB DE NOTIFICAÇÕES (ms)", results['latency_ms'], key_header="Operação")
+
+        print_section("📦 ENTREGAS E MEMÓRIA")
+        deliveries_summary = results['deliveries']
+        print(f"   Esperadas: {deliveries_summary['expected']} | Entregues: {deliveries_summary['delivered']} | "
+              f"Perdidas: {deliveries_summary['dropped']} | Duplicadas: {deliveries_summary['duplicated']}")
+        if memory:
+            print(f"   Memória da API: {baseline.memory_bytes / 1024 ** 2:.1f}MiB -> {loaded.memory_bytes / 1024 ** 2:.1f}MiB "
+                  f"({memory['bytes_per_connection'] / 1024:.1f}KiB por conexão)")
+        if publish_errors or invoke_errors:
+            print(f"   ⚠️  Erros: {len(publish_errors)} publicações, {len(invoke_errors)} invocações")
+
+        return results
+
+    finally:
+        await close_hub_connections(connections)
+        await session.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do CorporateNotificationHub")
+    parser.add_argument('--clients', type=int, default=500, help='Clientes conectados (N)')
+    parser.add_argument('--topics', type=int, default=20, help='Tópicos distintos (M)')
+    parser.add_argument('--topics-per-client', type=int, default=3, help='Tópicos assinados por cliente')
+    parser.add_argument('--notifications-per-topic', type=int, default=10, help='Notificações medidas por tópico')
+    parser.add_argument('--publish-rate', type=float, default=20, help='Publicações por segundo (medidas)')
+    parser.add_argument('--backlog', type=int, default=200, help='Notificações de backlog por tópico antes do RequestUnreadCount')
+    parser.add_argument('--mark-read', type=int, default=5, help='Notificações marcadas como lidas por cliente')
+    parser.add_argument('--concurrency', type=int, default=200, help='Operações simultâneas')
+    parser.add_argument('--settle', type=float, default=5, help='Segundos antes de medir a memória')
+    parser.add_argument('--drain', type=float, default=10, help='Segundos aguardando entregas após publicar')
+    parser.add_argument('--container', default='synqcore-api', help='Container da API para métricas de memória')
+    parser.add_argument('--seed', type=int, default=42, help='Semente das subscrições')
+    parser.add_argument('--hub-path', default=HUB_PATH, help='Caminho do hub')
+    parser.add_argument('--skip-negotiation', action='store_true', help='Conectar direto via WebSocket')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal de execução do benchmark"""
+    print("🚀 SynQcore API - Benchmark do CorporateNotificationHub")
+    print("=" * 50)
+
+    try:
+        results = asyncio.run(run_benchmark(parse_args(argv)))
+        if results:
+            save_benchmark_report("notification_hub", results)
+        return results
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark interrompido pelo usuário")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Simulação de Tempestade de Presença - CorporateCollaborationHub
+
+Simula a troca de turno: N clientes conectados em /hubs/corporate-collaboration
+alternam o status (Online/Away) via UpdatePresenceStatus dentro de uma janela
+curta, em ondas repetidas. Cada atualização é retransmitida para todos os outros
+clientes (Clients.Others -> UserPresenceChanged), e o script mede:
+- Amplificação do broadcast (mensagens recebidas por atualização; ideal = N-1)
+- Latência de propagação ponta a ponta (percentis por onda)
+- Backlog de entregas ao longo do tempo (esperado - recebido) e memória da API,
+  para indicar se o hub acompanha ou acumula filas de envio sem limite
+
+Execução: python bench_presence_storm.py --connections 1000 --waves 3 --storm-window 5
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+import multiprocessing
+from typing import Dict, List, Tuple
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.signalr_client import (HubConnection, build_hub_url, create_load_session,
+                                  open_hub_connections, close_hub_connections)
+from utils.load_metrics import summarize_latencies, print_latency_table, print_section, save_benchmark_report
+from utils.docker_metrics import get_container_stats
+
+HUB_PATH = '/hubs/corporate-collaboration'
+PRESENCE_STATES = ('Away', 'Online')
+
+
+def build_schedule(connections: int, waves: int, storm_fraction: float, storm_window: float,
+                   interval: float, seed: int) -> List[Tuple[float, int, int]]:
+    """
+    Agenda de atualizações: (offset_em_s, índice_da_conexão, onda).
+
+    Em cada onda, uma fração dos clientes troca de status em instantes
+    uniformemente sorteados dentro da janela da tempestade.
+    """
+    rng = random.Random(seed)
+    schedule = []
+    flipping = max(1, int(connections * storm_fraction))
+
+    for wave in range(waves):
+        wave_start = wave * (storm_window + interval)
+        for index in rng.sample(range(connections), flipping):
+            schedule.append((wave_start + rng.uniform(0, storm_window), index, wave))
+
+    return sorted(schedule)
+
+
+async def _worker_main(pipe, hub_url: str, token: str, indices: List[int], updates: List[Tuple[float, int, int]],
+                       run_id: str, concurrency: int, skip_negotiation: bool, max_samples: int):
+    """Processo do pool: abre suas conexões, envia sua parte da agenda e agrega recebimentos"""
+    rng = random.Random(indices[0] if indices else 0)
+    stats = {
+        'received': 0,
+        'received_per_second': {},   # segundo -> [quantidade, soma_latência, latência_máxima]
+        'sent_per_second': {},
+        'samples': {},               # onda -> amostra (reservoir) de latências
+        'seen_per_wave': {},
+        'sent': 0,
+        'send_errors': 0,
+    }
+    epoch = {'ms': None}
+
+    def on_presence_changed(arguments, received_at):
+        payload = arguments[0] if arguments else {}
+        status = payload.get('status') or payload.get('Status') or ''
+        parts = status.split('|')
+        if len(parts) != 5 or parts[1] != run_id or epoch['ms'] is None:
+            return
+
+        latency = received_at - float(parts[4])
+        wave = int(parts[3])
+        second = int((received_at - epoch['ms']) // 1000)
+        bucket = stats['received_per_second'].setdefault(second, [0, 0.0, 0.0])
+        bucket[0] += 1
+        bucket[1] += latency
+        bucket[2] = max(bucket[2], latency)
+        stats['received'] += 1
+
+        # Reservoir sampling por onda para limitar memória com milhões de entregas
+        seen = stats['seen_per_wave'].get(wave, 0) + 1
+        stats['seen_per_wave'][wave] = seen
+        samples = stats['samples'].setdefault(wave, [])
+        if len(samples) < max_samples:
+            samples.append(latency)
+        else:
+            slot = rng.randrange(seen)
+            if slot < max_samples:
+                samples[slot] = latency
+
+    def configure(index: int, connection: HubConnection):
+        connection.tag = indices[index]
+        connection.on('UserPresenceChanged', on_presence_changed)
+
+    session = create_load_session()
+    connections: List[HubConnection] = []
+    loop = asyncio.get_running_loop()
+
+    try:
+        connections, setup_times, errors, _ = await open_hub_connections(
+            session, hub_url, token, len(indices), concurrency=concurrency,
+            skip_negotiation=skip_negotiation, configure=configure
+        )
+        by_index = {c.tag: c for c in connections}
+        pipe.send(('ready', len(connections), len(errors), errors[:5], setup_times))
+
+        # O coordenador pode encerrar ('stop') antes de dar a largada se outro worker falhou
+        message = await loop.run_in_executor(None, pipe.recv)
+        if message == 'stop':
+            return
+        _, start_epoch_s = message
+        epoch['ms'] = start_epoch_s * 1000
+
+        async def send_update(offset: float, index: int, wave: int):
+            delay = start_epoch_s + offset - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            connection = by_index.get(index)
+            if connection is None or not connection.is_open:
+                stats['send_errors'] += 1
+                return
+            sent_at = time.time() * 1000
+            status = f"{PRESENCE_STATES[wave % 2]}|{run_id}|{index}|{wave}|{sent_at}"
+            try:
+                await connection.send('UpdatePresenceStatus', status)
+                stats['sent'] += 1
+                second = int((sent_at - epoch['ms']) // 1000)
+                stats['sent_per_second'][second] = stats['sent_per_second'].get(second, 0) + 1
+            except Exception:
+                stats['send_errors'] += 1
+
+        await asyncio.gather(*(send_update(*update) for update in updates))
+
+        while True:
+            command = await loop.run_in_executor(None, pipe.recv)
+            if command == 'collect':
+                stats['closed_during_run'] = sum(1 for c in connections if not c.is_open)
+                pipe.send(('results', stats))
+            elif command == 'stop':
+                break
+
+    finally:
+        await close_hub_connections(connections)
+        await session.close()
+
+
+def presence_worker(*args):
+    """Ponto de entrada de cada processo do pool"""
+    try:
+        asyncio.run(_worker_main(*args))
+    except KeyboardInterrupt:
+        pass
+
+
+async def sample_memory(container: str, interval: float, samples: List[Tuple[float, int]], stop: asyncio.Event):
+    """Amostra a memória do container da API até `stop` ser sinalizado"""
+    started = time.time()
+    while not stop.is_set():
+        stats = await asyncio.to_thread(get_container_stats, container)
+        if stats:
+            samples.append((round(time.time() - started, 1), stats.memory_bytes))
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_benchmark(args) -> Dict:
+    """Executa a tempestade de presença e retorna os resultados agregados"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Benchmark abortado.")
+        return {}
+
+    run_id = str(int(time.time()))
+    hub_url = build_hub_url(client.base_url, args.hub_path)
+    schedule = build_schedule(args.connections, args.waves, args.storm_fraction,
+                              args.storm_window, args.interval, args.seed)
+    processes = max(1, min(args.processes, args.connections))
+    partitions = [list(range(p, args.connections, processes)) for p in range(processes)]
+    owner = {index: p for p, indices in enumerate(partitions) for index in indices}
+
+    context = multiprocessing.get_context('spawn')
+    loop = asyncio.get_running_loop()
+    workers = []
+
+    client.log_info(f"🔌 Abrindo {args.connections} conexões em {processes} processos")
+    for p, indices in enumerate(partitions):
+        updates = [update for update in schedule if owner[update[1]] == p]
+        parent_pipe, child_pipe = context.Pipe()
+        process = context.Process(
+            target=presence_worker,
+            args=(child_pipe, hub_url, client.token, indices, updates, run_id,
+                  args.concurrency, args.skip_negotiation, args.max_samples),
+            daemon=True
+        )
+        process.start()
+        child_pipe.close()
+        workers.append((process, parent_pipe))
+
+    memory_samples: List[Tuple[float, int]] = []
+    stop_sampling = asyncio.Event()
+    sampler = None
+
+    try:
+        ready = []
+        for _, pipe in workers:
+            try:
+                ready.append(await loop.run_in_executor(None, pipe.recv))
+            except EOFError:
+                ready.append(('failed', 0, 0, ['processo finalizou antes de ficar pronto'], []))
+        opened = sum(r[1] for r in ready)
+        failed = sum(r[2] for r in ready)
+        client.log_success(f"{opened} conexões abertas ({failed} falhas)")
+
+        sampler = asyncio.create_task(sample_memory(args.container, args.sample_interval, memory_samples, stop_sampling))
+
+        # Início sincronizado: todos os processos usam o mesmo epoch de relógio
+        start_epoch = time.time() + 2
+        for _, pipe in workers:
+            pipe.send(('start', start_epoch))
+
+        total_duration = args.waves * (args.storm_window + args.interval)
+        client.log_info(f"🌪️  {len(schedule)} atualizações em {args.waves} ondas ({total_duration:.0f}s + {args.drain}s de drenagem)")
+        await asyncio.sleep(max(start_epoch - time.time(), 0) + total_duration + args.drain)
+
+        stop_sampling.set()
+        await sampler
+
+        merged = {'received': 0, 'sent': 0, 'send_errors': 0, 'closed_during_run': 0,
+                  'received_per_second': {}, 'sent_per_second': {}, 'samples': {}}
+        for _, pipe in workers:
+            try:
+                pipe.send('collect')
+                _, stats = await loop.run_in_executor(None, pipe.recv)
+            except (EOFError, BrokenPipeError, OSError):
+                continue
+            for key in ('received', 'sent', 'send_errors', 'closed_during_run'):
+                merged[key] += stats[key]
+            for second, (count, latency_sum, latency_max) in stats['received_per_second'].items():
+                bucket = merged['received_per_second'].setdefault(second, [0, 0.0, 0.0])
+                bucket[0] += count
+                bucket[1] += latency_sum
+                bucket[2] = max(bucket[2], latency_max)
+            for second, count in stats['sent_per_second'].items():
+                merged['sent_per_second'][second] = merged['sent_per_second'].get(second, 0) + count
+            for wave, samples in stats['samples'].items():
+                merged['samples'].setdefault(wave, []).extend(samples)
+
+        # Linha do tempo: backlog = entregas esperadas até o segundo t - entregas recebidas até t
+        fanout = max(opened - 1, 0)
+        last_second = max(list(merged['received_per_second']) + list(merged['sent_per_second']) + [0])
+        timeline = []
+        expected_cumulative = received_cumulative = 0
+        for second in range(last_second + 1):
+            expected_cumulative += merged['sent_per_second'].get(second, 0) * fanout
+            count, latency_sum, latency_max = merged['received_per_second'].get(second, [0, 0.0, 0.0])
+            received_cumulative += count
+            timeline.append({
+                'second': second,
+                'updates_sent': merged['sent_per_second'].get(second, 0),
+                'received': count,
+                'mean_latency_ms': round(latency_sum / count, 2) if count else None,
+                'max_latency_ms': round(latency_max, 2) if count else None,
+                'backlog': expected_cumulative - received_cumulative,
+            })
+
+        # Backlog ao fim de cada onda (antes da próxima começar)
+        wave_end_backlog = []
+        for wave in range(args.waves):
+            wave_end = int((wave + 1) * (args.storm_window + args.interval))
+            point = timeline[min(wave_end, len(timeline) - 1)] if timeline else {'backlog': 0}
+            wave_end_backlog.append(point['backlog'])
+
+        expected_total = merged['sent'] * fanout
+        delivery_ratio = merged['received'] / expected_total if expected_total else 0
+        growing = len(wave_end_backlog) > 1 and all(b > a for a, b in zip(wave_end_backlog, wave_end_backlog[1:]))
+        keeps_up = delivery_ratio >= 0.999 and not growing
+
+        results = {
+            'parameters': vars(args),
+            'connections': {'requested': args.connections, 'opened': opened, 'failed': failed,
+                            'closed_during_run': merged['closed_during_run']},
+            'updates': {'scheduled': len(schedule), 'sent': merged['sent'], 'send_errors': merged['send_errors']},
+            'amplification': {
+                'ideal_per_update': fanout,
+                'received_total': merged['received'],
+                'received_per_update': round(merged['received'] / merged['sent'], 1) if merged['sent'] else 0,
+                'delivery_ratio': round(delivery_ratio, 4),
+            },
+            'latency_by_wave_ms': {str(wave): summarize_latencies(samples)
+                                   for wave, samples in sorted(merged['samples'].items())},
+            'wave_end_backlog': wave_end_backlog,
+            'keeps_up': keeps_up,
+            'timeline': timeline,
+            'api_memory_samples': memory_samples,
+        }
+
+        print_latency_table("🌪️  LATÊNCIA DE PROPAGAÇÃO POR ONDA (ms)",
+                            {f"Onda {int(wave) + 1}": s for wave, s in results['latency_by_wave_ms'].items()},
+                            key_header="Onda")
+
+        print_section("📡 AMPLIFICAÇÃO E FILAS")
+        amplification = results['amplification']
+        print(f"   Atualizações enviadas: {merged['sent']} | Recebidas: {merged['received']}")
+        print(f"   Mensagens por atualização: {amplification['received_per_update']} (ideal {fanout})")
+        print(f"   Taxa de entrega: {amplification['delivery_ratio'] * 100:.2f}%")
+        print(f"   Backlog ao fim de cada onda: {wave_end_backlog}")
+        if memory_samples:
+            print(f"   Memória da API: {memory_samples[0][1] / 1024 ** 2:.1f}MiB -> "
+                  f"{max(m for _, m in memory_samples) / 1024 ** 2:.1f}MiB (pico)")
+        if keeps_up:
+            client.log_success("O hub acompanhou a tempestade (backlog drenado)")
+        else:
+            client.log_warning("O hub não acompanhou: backlog crescente ou entregas pendentes após a drenagem")
+
+        return results
+
+    finally:
+        stop_sampling.set()
+        if sampler and not sampler.done():
+            sampler.cancel()
+        for _, pipe in workers:
+            try:
+                pipe.send('stop')
+            except (BrokenPipeError, OSError):
+                pass
+        for process, _ in workers:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tempestade de atualizações de presença no CorporateCollaborationHub")
+    parser.add_argument('--connections', type=int, default=1000, help='Clientes conectados (N)')
+    parser.add_argument('--waves', type=int, default=3, help='Ondas de troca de status')
+    parser.add_argument('--storm-fraction', type=float, default=1.0, help='Fração dos clientes que muda de status por onda')
+    parser.add_argument('--storm-window', type=float, default=5, help='Duração de cada onda (s)')
+    parser.add_argument('--interval', type=float, default=10, help='Pausa entre ondas (s)')
+    parser.add_argument('--drain', type=float, default=15, help='Segundos aguardando entregas após a última onda')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 4, help='Processos do pool de clientes')
+    parser.add_argument('--concurrency', type=int, default=100, help='Handshakes simultâneos por processo')
+    parser.add_argument('--max-samples', type=int, default=50000, help='Amostras de latência por onda e processo')
+    parser.add_argument('--sample-interval', type=float, default=2, help='Intervalo de amostragem de memória (s)')
+    parser.add_argument('--container', default='synqcore-api', help='Container da API para métricas de memória')
+    parser.add_argument('--seed', type=int, default=42, help='Semente da agenda')
+    parser.add_argument('--hub-path', default=HUB_PATH, help='Caminho do hub')
+    parser.add_argument('--skip-negotiation', action='store_true', help='Conectar direto via WebSocket')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal de execução da simulação"""
+    print("🚀 SynQcore API - Tempestade de Presença")
+    print("=" * 50)
+
+    try:
+        results = asyncio.run(run_benchmark(parse_args(argv)))
+        if results:
+            save_benchmark_report("presence_storm", results)
+        return results
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Simulação interrompida pelo usuário")
+
+
+if __name__ == "__main__":
+    main()
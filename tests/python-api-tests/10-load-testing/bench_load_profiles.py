@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Perfis de Carga - Degrau, Pico e Dente de Serra
+
+Este script aplica perfis de taxa de chegada em laço aberto contra qualquer alvo dos
+testes de carga (jornadas, categorias de teste ou endpoints explícitos):
+- step: degraus crescentes de taxa
+- spike: pico súbito (ex: 10x, logins da manhã ou anúncio geral)
+- sawtooth: rampas repetidas com queda abrupta
+
+A cada segundo registra vazão, latência e erros da API, conexões do Postgres
+(pool do Npgsql), operações/s e clientes do Redis e CPU do container da API.
+Ao final mede quanto tempo cada métrica leva para voltar ao patamar anterior à
+perturbação.
+
+Execução: python bench_load_profiles.py --profile spike --category feed --base-rate 20 --multiplier 10
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+from typing import Dict, List, Optional, Tuple
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.load_generator import (AsyncAPIClient, LoadProfile, WorkloadRecorder, create_http_session, run_open_loop,
+                                  step_profile, spike_profile, sawtooth_profile)
+from utils.journeys import build_target, preflight
+from utils.load_metrics import percentile, print_latency_table, print_section, save_benchmark_report
+from utils.docker_metrics import get_container_cpu_usage_ns, get_postgres_connections, get_redis_info
+
+# Métricas acompanhadas na recuperação: (chave, folga absoluta somada ao limite)
+RECOVERY_METRICS = {
+    'p99_ms': 5.0,
+    'error_rate': 0.5,
+    'db_connections': 2,
+    'db_active': 1,
+    'redis_clients': 2,
+    'api_cpu_percent': 5.0,
+}
+
+
+def build_profile(args) -> LoadProfile:
+    """Monta o perfil pedido a partir dos argumentos"""
+    if args.profile == 'step':
+        return step_profile(args.base_rate, args.step_rate, args.step_duration, args.steps,
+                            warmup=args.warmup, recovery=args.recovery)
+    if args.profile == 'sawtooth':
+        return sawtooth_profile(args.base_rate, args.peak_rate or args.base_rate * args.multiplier,
+                                args.period, args.teeth, warmup=args.warmup, recovery=args.recovery)
+    return spike_profile(args.base_rate, args.multiplier, args.spike_duration,
+                         warmup=args.warmup, recovery=args.recovery)
+
+
+async def sample_resources(args, started: float, resources: Dict[int, Dict], stop: asyncio.Event):
+    """Amostra Postgres, Redis e CPU da API aproximadamente uma vez por segundo"""
+    previous_cpu: Optional[Tuple[float, int]] = None
+    while not stop.is_set():
+        tick = time.time()
+        db, redis, cpu = await asyncio.gather(
+            asyncio.to_thread(get_postgres_connections, args.postgres_container),
+            asyncio.to_thread(get_redis_info, '', args.redis_container),
+            asyncio.to_thread(get_container_cpu_usage_ns, args.container),
+        )
+
+        sample: Dict = {}
+        if db is not None:
+            sample['db_connections'] = sum(db.values())
+            sample['db_active'] = db.get('active', 0)
+        if redis:
+            sample['redis_ops'] = int(redis.get('instantaneous_ops_per_sec', 0))
+            sample['redis_clients'] = int(redis.get('connected_clients', 0))
+        if cpu is not None:
+            if previous_cpu:
+                elapsed = tick - previous_cpu[0]
+                sample['api_cpu_percent'] = round((cpu - previous_cpu[1]) / 1e9 / elapsed * 100, 1)
+            previous_cpu = (tick, cpu)
+        resources[int(tick - started)] = sample
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=max(args.resource_interval - (time.time() - tick), 0))
+        except asyncio.TimeoutError:
+            pass
+
+
+async def report_seconds(profile: LoadProfile, recorder: WorkloadRecorder, started: float,
+                         resources: Dict[int, Dict], timeline: List[Dict], stop: asyncio.Event):
+    """Fecha um segundo por vez: drena as requisições concluídas e imprime a linha do segundo"""
+    second = 0
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=max(started + second + 1 - time.time(), 0))
+        except asyncio.TimeoutError:
+            pass
+
+        samples = recorder.drain()
+        latencies = [s.latency_ms for s in samples if s.success]
+        errors = sum(1 for s in samples if not s.success)
+        row = {
+            'second': second,
+            'offered_rate': round(profile.rate(second + 0.5), 1) if second < profile.duration else 0,
+            'throughput': len(latencies),  # Só requisições bem-sucedidas (ok/s)
+            'errors': errors,
+            'error_rate': round(errors / len(samples) * 100, 2) if samples else 0.0,
+            'p50_ms': round(percentile(latencies, 50), 1) if latencies else None,
+            'p99_ms': round(percentile(latencies, 99), 1) if latencies else None,
+            **resources.get(second, resources.get(second - 1, {})),
+        }
+        timeline.append(row)
+        print(f"[{second:>4}s] oferta {row['offered_rate']:>7}/s | {row['throughput']:>5} ok/s | "
+              f"p50 {row['p50_ms']}ms p99 {row['p99_ms']}ms | erros {row['errors']} | "
+              f"db {row.get('db_connections', '-')} ({row.get('db_active', '-')} ativas) | "
+              f"redis {row.get('redis_ops', '-')} ops/s {row.get('redis_clients', '-')} clientes | "
+              f"cpu {row.get('api_cpu_percent', '-')}%")
+        second += 1
+
+
+def baseline_value(timeline: List[Dict], key: str, until: float, skip: float = 5) -> Optional[float]:
+    """Mediana da métrica no período estável (ignorando os primeiros segundos de aquecimento)"""
+    values = [r[key] for r in timeline if skip <= r['second'] < until and r.get(key) is not None]
+    if not values and skip > 0:
+        return baseline_value(timeline, key, until, skip=0)
+    return percentile(values, 50) if values else None
+
+
+def recovery_time(timeline: List[Dict], key: str, start: float, threshold: float, stable: int) -> Optional[int]:
+    """Segundos após `start` até a métrica ficar `stable` segundos seguidos abaixo do limite"""
+    consecutive = 0
+    for row in timeline:
+        if row['second'] < start:
+            continue
+        value = row.get(key)
+        if value is not None and value <= threshold:
+            consecutive += 1
+            if consecutive >= stable:
+                return int(row['second'] - stable + 1 - start)
+        else:
+            consecutive = 0
+    return None
+
+
+def analyze_recovery(profile: LoadProfile, timeline: List[Dict], args) -> Dict:
+    """Pico de cada métrica e tempo de recuperação após cada queda de taxa"""
+    analysis = {}
+    for key, slack in RECOVERY_METRICS.items():
+        baseline = baseline_value(timeline, key, profile.baseline_end)
+        if baseline is None:
+            continue
+        threshold = baseline * args.tolerance + slack
+        peak = max((r[key] for r in timeline if r.get(key) is not None), default=None)
+        analysis[key] = {
+            'baseline': round(baseline, 2),
+            'threshold': round(threshold, 2),
+            'peak': peak,
+            'recovery_s': [recovery_time(timeline, key, drop, threshold, args.stable_seconds)
+                           for drop in profile.drops],
+        }
+    return analysis
+
+
+async def run_benchmark(args) -> Dict:
+    """Executa o perfil de carga e retorna a linha do tempo e a análise de recuperação"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Benchmark abortado.")
+        return {}
+
+    profile = build_profile(args)
+    session = create_http_session(args.max_connections)
+    timeline: List[Dict] = []
+    resources: Dict[int, Dict] = {}
+
+    try:
+        api = AsyncAPIClient(session, client.base_url, client.token, timeout=client.timeout)
+        journeys = await preflight(api, build_target(args.endpoints, args.category, args.journeys),
+                                   client.log_warning)
+        if not journeys:
+            client.log_error("Nenhum alvo válido para o perfil de carga")
+            return {}
+
+        client.log_info(f"📈 Perfil {profile.name} por {profile.duration:.0f}s contra {len(journeys)} alvo(s)")
+        recorder = WorkloadRecorder()
+        stop = asyncio.Event()
+        started = time.time()
+        sampler = asyncio.create_task(sample_resources(args, started, resources, stop))
+        reporter = asyncio.create_task(report_seconds(profile, recorder, started, resources, timeline, stop))
+
+        try:
+            _, stats = await run_open_loop(api, journeys, profile.rate, profile.duration, seed=args.seed,
+                                           think_scale=args.think_scale, max_in_flight=args.max_in_flight,
+                                           recorder=recorder)
+        finally:
+            stop.set()
+            await asyncio.gather(sampler, reporter, return_exceptions=True)
+
+    finally:
+        await session.close()
+
+    recovery = analyze_recovery(profile, timeline, args)
+    rows = {}
+    for key, info in recovery.items():
+        rows[key] = {
+            'base': info['baseline'],
+            'limite': info['threshold'],
+            'pico': info['peak'],
+            'recuperação_s': ', '.join('não recuperou' if r is None else str(r) for r in info['recovery_s']) or '-',
+        }
+    print_latency_table(f"🔁 RECUPERAÇÃO APÓS O PERFIL {profile.name.upper()}", rows, key_header="Métrica")
+
+    print_section("📦 GERADOR")
+    print(f"   Chegadas agendadas: {stats.scheduled} | Iniciadas: {stats.started} | Descartadas: {stats.shed}")
+    print(f"   Lag p99 do gerador: {percentile(stats.lag_ms, 99):.1f}ms")
+
+    return {
+        'parameters': vars(args),
+        'profile': {'name': profile.name, 'duration_s': profile.duration,
+                    'baseline_end_s': profile.baseline_end, 'drops_s': profile.drops},
+        'targets': [j.name for j in journeys],
+        'generator': {'scheduled': stats.scheduled, 'started': stats.started, 'shed': stats.shed,
+                      'lag_p99_ms': round(percentile(stats.lag_ms, 99), 2)},
+        'recovery': recovery,
+        'timeline': timeline,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Perfis de carga degrau, pico e dente de serra")
+    parser.add_argument('--profile', choices=['step', 'spike', 'sawtooth'], default='spike', help='Perfil de carga')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--category', help='Categorias de teste como alvo (ex: feed,search)')
+    target.add_argument('--endpoints', help='Endpoints explícitos (ex: "GET /api/Feed,GET /api/Tags")')
+    target.add_argument('--journeys', default='', help='Jornadas como alvo (padrão: mistura completa)')
+    parser.add_argument('--base-rate', type=float, default=20, help='Taxa base por segundo')
+    parser.add_argument('--multiplier', type=float, default=10, help='Multiplicador do pico (spike/sawtooth)')
+    parser.add_argument('--spike-duration', type=float, default=30, help='Duração do pico em segundos')
+    parser.add_argument('--step-rate', type=float, default=20, help='Incremento de taxa por degrau')
+    parser.add_argument('--step-duration', type=float, default=30, help='Duração de cada degrau')
+    parser.add_argument('--steps', type=int, default=5, help='Quantidade de degraus')
+    parser.add_argument('--peak-rate', type=float, help='Taxa no topo do dente de serra (padrão: base x multiplicador)')
+    parser.add_argument('--period', type=float, default=60, help='Duração de cada dente de serra')
+    parser.add_argument('--teeth', type=int, default=3, help='Quantidade de dentes de serra')
+    parser.add_argument('--warmup', type=float, default=30, help='Segundos na taxa base antes da perturbação')
+    parser.add_argument('--recovery', type=float, default=120, help='Segundos na taxa base após a perturbação')
+    parser.add_argument('--tolerance', type=float, default=1.2, help='Múltiplo da linha de base considerado recuperado')
+    parser.add_argument('--stable-seconds', type=int, default=5, help='Segundos seguidos dentro do limite')
+    parser.add_argument('--resource-interval', type=float, default=1, help='Intervalo de amostragem de recursos')
+    parser.add_argument('--think-scale', type=float, default=0.0, help='Pensamento entre passos das jornadas')
+    parser.add_argument('--max-in-flight', type=int, default=10000, help='Requisições simultâneas máximas')
+    parser.add_argument('--max-connections', type=int, default=0, help='Limite de conexões HTTP (0 = sem limite)')
+    parser.add_argument('--container', default='synqcore-api', help='Container da API')
+    parser.add_argument('--postgres-container', default='synqcore-postgres', help='Container do Postgres')
+    parser.add_argument('--redis-container', default='synqcore-redis', help='Container do Redis')
+    parser.add_argument('--seed', type=int, default=42, help='Semente das chegadas')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal de execução do benchmark"""
+    print("🚀 SynQcore API - Perfis de Carga")
+    print("=" * 50)
+
+    try:
+        results = asyncio.run(run_benchmark(parse_args(argv)))
+        if results:
+            save_benchmark_report(f"load_profile_{results['profile']['name']}", results)
+        return results
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark interrompido pelo usuário")
+
+
+if __name__ == "__main__":
+    main()
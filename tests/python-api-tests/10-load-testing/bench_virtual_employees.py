@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Teste de Carga - Funcionários Virtuais
+
+Este script simula funcionários executando jornadas ponderadas sobre os endpoints existentes:
+- Ler feed (GET /api/Feed -> GET /api/Feed/{postId})
+- Buscar (GET /api/CorporateSearch/suggestions -> GET /api/CorporateSearch -> similar)
+- Abrir discussão (GET /api/DiscussionThreads/posts/{postId}/thread)
+- Curtir post (POST /api/Feed/{postId}/like)
+- Publicar post (POST /api/Feed -> GET /api/Feed/{postId})
+- Upload de documento (POST /api/MediaAssets -> GET /api/MediaAssets/{id})
+
+Cada funcionário sorteia jornadas pelo peso, com tempos de pensamento entre os passos,
+e o relatório traz latência por jornada e por passo.
+
+Execução: python bench_virtual_employees.py --employees 200 --duration 300
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+from typing import Dict
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.load_generator import AsyncAPIClient, create_http_session, run_virtual_employees
+from utils.journeys import journeys_by_name
+from utils.load_metrics import print_latency_table, print_section, save_benchmark_report
+
+
+async def run_benchmark(args) -> Dict:
+    """Executa os funcionários virtuais e retorna os resultados agregados"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Benchmark abortado.")
+        return {}
+
+    journeys = journeys_by_name(args.journeys)
+    if not journeys:
+        client.log_error(f"Nenhuma jornada encontrada para: {args.journeys}")
+        return {}
+
+    total_weight = sum(j.weight for j in journeys)
+    print_section("🧭 MISTURA DE JORNADAS")
+    for journey in journeys:
+        print(f"   {journey.name}: {journey.weight / total_weight * 100:.0f}% ({len(journey.steps)} passos)")
+
+    client.log_info(f"👥 {args.employees} funcionários virtuais por {args.duration}s "
+                    f"(ramp-up {args.ramp_up}s, pensamento x{args.think_scale})")
+    session = create_http_session(args.max_connections)
+    started = time.perf_counter()
+    try:
+        api = AsyncAPIClient(session, client.base_url, client.token, timeout=client.timeout)
+        recorder = await run_virtual_employees(api, journeys, args.employees, args.duration, seed=args.seed,
+                                               ramp_up=args.ramp_up, think_scale=args.think_scale)
+    finally:
+        await session.close()
+    elapsed = time.perf_counter() - started
+
+    samples = recorder.samples
+    errors = [s for s in samples if not s.success]
+    throughput = len(samples) / elapsed if elapsed > 0 else 0
+    results = {
+        'parameters': vars(args),
+        'requests': len(samples),
+        'errors': len(errors),
+        'elapsed_s': round(elapsed, 1),
+        'throughput_rps': round(throughput, 1),
+        'journeys': recorder.summary_by_journey(),
+        'steps': recorder.summary_by_step(),
+        'errors_sample': [f"{s.method} {s.endpoint}: {s.error_message}" for s in errors[:10]],
+    }
+
+    print_latency_table("🧭 DURAÇÃO POR JORNADA (ms, com pensamento)", results['journeys'], key_header="Jornada")
+    print_latency_table("👣 LATÊNCIA POR PASSO (ms)", results['steps'], key_header="Jornada / Passo")
+    print(f"Requisições: {len(samples)} | Erros: {len(errors)} | Vazão: {throughput:.1f} req/s")
+
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga com funcionários virtuais")
+    parser.add_argument('--employees', type=int, default=50, help='Funcionários virtuais simultâneos')
+    parser.add_argument('--duration', type=float, default=120, help='Duração do teste em segundos')
+    parser.add_argument('--ramp-up', type=float, default=10, help='Segundos para todos os funcionários entrarem')
+    parser.add_argument('--think-scale', type=float, default=1.0, help='Multiplicador dos tempos de pensamento')
+    parser.add_argument('--journeys', default='', help='Jornadas a executar (nomes separados por vírgula)')
+    parser.add_argument('--max-connections', type=int, default=0, help='Limite de conexões HTTP (0 = sem limite)')
+    parser.add_argument('--seed', type=int, default=42, help='Semente da mistura de jornadas')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal de execução do benchmark"""
+    print("🚀 SynQcore API - Teste de Carga com Funcionários Virtuais")
+    print("=" * 50)
+
+    try:
+        results = asyncio.run(run_benchmark(parse_args(argv)))
+        if results:
+            save_benchmark_report("virtual_employees", results)
+        return results
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark interrompido pelo usuário")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Busca de Capacidade - Máxima Taxa Sustentável dentro do SLO
+
+Este script aplica carga em laço aberto (taxa de chegada fixa, independente do tempo
+de resposta) contra um alvo e procura a maior taxa em que o SLO é respeitado:
+- Alvo: mistura de jornadas (utils/journeys.py), categorias de teste ou endpoints explícitos
+- SLO: p99 de latência e taxa de erro máximas
+- Fase 1: taxas crescentes (multiplicadas por --growth) até a primeira violação
+- Fase 2: busca binária entre a última taxa aprovada e a primeira reprovada
+
+Cada rodada calcula intervalos de confiança do p99 (estatísticas de ordem) e da taxa
+de erro (Wilson); o resultado traz a capacidade com limites inferior e superior.
+
+Execução: python capacity_finder.py --category feed --slo-p99 500 --slo-error-rate 1
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+from typing import Dict, List
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.load_generator import AsyncAPIClient, Journey, create_http_session, run_open_loop
+from utils.journeys import build_target, preflight
+from utils.load_metrics import (percentile, summarize_latencies, percentile_confidence_interval,
+                                wilson_interval, print_latency_table, print_section, save_benchmark_report)
+
+
+async def run_trial(api: AsyncAPIClient, journeys: List[Journey], rate: float, args) -> Dict:
+    """Executa uma rodada em taxa constante e avalia o SLO com intervalos de confiança"""
+    if args.warmup > 0:
+        await run_open_loop(api, journeys, lambda t: rate, args.warmup, seed=args.seed,
+                            think_scale=args.think_scale, max_in_flight=args.max_in_flight)
+
+    recorder, stats = await run_open_loop(api, journeys, lambda t: rate, args.trial_duration, seed=args.seed + 1,
+                                          think_scale=args.think_scale, max_in_flight=args.max_in_flight)
+
+    latencies = [s.latency_ms for s in recorder.samples]
+    failures = sum(1 for s in recorder.samples if not s.success) + stats.shed
+    total = len(recorder.samples) + stats.shed
+    p99 = percentile(latencies, 99)
+    p99_low, p99_high = percentile_confidence_interval(latencies, 99, args.confidence)
+    error_low, error_high = wilson_interval(failures, total, args.confidence)
+    error_rate = failures / total if total else 1.0
+
+    slo_p99 = args.slo_p99
+    slo_errors = args.slo_error_rate / 100
+    passed = total > 0 and p99 <= slo_p99 and error_rate <= slo_errors
+    if total and p99_high <= slo_p99 and error_high <= slo_errors:
+        verdict = 'aprovado'
+    elif total == 0 or p99_low > slo_p99 or error_low > slo_errors:
+        verdict = 'reprovado'
+    else:
+        verdict = 'inconclusivo'  # Estimativa pontual decide, mas o intervalo cruza o SLO
+
+    lag_p99 = percentile(stats.lag_ms, 99)
+    return {
+        'rate': round(rate, 2),
+        'requests': len(recorder.samples),
+        'achieved_rps': round(len(recorder.samples) / args.trial_duration, 1),
+        'latency_ms': summarize_latencies(latencies),
+        'p99_ms': round(p99, 2),
+        'p99_ci_ms': [round(p99_low, 2), round(p99_high, 2)],
+        'error_rate': round(error_rate * 100, 3),
+        'error_rate_ci': [round(error_low * 100, 3), round(error_high * 100, 3)],
+        'shed': stats.shed,
+        'generator_lag_p99_ms': round(lag_p99, 2),
+        'generator_saturated': lag_p99 > args.max_lag,
+        'passed': passed,
+        'verdict': verdict,
+    }
+
+
+async def find_capacity(client: APITestClient, args) -> Dict:
+    """Fase de crescimento seguida de busca binária pela maior taxa aprovada"""
+    session = create_http_session(args.max_connections)
+    trials: List[Dict] = []
+
+    try:
+        api = AsyncAPIClient(session, client.base_url, client.token, timeout=client.timeout)
+        journeys = await preflight(api, build_target(args.endpoints, args.category, args.journeys),
+                                   client.log_warning)
+        if not journeys:
+            client.log_error("Nenhum alvo válido para a busca de capacidade")
+            return {}
+
+        print_section("🎯 ALVO")
+        for journey in journeys:
+            print(f"   {journey.name} (peso {journey.weight})")
+
+        async def trial(rate: float) -> Dict:
+            client.log_info(f"⚙️  Rodada a {rate:.1f}/s por {args.trial_duration}s")
+            result = await run_trial(api, journeys, rate, args)
+            trials.append(result)
+            print(f"   p99 {result['p99_ms']}ms {result['p99_ci_ms']} | erros {result['error_rate']}% | "
+                  f"{result['achieved_rps']} req/s -> {result['verdict']}")
+            if result['generator_saturated']:
+                client.log_warning(f"Gerador atrasado (lag p99 {result['generator_lag_p99_ms']}ms): "
+                                   "resultado desta rodada reflete o cliente, não só a API")
+            if args.cooldown > 0:
+                await asyncio.sleep(args.cooldown)
+            return result
+
+        # Fase 1: taxas crescentes até a primeira violação
+        best, worst = 0.0, None
+        rate = args.start_rate
+        while rate <= args.max_rate:
+            if (await trial(rate))['passed']:
+                best = rate
+                rate *= args.growth
+            else:
+                worst = rate
+                break
+
+        # Fase 2: busca binária até a resolução pedida
+        if worst is not None:
+            while worst - best > max(best * args.resolution / 100, args.min_step):
+                middle = (best + worst) / 2
+                if (await trial(middle))['passed']:
+                    best = middle
+                else:
+                    worst = middle
+
+        # Confirmação: repetir a taxa encontrada expõe rodadas aprovadas por sorte
+        confirmations = []
+        if best > 0:
+            for _ in range(args.confirm):
+                confirmations.append(await trial(best))
+            while confirmations and not all(c['passed'] for c in confirmations) and best > args.min_step:
+                worst = best
+                best = max(best * (1 - args.resolution / 100), 0)
+                client.log_warning(f"Confirmação falhou; reduzindo para {best:.1f}/s")
+                confirmations = [await trial(best) for _ in range(args.confirm)]
+
+    finally:
+        await session.close()
+
+    # Confirmações ainda reprovadas no passo mínimo: a taxa não sustenta o SLO com segurança
+    confirmed = all(c['passed'] for c in confirmations)
+
+    # Limites: maior taxa aprovada com confiança / menor taxa reprovada com confiança
+    confident_pass = [t['rate'] for t in trials if t['verdict'] == 'aprovado' and t['rate'] <= best]
+    confident_fail = [t['rate'] for t in trials if t['verdict'] == 'reprovado' and t['rate'] > best]
+    lower_bound = max(confident_pass, default=0.0)
+    upper_bound = min(confident_fail, default=worst)
+
+    return {
+        'parameters': vars(args),
+        'targets': [j.name for j in journeys],
+        'capacity_rate': round(best, 2) if confirmed else 0.0,
+        'confirmed': confirmed,
+        'unconfirmed_rate': None if confirmed else round(best, 2),
+        'lower_bound': lower_bound,
+        'upper_bound': upper_bound,
+        'search_exhausted': worst is None,
+        'trials': trials,
+    }
+
+
+async def run_benchmark(args) -> Dict:
+    """Autentica, executa a busca e imprime o relatório"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Busca de capacidade abortada.")
+        return {}
+
+    results = await find_capacity(client, args)
+    if not results:
+        return {}
+
+    rows = {f"#{i} {t['rate']}/s": {k: t[k] for k in ('achieved_rps', 'p99_ms', 'p99_ci_ms', 'error_rate',
+                                                        'error_rate_ci', 'shed', 'verdict')}
+            for i, t in enumerate(results['trials'], 1)}
+    print_latency_table("📊 RODADAS DA BUSCA", rows, key_header="Taxa")
+
+    print_section("🏁 CAPACIDADE SUSTENTÁVEL")
+    unit = 'req/s' if args.endpoints or args.category else 'jornadas/s'
+    print(f"   SLO: p99 <= {args.slo_p99}ms e erros <= {args.slo_error_rate}%")
+    if results['search_exhausted']:
+        print(f"   ⚠️  SLO respeitado até o limite testado ({args.max_rate} {unit}); aumente --max-rate")
+    if not results['confirmed']:
+        print(f"   ⚠️  {results['unconfirmed_rate']} {unit} não passou nas confirmações; nenhuma taxa confirmada")
+    print(f"   Capacidade: {results['capacity_rate']} {unit}")
+    upper = results['upper_bound'] if results['upper_bound'] is not None else '-'
+    print(f"   Limites ({args.confidence * 100:.0f}% de confiança): [{results['lower_bound']}, {upper}] {unit}")
+
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Busca da máxima taxa sustentável dentro do SLO")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--category', help='Categorias de teste como alvo (ex: feed,search)')
+    target.add_argument('--endpoints', help='Endpoints explícitos (ex: "GET /api/Feed,GET /api/Tags")')
+    target.add_argument('--journeys', default='', help='Jornadas como alvo (padrão: mistura completa)')
+    parser.add_argument('--slo-p99', type=float, default=500, help='p99 máximo em ms')
+    parser.add_argument('--slo-error-rate', type=float, default=1.0, help='Taxa de erro máxima (%%)')
+    parser.add_argument('--start-rate', type=float, default=10, help='Taxa inicial por segundo')
+    parser.add_argument('--max-rate', type=float, default=5000, help='Taxa máxima a testar')
+    parser.add_argument('--growth', type=float, default=2.0, help='Multiplicador da fase de crescimento')
+    parser.add_argument('--resolution', type=float, default=5, help='Resolução da busca binária (%%)')
+    parser.add_argument('--min-step', type=float, default=1, help='Resolução mínima absoluta da busca')
+    parser.add_argument('--trial-duration', type=float, default=60, help='Segundos medidos por rodada')
+    parser.add_argument('--warmup', type=float, default=10, help='Segundos de aquecimento por rodada')
+    parser.add_argument('--cooldown', type=float, default=5, help='Pausa entre rodadas')
+    parser.add_argument('--confirm', type=int, default=2, help='Repetições de confirmação da taxa encontrada')
+    parser.add_argument('--confidence', type=float, default=0.95, help='Nível de confiança dos intervalos')
+    parser.add_argument('--think-scale', type=float, default=0.0, help='Pensamento entre passos das jornadas')
+    parser.add_argument('--max-in-flight', type=int, default=10000, help='Requisições simultâneas máximas')
+    parser.add_argument('--max-lag', type=float, default=50, help='Lag p99 do gerador (ms) para alertar')
+    parser.add_argument('--max-connections', type=int, default=0, help='Limite de conexões HTTP (0 = sem limite)')
+    parser.add_argument('--seed', type=int, default=42, help='Semente das chegadas')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal da busca de capacidade"""
+    print("🚀 SynQcore API - Busca de Capacidade")
+    print("=" * 50)
+
+    try:
+        results = asyncio.run(run_benchmark(parse_args(argv)))
+        if results:
+            save_benchmark_report("capacity", results)
+        return results
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Busca interrompida pelo usuário")
+
+
+if __name__ == "__main__":
+    main()
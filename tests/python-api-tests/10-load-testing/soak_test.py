@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Soak Test - Deriva de Latência e Memória
+
+Este script executa a mistura de jornadas dos funcionários virtuais por horas e acompanha:
+- Percentis de latência, vazão e taxa de erro por janela de tempo
+- Memória (RSS sem page cache) do container da API pela Docker Engine API
+- Chaves do cache de posts do feed no Redis (IFeedPostCacheService -> SynQcorefeed_post:*)
+- Memória usada pelo Redis
+
+Ao final (e a cada janela) ajusta retas de tendência e aplica o teste de Mann-Kendall;
+séries com tendência significativa e variação relevante são marcadas como deriva.
+
+Execução: python soak_test.py --hours 8 --employees 100 --window 300
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+from datetime import datetime
+from typing import Dict, List, Tuple
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.api_test_utils import APITestClient
+from utils.load_generator import AsyncAPIClient, WorkloadRecorder, create_http_session, run_virtual_employees
+from utils.journeys import journeys_by_name
+from utils.load_metrics import (summarize_latencies, linear_trend, mann_kendall,
+                                print_latency_table, print_section, save_benchmark_report)
+from utils.docker_metrics import get_container_stats, get_redis_key_count, get_redis_used_memory
+
+# Séries analisadas e a unidade usada no relatório
+WINDOW_SERIES = {'p50_ms': 'ms', 'p95_ms': 'ms', 'p99_ms': 'ms', 'error_rate': '%'}
+RESOURCE_SERIES = {'api_memory_mb': 'MB', 'feed_cache_keys': 'chaves', 'redis_memory_mb': 'MB'}
+
+
+def detect_drift(points: List[Tuple[float, float]], alpha: float, min_change_pct: float) -> Dict:
+    """
+    Avalia a deriva de uma série (x em horas desde o início).
+
+    Exige significância estatística (Mann-Kendall, p < alpha) e variação relevante
+    ao longo da execução (reta ajustada), para não marcar inclinações desprezíveis
+    que se tornam "significativas" só pelo número de amostras.
+    """
+    points = [(x, y) for x, y in points if y is not None]
+    trend = linear_trend(points)
+    test = mann_kendall([y for _, y in points])
+    if not trend or not test:
+        return {'samples': len(points), 'drift': False}
+
+    # Variação relativa ao nível médio (séries que partem de zero, como erros, continuam comparáveis)
+    span = points[-1][0] - points[0][0]
+    level = sum(y for _, y in points) / len(points)
+    change = trend['slope'] * span
+    change_pct = change / abs(level) * 100 if level else 0.0
+
+    return {
+        'samples': len(points),
+        'slope_per_hour': round(trend['slope'], 4),
+        'change_over_run': round(change, 2),
+        'change_pct': round(change_pct, 1),
+        'r_squared': trend['r_squared'],
+        'mann_kendall_z': test['z'],
+        'p_value': round(test['p_value'], 6),
+        'drift': test['p_value'] < alpha and abs(change_pct) >= min_change_pct,
+    }
+
+
+def summarize_window(samples, started: float, elapsed: float) -> Dict:
+    """Resume as amostras de uma janela de tempo"""
+    latencies = [s.latency_ms for s in samples if s.success]
+    errors = sum(1 for s in samples if not s.success)
+    summary = summarize_latencies(latencies)
+    return {
+        'started_at': datetime.fromtimestamp(started).isoformat(timespec='seconds'),
+        'requests': len(samples),
+        'throughput_rps': round(len(samples) / elapsed, 1) if elapsed > 0 else 0,
+        'error_rate': round(errors / len(samples) * 100, 2) if samples else 0.0,
+        'p50_ms': summary.get('p50'),
+        'p95_ms': summary.get('p95'),
+        'p99_ms': summary.get('p99'),
+        'max_ms': summary.get('max'),
+    }
+
+
+async def sample_resources(args, started: float, resources: List[Dict], stop: asyncio.Event):
+    """Amostra memória da API, chaves do cache de feed e memória do Redis periodicamente"""
+    while not stop.is_set():
+        stats, cache_keys, redis_memory = await asyncio.gather(
+            asyncio.to_thread(get_container_stats, args.container),
+            asyncio.to_thread(get_redis_key_count, args.cache_pattern, args.redis_container),
+            asyncio.to_thread(get_redis_used_memory, args.redis_container),
+        )
+        resources.append({
+            'hours': (time.time() - started) / 3600,
+            'api_memory_mb': round(stats.memory_bytes / 1024 ** 2, 1) if stats else None,
+            'api_cpu_percent': stats.cpu_percent if stats else None,
+            'feed_cache_keys': cache_keys,
+            'redis_memory_mb': round(redis_memory / 1024 ** 2, 2) if redis_memory is not None else None,
+        })
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=args.sample_interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+def analyze(args, windows: List[Dict], resources: List[Dict]) -> Dict[str, Dict]:
+    """Aplica a detecção de deriva em todas as séries"""
+    drift = {}
+    for key in WINDOW_SERIES:
+        drift[key] = detect_drift([(w['hours'], w[key]) for w in windows], args.alpha, args.min_change)
+    for key in RESOURCE_SERIES:
+        drift[key] = detect_drift([(r['hours'], r[key]) for r in resources], args.alpha, args.min_change)
+    return drift
+
+
+async def run_soak(args) -> Dict:
+    """Executa o soak test e retorna janelas, amostras de recursos e análise de deriva"""
+    client = APITestClient()
+    if not client.authenticate():
+        client.log_error("Falha na autenticação. Soak test abortado.")
+        return {}
+
+    journeys = journeys_by_name(args.journeys)
+    duration = args.hours * 3600
+    report_file = f"soak_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    results: Dict = {'parameters': vars(args), 'windows': [], 'resources': [], 'drift': {}}
+
+    session = create_http_session(args.max_connections)
+    api = AsyncAPIClient(session, client.base_url, client.token, timeout=client.timeout)
+    recorder = WorkloadRecorder()
+    stop = asyncio.Event()
+    started = time.time()
+
+    client.log_info(f"🕒 Soak de {args.hours}h com {args.employees} funcionários, janelas de {args.window}s")
+    workload = asyncio.create_task(run_virtual_employees(
+        api, journeys, args.employees, duration, seed=args.seed,
+        ramp_up=args.ramp_up, think_scale=args.think_scale, recorder=recorder
+    ))
+    sampler = asyncio.create_task(sample_resources(args, started, results['resources'], stop))
+    last_auth = time.time()
+
+    try:
+        while not workload.done():
+            window_started = time.time()
+            await asyncio.wait([workload], timeout=args.window)
+            elapsed = time.time() - window_started
+
+            window = summarize_window(recorder.drain(), window_started, elapsed)
+            window['hours'] = (window_started + elapsed / 2 - started) / 3600
+            results['windows'].append(window)
+            # Durações de jornada não são usadas no soak; descartar evita crescimento por horas
+            recorder.journey_durations.clear()
+
+            resources = results['resources'][-1] if results['resources'] else {}
+            print(f"[{window['started_at']}] {window['requests']} req | {window['throughput_rps']} req/s | "
+                  f"p50 {window['p50_ms']}ms p99 {window['p99_ms']}ms | erros {window['error_rate']}% | "
+                  f"API {resources.get('api_memory_mb', '-')}MB | cache {resources.get('feed_cache_keys', '-')} chaves")
+
+            # Tokens JWT expiram em 60 minutos (Jwt:ExpirationMinutes)
+            if time.time() - last_auth > args.reauth_minutes * 60:
+                if await asyncio.to_thread(client.authenticate):
+                    api.set_token(client.token)
+                    last_auth = time.time()
+
+            results['drift'] = analyze(args, results['windows'], results['resources'])
+            save_benchmark_report("soak", results, filename=report_file)
+
+    finally:
+        stop.set()
+        workload.cancel()
+        await asyncio.gather(workload, sampler, return_exceptions=True)
+        await session.close()
+
+    results['drift'] = analyze(args, results['windows'], results['resources'])
+
+    units = {**WINDOW_SERIES, **RESOURCE_SERIES}
+    rows = {}
+    for key, analysis in results['drift'].items():
+        rows[f"{key} ({units[key]})"] = {
+            'amostras': analysis['samples'],
+            'inclinação/h': analysis.get('slope_per_hour', '-'),
+            'variação_%': analysis.get('change_pct', '-'),
+            'p_valor': analysis.get('p_value', '-'),
+            'deriva': '⚠️  SIM' if analysis['drift'] else 'não',
+        }
+    print_latency_table("📉 ANÁLISE DE DERIVA (Mann-Kendall + reta de tendência)", rows, key_header="Série")
+
+    drifting = [key for key, analysis in results['drift'].items() if analysis['drift']]
+    print_section("🩺 VEREDITO")
+    if drifting:
+        client.log_warning(f"Deriva significativa detectada em: {', '.join(drifting)}")
+    else:
+        client.log_success("Nenhuma deriva significativa de latência ou memória")
+
+    results['report_file'] = report_file
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Soak test com detecção de deriva de latência e memória")
+    parser.add_argument('--hours', type=float, default=4, help='Duração do soak em horas')
+    parser.add_argument('--employees', type=int, default=50, help='Funcionários virtuais simultâneos')
+    parser.add_argument('--window', type=float, default=300, help='Segundos por janela de percentis')
+    parser.add_argument('--sample-interval', type=float, default=60, help='Segundos entre amostras de memória')
+    parser.add_argument('--ramp-up', type=float, default=60, help='Segundos para todos os funcionários entrarem')
+    parser.add_argument('--think-scale', type=float, default=1.0, help='Multiplicador dos tempos de pensamento')
+    parser.add_argument('--journeys', default='', help='Jornadas a executar (nomes separados por vírgula)')
+    parser.add_argument('--max-connections', type=int, default=0, help='Limite de conexões HTTP (0 = sem limite)')
+    parser.add_argument('--alpha', type=float, default=0.01, help='Nível de significância do teste de tendência')
+    parser.add_argument('--min-change', type=float, default=10, help='Variação mínima (%%) para marcar deriva')
+    parser.add_argument('--reauth-minutes', type=float, default=45, help='Intervalo de renovação do token JWT')
+    parser.add_argument('--container', default='synqcore-api', help='Container da API')
+    parser.add_argument('--redis-container', default='synqcore-redis', help='Container do Redis')
+    parser.add_argument('--cache-pattern', default='SynQcorefeed_post:*', help='Padrão das chaves do cache de posts')
+    parser.add_argument('--seed', type=int, default=42, help='Semente da mistura de jornadas')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal de execução do soak test"""
+    print("🚀 SynQcore API - Soak Test")
+    print("=" * 50)
+
+    try:
+        return asyncio.run(run_soak(parse_args(argv)))
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Soak test interrompido pelo usuário (relatório parcial já salvo)")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
 from utils.api_test_utils import APITestClient
+from utils.endpoint_catalog import TEST_CATEGORIES
 
 def run_test_category(category_name, category_path, test_files, global_client=None):
     """Executa uma categoria completa de testes"""
@@ -122,48 +123,7 @@ def main():
     print("=" * 60)
 
     # Configuração dos testes por categoria
-    test_categories = [
-        {
-            'name': '🔐 Autenticação',
-            'path': '01-authentication',
-            'files': ['test_auth']
-        },
-        {
-            'name': '👑 Administração',
-            'path': '02-administration',
-            'files': ['test_admin']
-        },
-        {
-            'name': '👥 Funcionários e Departamentos',
-            'path': '03-employees-departments',
-            'files': ['test_employees', 'test_departments']
-        },
-        {
-            'name': '📚 Gestão de Conhecimento',
-            'path': '04-knowledge-management',
-            'files': ['test_knowledge_posts', 'test_knowledge_categories', 'test_tags']
-        },
-        {
-            'name': '🤝 Colaboração',
-            'path': '05-collaboration',
-            'files': ['test_endorsements', 'test_discussion_threads']
-        },
-        {
-            'name': '📰 Feed e Comunicação Corporativa',
-            'path': '06-feed-communication',
-            'files': ['test_feed', 'test_corporate_communication']
-        },
-        {
-            'name': '📁 Media e Documentos',
-            'path': '07-media-documents',
-            'files': ['test_media_assets']
-        },
-        {
-            'name': '🔍 Busca e Analytics',
-            'path': '08-search-analytics',
-            'files': ['test_corporate_search']
-        }
-    ]
+    test_categories = TEST_CATEGORIES
 
     # Resultados consolidados
     consolidated_results = {
@@ -0,0 +1,217 @@
+"""
+SynQcore Docker Metrics
+
+Leitura de métricas dos containers (CPU, memória, rede) para os benchmarks.
+Usa a Docker Engine API diretamente pelo socket unix e, se indisponível
+(ex: Docker Desktop no Windows), recorre ao `docker stats --no-stream`.
+"""
+
+import os
+import json
+import socket
+import subprocess
+import http.client
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+DEFAULT_DOCKER_SOCKET = '/var/run/docker.sock'
+
+# Multiplicadores das unidades exibidas pelo `docker stats`
+_SIZE_UNITS = {
+    'b': 1, 'kb': 1000, 'mb': 1000 ** 2, 'gb': 1000 ** 3, 'tb': 1000 ** 4,
+    'kib': 1024, 'mib': 1024 ** 2, 'gib': 1024 ** 3, 'tib': 1024 ** 4,
+}
+
+
+@dataclass
+class ContainerStats:
+    """Amostra de uso de recursos de um container"""
+    name: str
+    cpu_percent: float
+    memory_bytes: int
+    memory_limit_bytes: int
+    net_rx_bytes: int = 0
+    net_tx_bytes: int = 0
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection que fala com o daemon Docker pelo socket unix"""
+
+    def __init__(self, socket_path: str, timeout: float = 10):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def docker_socket_path() -> Optional[str]:
+    """Caminho do socket do Docker (respeita DOCKER_HOST=unix://...)"""
+    docker_host = os.getenv('DOCKER_HOST', '')
+    if docker_host.startswith('unix://'):
+        return docker_host[len('unix://'):]
+    if docker_host:
+        return None  # Daemon remoto via TCP: usar a CLI
+    return DEFAULT_DOCKER_SOCKET if os.path.exists(DEFAULT_DOCKER_SOCKET) else None
+
+
+def docker_api_get(path: str, timeout: float = 10) -> Any:
+    """GET na Docker Engine API; retorna o JSON decodificado ou None em caso de falha"""
+    socket_path = docker_socket_path()
+    if not socket_path or not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    connection = _UnixHTTPConnection(socket_path, timeout)
+    try:
+        connection.request('GET', path)
+        response = connection.getresponse()
+        if response.status != 200:
+            return None
+        return json.loads(response.read())
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+    finally:
+        connection.close()
+
+
+def parse_size(text: str) -> int:
+    """Converte tamanhos do `docker stats` (ex: '123.4MiB') para bytes"""
+    text = text.strip()
+    number = text.rstrip('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+    unit = text[len(number):].strip().lower()
+    try:
+        return int(float(number) * _SIZE_UNITS.get(unit, 1))
+    except ValueError:
+        return 0
+
+
+def stats_from_engine_payload(name: str, payload: dict) -> ContainerStats:
+    """Calcula CPU/memória/rede a partir do JSON de /containers/{id}/stats (mesma fórmula da CLI)"""
+    cpu = payload.get('cpu_stats', {})
+    precpu = payload.get('precpu_stats', {})
+    cpu_delta = cpu.get('cpu_usage', {}).get('total_usage', 0) - precpu.get('cpu_usage', {}).get('total_usage', 0)
+    system_delta = cpu.get('system_cpu_usage', 0) - precpu.get('system_cpu_usage', 0)
+    online_cpus = cpu.get('online_cpus') or len(cpu.get('cpu_usage', {}).get('percpu_usage') or []) or 1
+    cpu_percent = (cpu_delta / system_delta) * online_cpus * 100 if system_delta > 0 and cpu_delta > 0 else 0.0
+
+    memory = payload.get('memory_stats', {})
+    details = memory.get('stats', {})
+    # cgroup v2 expõe inactive_file; cgroup v1 expõe cache
+    cache = details.get('inactive_file', details.get('total_inactive_file', details.get('cache', 0)))
+    memory_bytes = max(memory.get('usage', 0) - cache, 0)
+
+    networks = payload.get('networks') or {}
+    rx = sum(n.get('rx_bytes', 0) for n in networks.values())
+    tx = sum(n.get('tx_bytes', 0) for n in networks.values())
+
+    return ContainerStats(name, round(cpu_percent, 2), memory_bytes, memory.get('limit', 0), rx, tx)
+
+
+def get_container_stats(name: str, timeout: float = 15) -> Optional[ContainerStats]:
+    """Amostra única de uso de recursos do container (Engine API, com fallback para a CLI)"""
+    payload = docker_api_get(f"/containers/{name}/stats?stream=false", timeout)
+    if payload:
+        return stats_from_engine_payload(name, payload)
+
+    try:
+        result = subprocess.run(
+            ["docker", "stats", "--no-stream", "--format", "{{json .}}", name],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+
+    data = json.loads(result.stdout.strip().splitlines()[0])
+    used, _, limit = data.get('MemUsage', '0B / 0B').partition('/')
+    rx, _, tx = data.get('NetIO', '0B / 0B').partition('/')
+    return ContainerStats(
+        name=name,
+        cpu_percent=float(data.get('CPUPerc', '0%').rstrip('%') or 0),
+        memory_bytes=parse_size(used),
+        memory_limit_bytes=parse_size(limit),
+        net_rx_bytes=parse_size(rx),
+        net_tx_bytes=parse_size(tx)
+    )
+
+
+def get_container_cpu_usage_ns(name: str, timeout: float = 10) -> Optional[int]:
+    """
+    CPU acumulada do container em nanossegundos (Engine API, leitura one-shot).
+
+    A diferença entre duas leituras dá o custo de CPU de uma janela de tempo,
+    independente da granularidade de amostragem do `docker stats`.
+    """
+    payload = docker_api_get(f"/containers/{name}/stats?stream=false&one-shot=true", timeout)
+    if not payload:
+        return None
+    return payload.get('cpu_stats', {}).get('cpu_usage', {}).get('total_usage')
+
+
+def redis_cli(args: list, container: str = 'synqcore-redis', timeout: float = 30) -> Optional[str]:
+    """Executa o redis-cli dentro do container do Redis; retorna a saída ou None em caso de falha"""
+    try:
+        result = subprocess.run(
+            ["docker", "exec", container, "redis-cli", *args],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def get_redis_key_count(pattern: str, container: str = 'synqcore-redis') -> Optional[int]:
+    """Quantidade de chaves que casam com o padrão (SCAN incremental, sem bloquear o Redis como KEYS)"""
+    output = redis_cli(["--scan", "--pattern", pattern, "--count", "1000"], container, timeout=120)
+    if output is None:
+        return None
+    return sum(1 for line in output.splitlines() if line.strip())
+
+
+def get_redis_used_memory(container: str = 'synqcore-redis') -> Optional[int]:
+    """Memória usada pelo Redis em bytes (INFO memory -> used_memory)"""
+    output = redis_cli(["INFO", "memory"], container)
+    if output is None:
+        return None
+    for line in output.splitlines():
+        if line.startswith('used_memory:'):
+            return int(line.split(':', 1)[1].strip())
+    return None
+
+
+def get_redis_info(section: str = '', container: str = 'synqcore-redis') -> Dict[str, str]:
+    """Campos do INFO do Redis (ex: instantaneous_ops_per_sec, connected_clients)"""
+    output = redis_cli(["INFO", section] if section else ["INFO"], container)
+    info: Dict[str, str] = {}
+    for line in (output or '').splitlines():
+        key, separator, value = line.partition(':')
+        if separator and not key.startswith('#'):
+            info[key.strip()] = value.strip()
+    return info
+
+
+def get_postgres_connections(container: str = 'synqcore-postgres', database: str = 'synqcore_db',
+                             user: str = 'postgres', timeout: float = 15) -> Optional[Dict[str, int]]:
+    """Conexões do banco por estado (pg_stat_activity), que refletem o pool do Npgsql na API"""
+    query = ("SELECT COALESCE(state, 'unknown'), count(*) FROM pg_stat_activity "
+             f"WHERE datname = '{database}' GROUP BY 1")
+    try:
+        result = subprocess.run(
+            ["docker", "exec", container, "psql", "-U", user, "-d", database, "-tA", "-F", "|", "-c", query],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    connections: Dict[str, int] = {}
+    for line in result.stdout.splitlines():
+        state, _, count = line.partition('|')
+        if count.strip().isdigit():
+            connections[state.strip()] = int(count)
+    return connections
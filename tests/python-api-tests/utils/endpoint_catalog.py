@@ -0,0 +1,131 @@
+"""
+SynQcore Endpoint Catalog
+
+Catálogo de endpoints montado a partir das categorias de teste. Cada módulo
+test_*.py lista no docstring os endpoints que exercita ("- GET /api/feed");
+o catálogo lê esses docstrings sem importar os módulos, para que os testes
+de carga possam ser direcionados a qualquer categoria existente.
+"""
+
+import os
+import re
+import ast
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Categorias executadas pelo run_all_tests.py (ordem de execução)
+TEST_CATEGORIES = [
+    {
+        'name': '🔐 Autenticação',
+        'path': '01-authentication',
+        'files': ['test_auth']
+    },
+    {
+        'name': '👑 Administração',
+        'path': '02-administration',
+        'files': ['test_admin']
+    },
+    {
+        'name': '👥 Funcionários e Departamentos',
+        'path': '03-employees-departments',
+        'files': ['test_employees', 'test_departments']
+    },
+    {
+        'name': '📚 Gestão de Conhecimento',
+        'path': '04-knowledge-management',
+        'files': ['test_knowledge_posts', 'test_knowledge_categories', 'test_tags']
+    },
+    {
+        'name': '🤝 Colaboração',
+        'path': '05-collaboration',
+        'files': ['test_endorsements', 'test_discussion_threads']
+    },
+    {
+        'name': '📰 Feed e Comunicação Corporativa',
+        'path': '06-feed-communication',
+        'files': ['test_feed', 'test_corporate_communication']
+    },
+    {
+        'name': '📁 Media e Documentos',
+        'path': '07-media-documents',
+        'files': ['test_media_assets']
+    },
+    {
+        'name': '🔍 Busca e Analytics',
+        'path': '08-search-analytics',
+        'files': ['test_corporate_search']
+    }
+]
+
+TESTS_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_ENDPOINT_LINE = re.compile(r'^\s*-\s*(GET|POST|PUT|DELETE|PATCH)\s+(/\S+)', re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class CatalogEndpoint:
+    """Endpoint declarado por um módulo de teste"""
+    category: str
+    module: str
+    method: str
+    path: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.path}"
+
+    @property
+    def has_placeholders(self) -> bool:
+        return '{' in self.path
+
+
+def module_endpoints(category_path: str, module: str) -> List[CatalogEndpoint]:
+    """Endpoints listados no docstring de um módulo de teste"""
+    filename = os.path.join(TESTS_ROOT, category_path, f"{module}.py")
+    try:
+        with open(filename, encoding='utf-8') as f:
+            docstring = ast.get_docstring(ast.parse(f.read())) or ''
+    except (OSError, SyntaxError):
+        return []
+
+    return [CatalogEndpoint(category_path, module, method, path)
+            for method, path in _ENDPOINT_LINE.findall(docstring)]
+
+
+def load_catalog(categories: Optional[str] = None, read_only: bool = True) -> List[CatalogEndpoint]:
+    """
+    Endpoints das categorias de teste.
+
+    `categories` filtra por trechos do caminho, nome da categoria ou módulo, separados
+    por vírgula (ex: "feed,search"). Com `read_only`, mantém apenas GETs sem
+    parâmetros de rota, que podem ser repetidos sob carga sem efeitos colaterais.
+    """
+    wanted = [c.strip().lower() for c in (categories or '').split(',') if c.strip()]
+    endpoints: List[CatalogEndpoint] = []
+    seen = set()
+
+    for category in TEST_CATEGORIES:
+        for module in category['files']:
+            labels = f"{category['path']} {category['name']} {module}".lower()
+            if wanted and not any(w in labels for w in wanted):
+                continue
+            for endpoint in module_endpoints(category['path'], module):
+                if read_only and (endpoint.method != 'GET' or endpoint.has_placeholders):
+                    continue
+                if endpoint.key not in seen:
+                    seen.add(endpoint.key)
+                    endpoints.append(endpoint)
+
+    return endpoints
+
+
+def parse_endpoint_list(text: str) -> List[CatalogEndpoint]:
+    """Converte uma lista explícita ("GET /api/feed,GET /api/tags") em entradas do catálogo"""
+    endpoints = []
+    for item in text.split(','):
+        method, _, path = item.strip().partition(' ')
+        if path:
+            endpoints.append(CatalogEndpoint('custom', 'custom', method.upper(), path.strip()))
+        elif method:
+            endpoints.append(CatalogEndpoint('custom', 'custom', 'GET', method))
+    return endpoints
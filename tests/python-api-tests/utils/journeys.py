@@ -0,0 +1,125 @@
+"""
+SynQcore Employee Journeys
+
+Jornadas típicas de um funcionário usadas pelos testes de carga. Os pesos
+refletem a mistura esperada em produção: muita leitura de feed e busca,
+menos interações e poucos uploads.
+"""
+
+import time
+import base64
+import random
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.load_generator import AsyncAPIClient, Journey, JourneyStep, WorkloadRecorder, endpoint_journeys, run_journey
+from utils.endpoint_catalog import load_catalog, parse_endpoint_list
+
+# Arquivo pequeno enviado na jornada de upload (conteúdo irrelevante para a API)
+_UPLOAD_BYTES = base64.b64encode(b'SynQcore load test document\n' * 64).decode('ascii')
+
+SEARCH_TERMS = ['onboarding', 'política', 'arquitetura', 'férias', 'kubernetes', 'relatório', 'segurança']
+
+
+def _new_post(context: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'content': f"Post de carga {time.time_ns()} - atualização da equipe",
+        'tags': ['loadtest'],
+        'isPublic': True
+    }
+
+
+def _new_asset(context: Dict[str, Any]) -> Dict[str, Any]:
+    name = f"loadtest-{time.time_ns()}.txt"
+    return {
+        'title': name,
+        'description': 'Documento gerado pelo teste de carga',
+        'assetType': 'Document',
+        'accessLevel': 2,  # DocumentAccessLevel.Internal
+        'fileName': name,
+        'fileContentType': 'text/plain',
+        'fileData': _UPLOAD_BYTES
+    }
+
+
+def _search_params(context: Dict[str, Any]) -> Dict[str, Any]:
+    return {'Query': random.choice(SEARCH_TERMS), 'Page': 1, 'PageSize': 20}
+
+
+def _similar_params(context: Dict[str, Any]) -> Dict[str, Any]:
+    return {'contentType': context.get('result_type', 'Post'), 'maxResults': 5}
+
+
+DEFAULT_JOURNEYS: List[Journey] = [
+    Journey('Ler feed', 40, [
+        JourneyStep('Feed corporativo', 'GET', '/api/Feed', params={'page': 1, 'pageSize': 20},
+                    extract={'post_id': 'items.0.postId'}),
+        JourneyStep('Abrir post', 'GET', '/api/Feed/{post_id}'),
+        JourneyStep('Próxima página', 'GET', '/api/Feed', params={'page': 2, 'pageSize': 20}),
+    ]),
+    Journey('Buscar', 25, [
+        JourneyStep('Sugestões', 'GET', '/api/CorporateSearch/suggestions', params={'Partial': 'pol'},
+                    think_time=(0.2, 0.8)),
+        JourneyStep('Busca', 'GET', '/api/CorporateSearch', params=_search_params,
+                    extract={'result_id': 'items.0.id', 'result_type': 'items.0.type'}),
+        JourneyStep('Conteúdo similar', 'GET', '/api/CorporateSearch/similar/{result_id}', params=_similar_params),
+    ]),
+    Journey('Abrir discussão', 15, [
+        JourneyStep('Feed corporativo', 'GET', '/api/Feed', params={'page': 1, 'pageSize': 10},
+                    extract={'post_id': 'items.0.postId'}),
+        JourneyStep('Thread do post', 'GET', '/api/DiscussionThreads/posts/{post_id}/thread',
+                    think_time=(2.0, 6.0)),
+    ]),
+    Journey('Curtir post', 12, [
+        JourneyStep('Feed corporativo', 'GET', '/api/Feed', params={'page': 1, 'pageSize': 10},
+                    extract={'post_id': 'items.0.postId'}),
+        JourneyStep('Curtir', 'POST', '/api/Feed/{post_id}/like', think_time=(0.2, 1.0)),
+        JourneyStep('Status da curtida', 'GET', '/api/Feed/{post_id}/like/status'),
+    ]),
+    Journey('Publicar post', 5, [
+        JourneyStep('Criar post', 'POST', '/api/Feed', data=_new_post, extract={'post_id': 'id'}),
+        JourneyStep('Ver post criado', 'GET', '/api/Feed/{post_id}'),
+    ]),
+    Journey('Upload de documento', 3, [
+        JourneyStep('Upload', 'POST', '/api/MediaAssets', data=_new_asset, extract={'asset_id': 'id'},
+                    think_time=(1.0, 3.0)),
+        JourneyStep('Ver documento', 'GET', '/api/MediaAssets/{asset_id}'),
+    ]),
+]
+
+
+def journeys_by_name(names: str) -> List[Journey]:
+    """Filtra DEFAULT_JOURNEYS por nomes separados por vírgula (vazio = todas)"""
+    wanted = [name.strip().lower() for name in names.split(',') if name.strip()]
+    if not wanted:
+        return list(DEFAULT_JOURNEYS)
+    return [journey for journey in DEFAULT_JOURNEYS if journey.name.lower() in wanted]
+
+
+def build_target(endpoints: Optional[str] = None, category: Optional[str] = None,
+                 journeys: str = '') -> List[Journey]:
+    """Alvo de um teste de carga: endpoints explícitos, categorias do catálogo ou jornadas"""
+    if endpoints:
+        return endpoint_journeys(parse_endpoint_list(endpoints))
+    if category:
+        return endpoint_journeys(load_catalog(category))
+    return journeys_by_name(journeys)
+
+
+async def preflight(api: AsyncAPIClient, journeys: List[Journey],
+                    warn: Callable[[str], None] = print) -> List[Journey]:
+    """
+    Executa cada alvo uma vez e descarta os que falham sem carga.
+
+    O catálogo vem dos docstrings dos testes, e nem todo endpoint listado existe na
+    API atual; mantê-los contaminaria a taxa de erro de todas as rodadas.
+    """
+    valid = []
+    for journey in journeys:
+        recorder = WorkloadRecorder()
+        await run_journey(api, journey, recorder, random.Random(0), think_scale=0)
+        failures = [s for s in recorder.samples if not s.success]
+        if failures:
+            warn(f"Ignorando {journey.name}: {failures[0].error_message}")
+        else:
+            valid.append(journey)
+    return valid
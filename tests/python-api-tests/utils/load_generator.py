@@ -0,0 +1,393 @@
+"""
+SynQcore Load Generator
+
+Motor de carga HTTP assíncrono (aiohttp) para os testes de capacidade.
+Jornadas são sequências ponderadas de chamadas aos endpoints existentes,
+com tempos de pensamento entre os passos. IDs retornados por um passo
+(ex: o post criado) ficam disponíveis para os passos seguintes, como o
+`created_post_id` encadeado em test_feed.py.
+
+Dois modos de execução: funcionários virtuais em laço fechado
+(run_virtual_employees) e chegadas em laço aberto com taxa controlada
+(run_open_loop), usado pelas buscas de capacidade.
+"""
+
+import re
+import time
+import random
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from utils.load_metrics import summarize_latencies
+
+# Marcadores {variavel} nos endpoints das jornadas
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+# Corpo/parâmetros fixos ou calculados a partir do contexto da jornada
+StepData = Union[None, Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]]]
+
+
+@dataclass
+class RequestSample:
+    """Resultado de uma requisição feita pelo gerador de carga"""
+    journey: str
+    step: str
+    method: str
+    endpoint: str
+    status_code: int
+    latency_ms: float
+    started_at: float  # epoch em segundos
+    success: bool
+    error_message: Optional[str] = None
+
+
+@dataclass
+class JourneyStep:
+    """
+    Passo de uma jornada.
+
+    `endpoint` aceita marcadores {variavel} preenchidos pelo contexto da jornada;
+    `extract` mapeia variáveis do contexto para caminhos na resposta
+    (ex: {'post_id': 'items.0.postId'}).
+    """
+    name: str
+    method: str
+    endpoint: str
+    params: StepData = None
+    data: StepData = None
+    extract: Dict[str, str] = field(default_factory=dict)
+    think_time: Tuple[float, float] = (0.5, 2.0)
+
+
+@dataclass
+class Journey:
+    """Sequência de passos executada por um funcionário virtual"""
+    name: str
+    weight: float
+    steps: List[JourneyStep]
+
+
+def render_endpoint(template: str, context: Dict[str, Any]) -> Optional[str]:
+    """Preenche os marcadores do endpoint; None se alguma variável não estiver disponível"""
+    missing = [name for name in _PLACEHOLDER.findall(template) if context.get(name) in (None, '')]
+    if missing:
+        return None
+    return _PLACEHOLDER.sub(lambda match: str(context[match.group(1)]), template)
+
+
+def extract_value(data: Any, path: str) -> Any:
+    """
+    Lê um valor da resposta por caminho pontuado ('items.0.postId').
+
+    Chaves são comparadas sem diferenciar maiúsculas, pois a API serializa em camelCase
+    mas os DTOs são declarados em PascalCase.
+    """
+    current = data
+    for part in path.split('.'):
+        if isinstance(current, list):
+            if not part.isdigit() or int(part) >= len(current):
+                return None
+            current = current[int(part)]
+        elif isinstance(current, dict):
+            if part in current:
+                current = current[part]
+            else:
+                current = next((v for k, v in current.items() if k.lower() == part.lower()), None)
+        else:
+            return None
+        if current is None:
+            return None
+    return current
+
+
+def choose_journey(rng: random.Random, journeys: List[Journey]) -> Journey:
+    """Sorteia uma jornada respeitando os pesos"""
+    return rng.choices(journeys, weights=[j.weight for j in journeys], k=1)[0]
+
+
+class AsyncAPIClient:
+    """Cliente HTTP assíncrono que reaproveita o token obtido pelo APITestClient"""
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str, token: Optional[str] = None,
+                 timeout: float = 30):
+        self.session = session
+        self.base_url = base_url.rstrip('/')
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.headers = {}
+        self.set_token(token)
+
+    def set_token(self, token: Optional[str]):
+        """Troca o token JWT usado nas próximas requisições (ex: renovação em testes longos)"""
+        self.headers = {'Authorization': f'Bearer {token}'} if token else {}
+
+    async def request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                      data: Optional[Any] = None) -> Tuple[int, Any, float, Optional[str]]:
+        """Executa a requisição e retorna (status, json, latência_ms, erro)"""
+        started = time.perf_counter()
+        try:
+            async with self.session.request(method.upper(), f"{self.base_url}{endpoint}", params=params,
+                                            json=data, headers=self.headers, timeout=self.timeout) as response:
+                body = await response.read()
+                latency = (time.perf_counter() - started) * 1000
+                payload = None
+                if body and 'json' in (response.content_type or ''):
+                    try:
+                        payload = await response.json(content_type=None)
+                    except ValueError:
+                        payload = None
+                error = None if 200 <= response.status < 300 else f"HTTP {response.status}: {body[:200]!r}"
+                return response.status, payload, latency, error
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return 0, None, (time.perf_counter() - started) * 1000, f"{type(e).__name__}: {e}"
+
+
+def create_http_session(connections: int = 0) -> aiohttp.ClientSession:
+    """Sessão aiohttp para geração de carga (limite de conexões configurável, 0 = sem limite)"""
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=connections))
+
+
+class WorkloadRecorder:
+    """Acumula as amostras de requisições e jornadas de uma execução"""
+
+    def __init__(self):
+        self.samples: List[RequestSample] = []
+        self.journey_durations: Dict[str, List[float]] = {}
+        self.journeys_completed: Dict[str, int] = {}
+        self.steps_skipped: Dict[str, int] = {}
+
+    def record(self, sample: RequestSample):
+        self.samples.append(sample)
+
+    def drain(self) -> List[RequestSample]:
+        """Retorna e descarta as amostras acumuladas (execuções longas processam por janela)"""
+        samples, self.samples = self.samples, []
+        return samples
+
+    def record_journey(self, journey: str, duration_ms: float, completed: bool):
+        self.journey_durations.setdefault(journey, []).append(duration_ms)
+        if completed:
+            self.journeys_completed[journey] = self.journeys_completed.get(journey, 0) + 1
+
+    def record_skip(self, journey: str, step: str):
+        key = f"{journey} / {step}"
+        self.steps_skipped[key] = self.steps_skipped.get(key, 0) + 1
+
+    def summary_by_step(self) -> Dict[str, Dict[str, Any]]:
+        """Latência (ms) e erros por passo de cada jornada"""
+        groups: Dict[str, List[RequestSample]] = {key: [] for key in self.steps_skipped}
+        for sample in self.samples:
+            groups.setdefault(f"{sample.journey} / {sample.step}", []).append(sample)
+
+        summary = {}
+        for key, samples in groups.items():
+            summary[key] = {
+                **summarize_latencies(s.latency_ms for s in samples if s.success),
+                'errors': sum(1 for s in samples if not s.success),
+                'skipped': self.steps_skipped.get(key, 0),
+            }
+        return summary
+
+    def summary_by_journey(self) -> Dict[str, Dict[str, Any]]:
+        """Duração total (ms, incluindo tempos de pensamento) e erros por jornada"""
+        summary = {}
+        for journey, durations in self.journey_durations.items():
+            summary[journey] = {
+                **summarize_latencies(durations),
+                'completed': self.journeys_completed.get(journey, 0),
+                'errors': sum(1 for s in self.samples if s.journey == journey and not s.success),
+            }
+        return summary
+
+
+async def run_journey(client: AsyncAPIClient, journey: Journey, recorder: WorkloadRecorder,
+                      rng: random.Random, think_scale: float = 1.0,
+                      context: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Executa uma jornada passo a passo; retorna True se todos os passos tiveram sucesso.
+
+    Passos cujo endpoint depende de uma variável ausente (ex: nenhum post no feed)
+    são pulados, da mesma forma que test_feed.py só usa `created_post_id` se existir.
+    """
+    context = dict(context or {})
+    started = time.perf_counter()
+    completed = True
+
+    for index, step in enumerate(journey.steps):
+        endpoint = render_endpoint(step.endpoint, context)
+        if endpoint is None:
+            recorder.record_skip(journey.name, step.name)
+            completed = False
+            continue
+
+        params = step.params(context) if callable(step.params) else step.params
+        data = step.data(context) if callable(step.data) else step.data
+        started_at = time.time()
+        status, payload, latency, error = await client.request(step.method, endpoint, params, data)
+        recorder.record(RequestSample(journey.name, step.name, step.method.upper(), step.endpoint,
+                                      status, round(latency, 2), started_at, error is None, error))
+
+        if error is not None:
+            completed = False
+        for variable, path in step.extract.items():
+            value = extract_value(payload, path)
+            if value is not None:
+                context[variable] = value
+
+        if index < len(journey.steps) - 1 and think_scale > 0:
+            low, high = step.think_time
+            await asyncio.sleep(rng.uniform(low, high) * think_scale)
+
+    recorder.record_journey(journey.name, (time.perf_counter() - started) * 1000, completed)
+    return completed
+
+
+async def run_virtual_employees(client: AsyncAPIClient, journeys: List[Journey], employees: int,
+                                duration: float, seed: int = 42, ramp_up: float = 0,
+                                think_scale: float = 1.0,
+                                recorder: Optional[WorkloadRecorder] = None) -> WorkloadRecorder:
+    """
+    Executa `employees` funcionários virtuais em paralelo durante `duration` segundos.
+
+    Cada funcionário sorteia jornadas pelos pesos, em laço fechado, com sua própria
+    semente derivada de `seed` para que a mistura seja reproduzível. A entrada dos
+    funcionários é espalhada ao longo de `ramp_up` segundos.
+    """
+    recorder = recorder or WorkloadRecorder()
+    deadline = time.perf_counter() + duration
+
+    async def employee(index: int):
+        rng = random.Random(seed * 100003 + index)
+        if ramp_up > 0:
+            await asyncio.sleep(ramp_up * index / employees)
+        while time.perf_counter() < deadline:
+            await run_journey(client, choose_journey(rng, journeys), recorder, rng, think_scale)
+
+    await asyncio.gather(*(employee(i) for i in range(employees)))
+    return recorder
+
+
+def endpoint_journeys(endpoints) -> List[Journey]:
+    """Uma jornada de passo único por endpoint do catálogo (peso igual)"""
+    return [Journey(endpoint.key, 1, [JourneyStep(endpoint.path, endpoint.method, endpoint.path)])
+            for endpoint in endpoints]
+
+
+@dataclass
+class OpenLoopStats:
+    """Comportamento do próprio gerador durante uma execução em laço aberto"""
+    scheduled: int = 0
+    started: int = 0
+    shed: int = 0  # chegadas descartadas por excesso de requisições em andamento
+    lag_ms: List[float] = field(default_factory=list)
+
+
+async def run_open_loop(client: AsyncAPIClient, journeys: List[Journey], rate: Callable[[float], float],
+                        duration: float, seed: int = 42, poisson: bool = True, think_scale: float = 0.0,
+                        max_in_flight: int = 10000,
+                        recorder: Optional[WorkloadRecorder] = None) -> Tuple[WorkloadRecorder, OpenLoopStats]:
+    """
+    Inicia jornadas em laço aberto: a taxa de chegada `rate(t)` (jornadas/s, t em segundos
+    desde o início) não depende do tempo de resposta da API.
+
+    Diferente de run_virtual_employees, uma API lenta não reduz a carga oferecida,
+    evitando a omissão coordenada. O atraso entre o instante agendado e o início
+    real (lag) é registrado: lag alto indica que o próprio gerador virou gargalo.
+    Chegadas além de `max_in_flight` são descartadas e contadas em `shed`.
+    """
+    recorder = recorder or WorkloadRecorder()
+    stats = OpenLoopStats()
+    rng = random.Random(seed)
+    in_flight = set()
+    started = time.perf_counter()
+    next_arrival = 0.0
+
+    async def launch(journey: Journey, journey_rng: random.Random):
+        try:
+            await run_journey(client, journey, recorder, journey_rng, think_scale)
+        finally:
+            in_flight.discard(asyncio.current_task())
+
+    while next_arrival < duration:
+        current_rate = rate(next_arrival)
+        if current_rate <= 0:
+            next_arrival += 0.05  # Taxa zero: avança o relógio sem chegadas
+            continue
+
+        delay = started + next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        stats.scheduled += 1
+        stats.lag_ms.append(max(-delay, 0) * 1000)
+        if len(in_flight) >= max_in_flight:
+            stats.shed += 1
+        else:
+            journey = choose_journey(rng, journeys)
+            task = asyncio.create_task(launch(journey, random.Random(rng.random())))
+            in_flight.add(task)
+            stats.started += 1
+
+        gap = rng.expovariate(current_rate) if poisson else 1 / current_rate
+        next_arrival += gap
+
+    if in_flight:
+        await asyncio.gather(*list(in_flight), return_exceptions=True)
+    return recorder, stats
+
+
+@dataclass
+class LoadProfile:
+    """
+    Perfil de taxa de chegada para run_open_loop.
+
+    `baseline_end` marca o fim do período estável inicial (referência de "normal")
+    e `drops` os instantes em que a taxa volta a cair, a partir dos quais se mede
+    a recuperação.
+    """
+    name: str
+    rate: Callable[[float], float]
+    duration: float
+    baseline_end: float
+    drops: List[float] = field(default_factory=list)
+
+
+def step_profile(base_rate: float, step_rate: float, step_duration: float, steps: int,
+                 warmup: float = 30, recovery: float = 60) -> LoadProfile:
+    """Degraus: base por `warmup`, +step_rate a cada degrau, depois volta à base por `recovery`"""
+    load_end = warmup + steps * step_duration
+
+    def rate(t: float) -> float:
+        if t < warmup or t >= load_end:
+            return base_rate
+        return base_rate + step_rate * (int((t - warmup) // step_duration) + 1)
+
+    return LoadProfile('step', rate, load_end + recovery, warmup, [load_end])
+
+
+def spike_profile(base_rate: float, multiplier: float, spike_duration: float,
+                  warmup: float = 30, recovery: float = 120) -> LoadProfile:
+    """Pico: base por `warmup`, base*multiplier por `spike_duration`, base por `recovery`"""
+    spike_end = warmup + spike_duration
+
+    def rate(t: float) -> float:
+        return base_rate * multiplier if warmup <= t < spike_end else base_rate
+
+    return LoadProfile('spike', rate, spike_end + recovery, warmup, [spike_end])
+
+
+def sawtooth_profile(low_rate: float, high_rate: float, period: float, teeth: int,
+                     warmup: float = 30, recovery: float = 60) -> LoadProfile:
+    """Dente de serra: rampa linear de low a high a cada `period`, com queda abrupta no fim de cada dente"""
+    load_end = warmup + teeth * period
+
+    def rate(t: float) -> float:
+        if t < warmup or t >= load_end:
+            return low_rate
+        return low_rate + (high_rate - low_rate) * (((t - warmup) % period) / period)
+
+    return LoadProfile('sawtooth', rate, load_end + recovery, warmup,
+                       [warmup + period * (i + 1) for i in range(teeth)])
@@ -0,0 +1,194 @@
+"""
+SynQcore Load Metrics
+
+Funções de estatística e relatório compartilhadas pelos benchmarks de carga.
+Mantidas sem dependências de rede para que possam ser usadas tanto pelos
+clientes SignalR quanto pelos geradores de carga HTTP.
+"""
+
+import json
+import math
+from datetime import datetime
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from colorama import Fore, Style
+from tabulate import tabulate
+
+# Percentis reportados por padrão em todos os benchmarks
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentil com interpolação linear (mesmo critério do numpy.percentile)"""
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+
+    rank = (pct / 100) * (len(ordered) - 1)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(ordered[lower])
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_latencies(values: Iterable[float], percentiles=DEFAULT_PERCENTILES) -> Dict[str, float]:
+    """Resume uma lista de latências (ms) em contagem, média, percentis e máximo"""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+
+    summary = {
+        "count": len(ordered),
+        "min": round(ordered[0], 2),
+        "mean": round(sum(ordered) / len(ordered), 2),
+    }
+    for pct in percentiles:
+        summary[f"p{pct}"] = round(percentile(ordered, pct), 2)
+    summary["max"] = round(ordered[-1], 2)
+
+    return summary
+
+
+def print_section(title: str):
+    """Imprime um cabeçalho de seção no mesmo estilo dos relatórios de teste"""
+    print(f"\n{Fore.CYAN}{'='*60}")
+    print(f"{title}")
+    print(f"{'='*60}{Style.RESET_ALL}")
+
+
+def print_latency_table(title: str, rows: Dict[str, Dict[str, Any]], key_header: str = "Cenário"):
+    """Imprime uma tabela de latências; cada linha é um resumo de summarize_latencies"""
+    print_section(title)
+
+    if not rows:
+        print("Sem dados")
+        return
+
+    columns: List[str] = []
+    for summary in rows.values():
+        for column in summary:
+            if column not in columns:
+                columns.append(column)
+
+    table = [[name] + [summary.get(column, "-") for column in columns] for name, summary in rows.items()]
+    print(tabulate(table, headers=[key_header] + columns, tablefmt="github"))
+
+
+def save_benchmark_report(name: str, data: Dict[str, Any], filename: Optional[str] = None) -> str:
+    """Salva o relatório de um benchmark em JSON e retorna o nome do arquivo"""
+    if not filename:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{name}_report_{timestamp}.json"
+
+    report = {
+        "benchmark": name,
+        "timestamp": datetime.now().isoformat(),
+        **data
+    }
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+
+    print(f"{Fore.GREEN}✅ Relatório salvo em: {filename}{Style.RESET_ALL}")
+    return filename
+
+
+def linear_trend(points: List[Tuple[float, float]]) -> Dict[str, float]:
+    """
+    Reta de mínimos quadrados para pontos (x, y).
+
+    Retorna inclinação, intercepto e R²; usado para estimar a taxa de deriva
+    de latência/memória ao longo de um soak test.
+    """
+    n = len(points)
+    if n < 2:
+        return {}
+
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return {}
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+
+    ss_total = sum((y - mean_y) ** 2 for _, y in points)
+    ss_residual = sum((y - (intercept + slope * x)) ** 2 for x, y in points)
+    r_squared = 1 - ss_residual / ss_total if ss_total > 0 else 0.0
+
+    return {"slope": slope, "intercept": intercept, "r_squared": round(r_squared, 4)}
+
+
+def mann_kendall(values: List[float]) -> Dict[str, float]:
+    """
+    Teste de tendência de Mann-Kendall (não paramétrico, aproximação normal).
+
+    Não assume distribuição normal nem linearidade, o que o torna adequado para
+    séries de latência com caudas longas. Retorna S, Z e o p-valor bilateral.
+    """
+    n = len(values)
+    if n < 3:
+        return {}
+
+    s = 0
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            s += (values[j] > values[i]) - (values[j] < values[i])
+
+    # Correção de variância para valores empatados
+    ties: Dict[float, int] = {}
+    for value in values:
+        ties[value] = ties.get(value, 0) + 1
+    variance = (n * (n - 1) * (2 * n + 5) - sum(t * (t - 1) * (2 * t + 5) for t in ties.values())) / 18
+    if variance <= 0:
+        return {"s": s, "z": 0.0, "p_value": 1.0}
+
+    if s > 0:
+        z = (s - 1) / math.sqrt(variance)
+    elif s < 0:
+        z = (s + 1) / math.sqrt(variance)
+    else:
+        z = 0.0
+    p_value = math.erfc(abs(z) / math.sqrt(2))
+
+    return {"s": s, "z": round(z, 3), "p_value": p_value}
+
+
+def percentile_confidence_interval(values: List[float], pct: float,
+                                   confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Intervalo de confiança do percentil sem suposição de distribuição.
+
+    Usa estatísticas de ordem: o número de amostras abaixo do percentil verdadeiro
+    segue uma binomial(n, pct/100), aproximada pela normal.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    if n == 0:
+        return 0.0, 0.0
+
+    p = pct / 100
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    spread = z * math.sqrt(n * p * (1 - p))
+    lower = max(int(math.floor(n * p - spread)) - 1, 0)
+    upper = min(int(math.ceil(n * p + spread)), n - 1)
+    return float(ordered[lower]), float(ordered[upper])
+
+
+def wilson_interval(failures: int, total: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Intervalo de Wilson para uma proporção (ex: taxa de erro), em fração de 0 a 1"""
+    if total == 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = failures / total
+    denominator = 1 + z ** 2 / total
+    center = (rate + z ** 2 / (2 * total)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / total + z ** 2 / (4 * total ** 2)) / denominator
+    return max(center - margin, 0.0), min(center + margin, 1.0)
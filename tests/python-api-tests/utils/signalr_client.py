@@ -0,0 +1,258 @@
+"""
+SynQcore SignalR Client
+
+Cliente SignalR assíncrono e enxuto (protocolo JSON sobre WebSocket) usado
+pelos benchmarks de tempo real. Foi escrito para abrir milhares de conexões
+a partir de um único processo, por isso evita qualquer trabalho por mensagem
+além de registrar o instante de chegada e despachar para o handler.
+"""
+
+import json
+import time
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+import aiohttp
+
+# Separador de registros do protocolo SignalR
+RECORD_SEPARATOR = '\x1e'
+
+# Tipos de mensagem do protocolo de hub
+MESSAGE_INVOCATION = 1
+MESSAGE_COMPLETION = 3
+MESSAGE_PING = 6
+MESSAGE_CLOSE = 7
+
+# O servidor derruba clientes silenciosos após 30s (ClientTimeoutInterval padrão)
+KEEP_ALIVE_INTERVAL = 15
+
+# Handler recebe os argumentos da invocação e o instante de chegada (epoch em ms)
+HubHandler = Callable[[List[Any], float], None]
+
+
+class HubConnectionError(Exception):
+    """Falha ao negociar ou estabelecer a conexão com o hub"""
+
+
+def build_hub_url(base_url: str, hub_path: str) -> str:
+    """Monta a URL HTTP do hub a partir da URL base da API"""
+    return f"{base_url.rstrip('/')}/{hub_path.lstrip('/')}"
+
+
+def _to_websocket_url(http_url: str, query: Dict[str, str]) -> str:
+    """Converte uma URL http(s) do hub para ws(s) com os parâmetros informados"""
+    parts = urlsplit(http_url)
+    scheme = 'wss' if parts.scheme == 'https' else 'ws'
+    return urlunsplit((scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+class HubConnection:
+    """Conexão com um hub SignalR usando o protocolo JSON"""
+
+    def __init__(self, session: aiohttp.ClientSession, hub_url: str, token: Optional[str] = None,
+                 skip_negotiation: bool = False):
+        self.session = session
+        self.hub_url = hub_url
+        self.token = token
+        self.skip_negotiation = skip_negotiation
+        self.connection_id: Optional[str] = None
+        self.tag: Any = None  # Uso livre dos benchmarks (ex: equipe da conexão)
+        self.handlers: Dict[str, List[HubHandler]] = {}
+        self.received_counts: Dict[str, int] = {}
+        self.closed_error: Optional[str] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._ping_task: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._next_invocation_id = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._ws is not None and not self._ws.closed
+
+    def on(self, target: str, handler: HubHandler):
+        """Registra um handler para um método do cliente (ex: ReceiveTeamMessage)"""
+        self.handlers.setdefault(target, []).append(handler)
+
+    async def _negotiate(self) -> Dict[str, Any]:
+        """Executa o POST /negotiate e retorna a resposta do servidor"""
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else {}
+        async with self.session.post(f"{self.hub_url}/negotiate?negotiateVersion=1", headers=headers) as response:
+            if response.status != 200:
+                raise HubConnectionError(f"negotiate HTTP {response.status}: {(await response.text())[:200]}")
+            return await response.json()
+
+    async def start(self, timeout: float = 30) -> float:
+        """Abre a conexão, faz o handshake e retorna o tempo de setup em ms"""
+        start_time = time.perf_counter()
+        query = {}
+
+        if not self.skip_negotiation:
+            negotiation = await self._negotiate()
+            if 'error' in negotiation:
+                raise HubConnectionError(f"negotiate: {negotiation['error']}")
+            self.connection_id = negotiation.get('connectionId')
+            query['id'] = negotiation.get('connectionToken') or negotiation.get('connectionId')
+
+        if self.token:
+            query['access_token'] = self.token
+
+        try:
+            self._ws = await self.session.ws_connect(
+                _to_websocket_url(self.hub_url, query),
+                timeout=timeout,
+                autoping=True,
+                max_msg_size=0
+            )
+            await self._ws.send_str(json.dumps({'protocol': 'json', 'version': 1}) + RECORD_SEPARATOR)
+            handshake = await self._ws.receive(timeout=timeout)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise HubConnectionError(f"websocket: {e}") from e
+
+        if handshake.type != aiohttp.WSMsgType.TEXT:
+            raise HubConnectionError(f"handshake inesperado: {handshake.type}")
+
+        records = [r for r in handshake.data.split(RECORD_SEPARATOR) if r]
+        if not records or json.loads(records[0]).get('error'):
+            raise HubConnectionError(f"handshake recusado: {handshake.data[:200]}")
+
+        # O servidor pode enviar mensagens junto com a resposta do handshake
+        received_at = time.time() * 1000
+        for record in records[1:]:
+            self._dispatch(record, received_at)
+
+        self._reader_task = asyncio.create_task(self._read_loop())
+        self._ping_task = asyncio.create_task(self._ping_loop())
+
+        return round((time.perf_counter() - start_time) * 1000, 2)
+
+    async def _read_loop(self):
+        """Lê frames do WebSocket e despacha cada registro para os handlers"""
+        try:
+            async for message in self._ws:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    received_at = time.time() * 1000
+                    for record in message.data.split(RECORD_SEPARATOR):
+                        if record:
+                            self._dispatch(record, received_at)
+                elif message.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSE):
+                    break
+        except Exception as e:
+            self.closed_error = str(e)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(HubConnectionError(self.closed_error or 'conexão encerrada'))
+            self._pending.clear()
+
+    def _dispatch(self, record: str, received_at: float):
+        """Processa um registro do protocolo de hub"""
+        payload = json.loads(record)
+        message_type = payload.get('type')
+
+        if message_type == MESSAGE_INVOCATION:
+            target = payload.get('target', '')
+            self.received_counts[target] = self.received_counts.get(target, 0) + 1
+            for handler in self.handlers.get(target, ()):
+                handler(payload.get('arguments', []), received_at)
+
+        elif message_type == MESSAGE_COMPLETION:
+            future = self._pending.pop(payload.get('invocationId'), None)
+            if future and not future.done():
+                if payload.get('error'):
+                    future.set_exception(HubConnectionError(payload['error']))
+                else:
+                    future.set_result(payload.get('result'))
+
+        elif message_type == MESSAGE_CLOSE:
+            self.closed_error = payload.get('error') or 'fechado pelo servidor'
+
+    async def _ping_loop(self):
+        """Mantém a conexão viva enviando pings do protocolo SignalR"""
+        ping = json.dumps({'type': MESSAGE_PING}) + RECORD_SEPARATOR
+        try:
+            while self.is_open:
+                await asyncio.sleep(KEEP_ALIVE_INTERVAL)
+                await self._ws.send_str(ping)
+        except (asyncio.CancelledError, ConnectionResetError, aiohttp.ClientError):
+            pass
+
+    async def send(self, target: str, *args: Any):
+        """Invoca um método do hub sem aguardar resposta (fire-and-forget)"""
+        message = {'type': MESSAGE_INVOCATION, 'target': target, 'arguments': list(args)}
+        await self._ws.send_str(json.dumps(message) + RECORD_SEPARATOR)
+
+    async def invoke(self, target: str, *args: Any, timeout: float = 30) -> Any:
+        """Invoca um método do hub e aguarda a mensagem de conclusão"""
+        self._next_invocation_id += 1
+        invocation_id = str(self._next_invocation_id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[invocation_id] = future
+
+        message = {'type': MESSAGE_INVOCATION, 'invocationId': invocation_id,
+                   'target': target, 'arguments': list(args)}
+        await self._ws.send_str(json.dumps(message) + RECORD_SEPARATOR)
+        return await asyncio.wait_for(future, timeout)
+
+    async def stop(self):
+        """Fecha a conexão e cancela as tarefas de leitura/ping"""
+        if self._ping_task:
+            self._ping_task.cancel()
+        if self._ws is not None and not self._ws.closed:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+        if self._reader_task:
+            try:
+                await asyncio.wait_for(self._reader_task, 5)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._reader_task.cancel()
+
+
+def create_load_session(timeout: float = 60) -> aiohttp.ClientSession:
+    """Cria uma sessão aiohttp sem limite de conexões simultâneas"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=0, force_close=False),
+        timeout=aiohttp.ClientTimeout(total=timeout)
+    )
+
+
+async def open_hub_connections(session: aiohttp.ClientSession, hub_url: str, token: Optional[str],
+                               count: int, concurrency: int = 100, skip_negotiation: bool = False,
+                               configure: Optional[Callable[[int, HubConnection], None]] = None
+                               ) -> Tuple[List[HubConnection], List[float], List[str], float]:
+    """
+    Abre `count` conexões com no máximo `concurrency` handshakes simultâneos.
+
+    `configure` é chamado antes do start para registrar handlers, evitando perder
+    mensagens que chegam logo após o handshake. Retorna as conexões abertas, os
+    tempos de setup (ms), as falhas e a duração total (s).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    setup_times: List[float] = []
+    errors: List[str] = []
+    opened: List[Optional[HubConnection]] = [None] * count
+
+    async def open_one(index: int):
+        async with semaphore:
+            connection = HubConnection(session, hub_url, token, skip_negotiation)
+            if configure:
+                configure(index, connection)
+            try:
+                setup_times.append(await connection.start())
+                opened[index] = connection
+            except Exception as e:
+                errors.append(str(e) or type(e).__name__)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(open_one(i) for i in range(count)))
+    duration = time.perf_counter() - started
+
+    return [c for c in opened if c is not None], setup_times, errors, duration
+
+
+async def close_hub_connections(connections: List[HubConnection]):
+    """Fecha todas as conexões em paralelo"""
+    await asyncio.gather(*(c.stop() for c in connections), return_exceptions=True)